@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+
+import path_util        # noqa: F401
+from hummingbot import init_logging
+from hummingbot.client.backtest_application import BacktestApplication
+from hummingbot.client.config.config_helpers import (
+    create_yml_files,
+    read_system_configs_from_yml,
+    update_strategy_config_map_from_file,
+)
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import AllConnectorSettings, CONF_FILE_PATH
+from hummingbot.core.data_type.historical_market_data import default_market_data_path
+
+
+def parse_utc_timestamp(value: str) -> float:
+    """
+    Parses a UTC date (YYYY-MM-DD) or date and time (YYYY-MM-DDTHH:MM:SS) into a UNIX timestamp
+    """
+    for date_format in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, date_format).replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"Invalid date: {value}. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS (UTC).")
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Runs a strategy config over recorded market data.")
+        self.add_argument("--config-file-name", "-f",
+                          type=str,
+                          required=True,
+                          help="Specify a file in `conf/` to load as the strategy config file.")
+        self.add_argument("--start",
+                          type=parse_utc_timestamp,
+                          required=True,
+                          help="Start of the backtest (UTC), as YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS.")
+        self.add_argument("--end",
+                          type=parse_utc_timestamp,
+                          required=True,
+                          help="End of the backtest (UTC), as YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS.")
+        self.add_argument("--market-data-path",
+                          type=str,
+                          required=False,
+                          help="Directory holding the recorded market data (defaults to data/market_data).")
+        self.add_argument("--tick-size",
+                          type=float,
+                          default=1.0,
+                          help="Simulated seconds between clock ticks.")
+
+
+async def run_backtest(args: argparse.Namespace):
+    await create_yml_files()
+    init_logging("hummingbot_logs.yml")
+    await read_system_configs_from_yml()
+    AllConnectorSettings.initialize_paper_trade_settings(global_config_map.get("paper_trade_exchanges").value)
+
+    strategy_name = await update_strategy_config_map_from_file(os.path.join(CONF_FILE_PATH, args.config_file_name))
+    backtest = BacktestApplication(market_data_path=args.market_data_path or default_market_data_path(),
+                                   strategy_name=strategy_name,
+                                   strategy_file_name=args.config_file_name,
+                                   tick_size=args.tick_size)
+    report = await backtest.run(args.start, args.end)
+    print("\n".join(report.to_lines()))
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    if args.end <= args.start:
+        logging.getLogger().error("The end of the backtest must be after its start.")
+        return
+    asyncio.get_event_loop().run_until_complete(run_backtest(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+import os
+from typing import List, Tuple
+
+import path_util        # noqa: F401
+from hummingbot import data_path, init_logging
+from hummingbot.client.config.config_helpers import create_yml_files, read_system_configs_from_yml
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.data_type.market_data_service import MarketDataService
+
+
+def parse_market(value: str) -> Tuple[str, List[str]]:
+    """
+    Parses a connector and its trading pairs (connector:PAIR1,PAIR2)
+    """
+    connector_name, _, trading_pairs = value.partition(":")
+    if not connector_name or not trading_pairs:
+        raise argparse.ArgumentTypeError(f"Invalid market: {value}. Use connector:TRADING-PAIR,TRADING-PAIR.")
+    return connector_name, trading_pairs.split(",")
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Runs the market data service sharing the exchange order books between the bot "
+                                     "instances of the host.")
+        self.add_argument("--socket-path",
+                          type=str,
+                          default=os.path.join(data_path(), "market_data_service.sock"),
+                          help="Unix socket the bots connect to (set market_data_service_socket_path to it).")
+        self.add_argument("--publish-interval",
+                          type=float,
+                          default=0.05,
+                          help="Seconds between the publications of the order book diffs.")
+        self.add_argument("--market", "-m",
+                          type=parse_market,
+                          action="append",
+                          default=[],
+                          help="Order books tracked from the start, as connector:TRADING-PAIR,TRADING-PAIR. The "
+                               "order books requested by the bots are tracked as well.")
+
+
+async def run_market_data_service(args: argparse.Namespace):
+    await create_yml_files()
+    init_logging("hummingbot_logs.yml")
+    await read_system_configs_from_yml()
+    AllConnectorSettings.initialize_paper_trade_settings(global_config_map.get("paper_trade_exchanges").value)
+
+    service = MarketDataService(socket_path=args.socket_path, publish_interval=args.publish_interval)
+    for connector_name, trading_pairs in args.market:
+        service.track(connector_name, trading_pairs)
+    await service.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        service.stop()
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    try:
+        asyncio.get_event_loop().run_until_complete(run_market_data_service(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
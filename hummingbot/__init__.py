@@ -119,6 +119,8 @@ def init_logging(conf_filename: str,
     from ruamel.yaml import YAML
 
     from hummingbot.client.config.global_config_map import global_config_map
+    from hummingbot.logger import HummingbotLogger
+    from hummingbot.logger.log_queue import enable_log_queue
     from hummingbot.logger.struct_logger import (
         StructLogRecord,
         StructLogger
@@ -148,6 +150,12 @@ def init_logging(conf_filename: str,
                     config_dict["loggers"][logger]["level"] = override_log_level
         logging.config.dictConfig(config_dict)
 
+    log_formats = [formatter.get("format", "") for formatter in config_dict.get("formatters", {}).values()]
+    HummingbotLogger.set_caller_lookup_enabled(any(HummingbotLogger.format_uses_caller(log_format)
+                                                   for log_format in log_formats))
+    if global_config_map["log_queue_enabled"].value:
+        enable_log_queue()
+
 
 def get_strategy_list() -> List[str]:
     """
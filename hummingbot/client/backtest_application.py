@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.client.config.config_helpers import get_strategy_starter_file
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import STRATEGIES
+from hummingbot.connector.exchange.paper_trade import create_backtest_market
+from hummingbot.connector.exchange.paper_trade.market_data_replayer import MarketDataReplayer
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.historical_market_data import HistoricalMarketDataReader
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+
+class BacktestReport:
+    def __init__(self,
+                 start_timestamp: float,
+                 end_timestamp: float,
+                 ticks: int,
+                 wall_clock_seconds: float,
+                 filled_orders: int,
+                 replayed_order_book_records: int,
+                 replayed_trades: int,
+                 balances: Dict[str, Dict[str, Decimal]]):
+        self.start_timestamp: float = start_timestamp
+        self.end_timestamp: float = end_timestamp
+        self.ticks: int = ticks
+        self.wall_clock_seconds: float = wall_clock_seconds
+        self.filled_orders: int = filled_orders
+        self.replayed_order_book_records: int = replayed_order_book_records
+        self.replayed_trades: int = replayed_trades
+        self.balances: Dict[str, Dict[str, Decimal]] = balances
+
+    @property
+    def simulated_seconds(self) -> float:
+        return self.end_timestamp - self.start_timestamp
+
+    @property
+    def simulated_seconds_per_wall_clock_second(self) -> float:
+        if self.wall_clock_seconds <= 0:
+            return float("inf")
+        return self.simulated_seconds / self.wall_clock_seconds
+
+    def to_lines(self) -> List[str]:
+        lines = [
+            f"Simulated time: {self.simulated_seconds:.0f} s ({self.ticks} ticks)",
+            f"Wall clock time: {self.wall_clock_seconds:.3f} s",
+            f"Speed: {self.simulated_seconds_per_wall_clock_second:.1f} simulated seconds per wall clock second",
+            f"Replayed order book records: {self.replayed_order_book_records}",
+            f"Replayed trades: {self.replayed_trades}",
+            f"Filled orders: {self.filled_orders}",
+        ]
+        for market_name, balances in self.balances.items():
+            balances_text = ", ".join(f"{asset}: {amount}" for asset, amount in balances.items())
+            lines.append(f"Balances on {market_name}: {balances_text}")
+        return lines
+
+
+class BacktestApplication:
+    """
+    Runs a strategy over recorded market data using a clock in back testing mode.
+
+    It exposes the subset of the HummingbotApplication interface used by the strategies start functions, so any
+    strategy config can be run without changes. The markets are paper trade markets whose order books are replayed
+    from the recorded data, so order matching is the same as in paper trading.
+    """
+    _ba_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ba_logger is None:
+            cls._ba_logger = logging.getLogger(__name__)
+        return cls._ba_logger
+
+    def __init__(self,
+                 market_data_path: str,
+                 strategy_name: str,
+                 strategy_file_name: Optional[str] = None,
+                 tick_size: float = 1.0):
+        """
+        :param market_data_path: directory holding the recorded market data
+        :param strategy_name: name of the strategy to run (its config map must be already loaded)
+        :param strategy_file_name: name of the strategy config file
+        :param tick_size: simulated time in seconds between clock ticks
+        """
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.markets: Dict[str, ExchangeBase] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = {}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.market_pair = None
+        self.strategy: Optional[StrategyBase] = None
+        self.strategy_name: str = strategy_name
+        self.strategy_file_name: Optional[str] = strategy_file_name
+        self.clock: Optional[Clock] = None
+        self._market_data_path: str = market_data_path
+        self._tick_size: float = tick_size
+        self._replayer: MarketDataReplayer = MarketDataReplayer()
+        self._filled_orders: int = 0
+        self._order_filled_forwarder: EventForwarder = EventForwarder(self._did_fill_order)
+
+    @property
+    def replayer(self) -> MarketDataReplayer:
+        return self._replayer
+
+    def notify(self, msg: str):
+        self.logger().info(msg)
+
+    @staticmethod
+    def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
+        market_trading_pairs: List[Tuple[str, str]] = [(trading_pair.split('-')) for trading_pair in trading_pairs]
+        return market_trading_pairs
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            if market_name not in self.market_trading_pairs_map:
+                self.market_trading_pairs_map[market_name] = []
+            for hb_trading_pair in trading_pairs:
+                self.market_trading_pairs_map[market_name].append(hb_trading_pair)
+
+        paper_trade_account_balance = global_config_map.get("paper_trade_account_balance").value
+        for connector_name, trading_pairs in self.market_trading_pairs_map.items():
+            if connector_name in self.markets:
+                continue
+            exchange_name = connector_name
+            if exchange_name.endswith("_paper_trade"):
+                exchange_name = exchange_name[:-len("_paper_trade")]
+            market = create_backtest_market(exchange_name, list(dict.fromkeys(trading_pairs)))
+            if paper_trade_account_balance is not None:
+                for asset, balance in paper_trade_account_balance.items():
+                    market.set_balance(asset, balance)
+            market.add_listener(MarketEvent.OrderFilled, self._order_filled_forwarder)
+            self.markets[connector_name] = market
+
+    async def run(self, start_timestamp: float, end_timestamp: float) -> BacktestReport:
+        """
+        Starts the strategy and replays the recorded market data between the start and end timestamps.
+        """
+        if self.strategy_name not in STRATEGIES:
+            raise NotImplementedError(f"Strategy {self.strategy_name} is not available.")
+        start_strategy = get_strategy_starter_file(self.strategy_name)
+        start_strategy(self)
+        self._load_market_data(start_timestamp, end_timestamp)
+
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=self._tick_size,
+                           start_time=start_timestamp, end_time=end_timestamp)
+        # The replayer goes first so the markets and the strategy see the order books at the tick timestamp
+        self.clock.add_iterator(self._replayer)
+        for market in self.markets.values():
+            self.clock.add_iterator(market)
+        if self.strategy is not None:
+            self.clock.add_iterator(self.strategy)
+
+        ticks = 0
+        wall_clock_start = time.perf_counter()
+        with self.clock as clock:
+            timestamp = start_timestamp
+            while timestamp < end_timestamp:
+                timestamp = min(timestamp + self._tick_size, end_timestamp)
+                clock.backtest_til(timestamp)
+                ticks += 1
+                # Lets the event loop run the tasks scheduled during the tick (i.e. order events)
+                await asyncio.sleep(0)
+        wall_clock_seconds = time.perf_counter() - wall_clock_start
+
+        return BacktestReport(
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            ticks=ticks,
+            wall_clock_seconds=wall_clock_seconds,
+            filled_orders=self._filled_orders,
+            replayed_order_book_records=self._replayer.applied_order_book_records,
+            replayed_trades=self._replayer.applied_trades,
+            balances={name: market.get_all_balances() for name, market in self.markets.items()},
+        )
+
+    def _load_market_data(self, start_timestamp: float, end_timestamp: float):
+        for market in self.markets.values():
+            order_book_tracker = market.order_book_tracker
+            order_book_tracker.start()
+            reader = HistoricalMarketDataReader(self._market_data_path, market.name)
+            for trading_pair, order_book in order_book_tracker.order_books.items():
+                order_book_records = reader.load_order_book_records(trading_pair, start_timestamp, end_timestamp)
+                trade_records = reader.load_trade_records(trading_pair, start_timestamp, end_timestamp)
+                if len(order_book_records) == 0:
+                    self.logger().warning(f"No order book data recorded for {trading_pair} on {market.name} in the "
+                                          f"backtest time range.")
+                self._replayer.add_trading_pair(trading_pair, order_book, order_book_records, trade_records)
+
+    def _did_fill_order(self, _):
+        self._filled_orders += 1
@@ -4,6 +4,7 @@ from os.path import join
 from typing import (
     Any,
     List,
+    Optional,
     TYPE_CHECKING,
 )
 
@@ -27,7 +28,7 @@ from hummingbot.core.utils import map_df_to_str
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.inventory_cost import InventoryCost
 from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
-from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+from hummingbot.strategy.pure_market_making import InventoryCostPriceDelegate, PureMarketMakingStrategy
 from hummingbot.user.user_balances import UserBalances
 
 if TYPE_CHECKING:
@@ -285,6 +286,11 @@ class ConfigCommand:
                 self.notify("Inventory price not updated due to bad input")
                 return
 
+            inventory_cost_price_delegate = self._running_inventory_cost_price_delegate(market)
+            if inventory_cost_price_delegate is not None:
+                # The running strategy keeps the volumes in memory, they are replaced there and persisted by it
+                inventory_cost_price_delegate.set_volumes(balances[base_asset], quote_volume)
+                return
             with self.trade_fill_db.get_new_session() as session:
                 with session.begin():
                     InventoryCost.add_volume(
@@ -295,3 +301,12 @@ class ConfigCommand:
                         quote_volume=quote_volume,
                         overwrite=True,
                     )
+
+    def _running_inventory_cost_price_delegate(self,  # type: HummingbotApplication
+                                               trading_pair: str) -> Optional[InventoryCostPriceDelegate]:
+        if not isinstance(self.strategy, PureMarketMakingStrategy):
+            return None
+        delegate = self.strategy.inventory_cost_price_delegate
+        if delegate is None or f"{delegate.base_asset}-{delegate.quote_asset}" != trading_pair:
+            return None
+        return delegate
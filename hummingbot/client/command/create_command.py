@@ -12,7 +12,8 @@ from hummingbot.client.config.config_helpers import (
     save_to_yml,
     get_strategy_template_path,
     format_config_file_name,
-    parse_config_default_to_text
+    parse_config_default_to_text,
+    fetch_connectors_trading_pairs,
 )
 from hummingbot.client.settings import CONF_FILE_PATH, required_exchanges
 from hummingbot.client.config.global_config_map import global_config_map
@@ -126,6 +127,8 @@ class CreateCommand:
             await self.prompt_a_config(config)
         else:
             config.value = value
+            # The trading pairs of a connector are fetched before they are prompted and validated
+            await fetch_connectors_trading_pairs([value])
 
     async def prompt_new_file_name(self,  # type: HummingbotApplication
                                    strategy):
@@ -4,17 +4,19 @@ import time
 from datetime import datetime
 from decimal import Decimal
 from typing import (
+    Dict,
     List,
     Optional,
     Set,
     Tuple,
     TYPE_CHECKING,
+    Union,
 )
 
 import pandas as pd
 
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, TradesSummary
 from hummingbot.client.settings import (
     AllConnectorSettings,
     MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT,
@@ -50,6 +52,17 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if days <= 0 and self.trade_performance_tracker is not None:
+            # The trades of the session are already summarized by the tracker
+            if self.trade_performance_tracker.num_trades == 0:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            if self.strategy_name != "celo_arb":
+                safe_ensure_future(self.summaries_history_report(
+                    start_time, self.trade_performance_tracker.summaries, precision))
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -69,11 +82,28 @@ class HistoryCommand:
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
         market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        markets_trades = [(market, symbol, [t for t in trades if t.market == market and t.symbol == symbol])
+                          for market, symbol in market_info]
+        return await self._performance_report(start_time, markets_trades, precision, display_report)
+
+    async def summaries_history_report(self,  # type: HummingbotApplication
+                                       start_time: float,
+                                       summaries: Dict[Tuple[str, str], TradesSummary],
+                                       precision: Optional[int] = None,
+                                       display_report: bool = True) -> Decimal:
+        markets_trades = [(market, symbol, summary) for (market, symbol), summary in summaries.items()]
+        return await self._performance_report(start_time, markets_trades, precision, display_report)
+
+    async def _performance_report(
+            self,  # type: HummingbotApplication
+            start_time: float,
+            markets_trades: List[Tuple[str, str, Union[List[TradeFill], TradesSummary]]],
+            precision: Optional[int] = None,
+            display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for market, symbol, cur_trades in markets_trades:
             network_timeout = float(global_config_map["other_commands_timeout"].value)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -82,7 +112,10 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if isinstance(cur_trades, TradesSummary):
+                perf = await PerformanceMetrics.create_from_summary(cur_trades, cur_balances)
+            else:
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -202,6 +235,10 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        if self.trade_performance_tracker is not None:
+            return await self.summaries_history_report(
+                start_time, self.trade_performance_tracker.summaries, display_report=False)
+
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
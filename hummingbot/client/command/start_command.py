@@ -9,7 +9,8 @@ from typing import (
     Callable,
     Dict,
     List,
-    Any
+    Any,
+    Set,
 )
 from os.path import dirname, join
 from hummingbot.core.clock import (
@@ -158,10 +159,14 @@ class StartCommand:
         else:
             raise NotImplementedError
 
+        # In streaming mode the rate oracle only keeps the prices of the strategy tokens up to date
+        RateOracle.get_instance().set_required_tokens(self._rate_oracle_required_tokens())
+
         try:
             config_path: str = self.strategy_file_name
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            self.clock = Clock(ClockMode.REALTIME,
+                               reactive_tick_interval=global_config_map["reactive_tick_interval"].value)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -198,6 +203,14 @@ class StartCommand:
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _rate_oracle_required_tokens(self,  # type: HummingbotApplication
+                                     ) -> Set[str]:
+        trading_pairs = [trading_pair
+                         for market_trading_pairs in self.market_trading_pairs_map.values()
+                         for trading_pair in market_trading_pairs]
+        trading_pairs.extend(settings.rate_oracle_pairs)
+        return {token for trading_pair in trading_pairs for token in trading_pair.split("-")}
+
     async def confirm_oracle_conversion_rate(self,  # type: HummingbotApplication
                                              ) -> bool:
         try:
@@ -51,6 +51,13 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        if self.trade_performance_tracker is not None:
+            self.trade_performance_tracker.stop()
+
+        for market_data_recorder in self.market_data_recorders:
+            market_data_recorder.stop()
+        self.market_data_recorders.clear()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
@@ -59,4 +66,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.trade_performance_tracker = None
         self.market_trading_pairs_map.clear()
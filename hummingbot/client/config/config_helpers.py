@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from decimal import Decimal
 import ruamel.yaml
@@ -225,10 +226,35 @@ async def update_strategy_config_map_from_file(yml_path: str) -> str:
     strategy = strategy_name_from_file(yml_path)
     config_map = get_strategy_config_map(strategy)
     template_path = get_strategy_template_path(strategy)
+    # The trading pairs of the configured connectors are validated against their trading pairs
+    await fetch_connectors_trading_pairs(list((await load_yml_into_dict(yml_path)).values()))
     await load_yml_into_cm(yml_path, template_path, config_map)
     return strategy
 
 
+async def fetch_connectors_trading_pairs(values: List[Any], timeout: float = 10.0):
+    """
+    Fetches the trading pairs of the connectors among the config values, if they are not known yet, so they are
+    available to validate_market_trading_pair(). The fetches taking longer than the timeout continue in the background.
+    """
+    from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+    connector_settings = AllConnectorSettings.get_connector_settings()
+    trading_pair_fetcher: TradingPairFetcher = TradingPairFetcher.get_instance()
+    connector_names = {value for value in values
+                       if isinstance(value, str) and value in connector_settings
+                       and not trading_pair_fetcher.has_trading_pairs(value)}
+    if len(connector_names) == 0:
+        return
+    try:
+        await asyncio.wait_for(
+            asyncio.shield(asyncio.gather(*[trading_pair_fetcher.fetch(connector_name)
+                                            for connector_name in connector_names])),
+            timeout)
+    except asyncio.TimeoutError:
+        logging.getLogger().warning(f"The trading pairs of {', '.join(sorted(connector_names))} are still being "
+                                    f"fetched, the trading pairs can't be validated yet.")
+
+
 async def load_yml_into_dict(yml_path: str) -> Dict[str, Any]:
     data = {}
     if isfile(yml_path):
@@ -4,6 +4,7 @@ string and determines whether it is valid input. This file contains many validat
 hummingbot ConfigVars.
 """
 
+import logging
 import time
 
 from datetime import datetime
@@ -81,7 +82,14 @@ def validate_market_trading_pair(market: str, value: str) -> Optional[str]:
     from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
     trading_pair_fetcher: TradingPairFetcher = TradingPairFetcher.get_instance()
     if trading_pair_fetcher.ready:
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, [])
+        has_trading_pairs = trading_pair_fetcher.has_trading_pairs(market)
+        trading_pairs = trading_pair_fetcher.get_trading_pairs(market)
+        if not has_trading_pairs:
+            # The validation can't wait, the trading pairs are fetched before by fetch_connectors_trading_pairs()
+            # when possible
+            logging.getLogger(__name__).warning(f"The trading pairs of {market} are still being fetched, "
+                                                f"{value} has not been validated.")
+            return None
         if len(trading_pairs) == 0:
             return None
         elif value not in trading_pairs:
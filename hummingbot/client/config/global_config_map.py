@@ -47,6 +47,10 @@ def rate_oracle_source_on_validated(value: str):
     RateOracle.source = RateOracleSource[value]
 
 
+def rate_oracle_streaming_on_validated(value: bool):
+    RateOracle.streaming = value
+
+
 def validate_color(value: str) -> Optional[str]:
     if not re.search(r'^#(?:[0-9a-fA-F]{2}){3}$', value):
         return "Invalid color code"
@@ -85,6 +89,12 @@ main_config_map = {
                   type_str="float",
                   required_if=lambda: False,
                   default=900),
+    "reactive_tick_interval":
+        ConfigVar(key="reactive_tick_interval",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  default=None),
     "logger_override_whitelist":
         ConfigVar(key="logger_override_whitelist",
                   prompt=None,
@@ -93,6 +103,12 @@ main_config_map = {
                            "conf"
                            ],
                   type_str="list"),
+    "log_queue_enabled":
+        ConfigVar(key="log_queue_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
     "key_file_path":
         ConfigVar(key="key_file_path",
                   prompt=f"Where would you like to save your private key file? "
@@ -104,6 +120,18 @@ main_config_map = {
                   prompt=f"Where would you like to save your logs? (default '{DEFAULT_LOG_FILE_PATH}') >>> ",
                   required_if=lambda: False,
                   default=DEFAULT_LOG_FILE_PATH),
+    "market_data_recording_enabled":
+        ConfigVar(key="market_data_recording_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
+    "market_data_service_socket_path":
+        ConfigVar(key="market_data_service_socket_path",
+                  prompt=None,
+                  type_str="str",
+                  required_if=lambda: False,
+                  default=None),
 
     # Required by chosen CEXes or DEXes
     "celo_address":
@@ -264,6 +292,13 @@ main_config_map = {
                   validator=validate_rate_oracle_source,
                   on_validated=rate_oracle_source_on_validated,
                   default=RateOracleSource.binance.name),
+    "rate_oracle_streaming":
+        ConfigVar(key="rate_oracle_streaming",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  on_validated=rate_oracle_streaming_on_validated,
+                  default=False),
     "global_token":
         ConfigVar(key="global_token",
                   prompt="What is your default display token? (e.g. USD,EUR,BTC)  >>> ",
@@ -14,7 +14,7 @@ from hummingbot.core.utils.wallet_setup import (
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import SECURITY_LANE, AsyncCallScheduler
 import asyncio
 from os import unlink
 
@@ -64,7 +64,7 @@ class Security:
                     return False
                 raise err
         Security.password = password
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
+        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30, lane=SECURITY_LANE)
         safe_ensure_future(coro)
         return True
 
@@ -0,0 +1,319 @@
+"""
+Manifest of the static settings of the connectors (the settings defined in their *_utils modules), so the client can
+list the connectors and their config keys without importing every connector module and its dependencies at startup.
+
+The manifest is a JSON file generated from the utils modules, and rebuilt when one of them changes. The utils module of
+a connector is only imported when the connector is used: by its connector class, or when a config key of the
+connector calls a function that is not a plain value (a validator or a prompt function for instance).
+
+Run this module to rebuild the manifest, e.g. when building a release or a docker image.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+from decimal import Decimal
+from os import scandir, DirEntry
+from os.path import join, exists
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from hummingbot import root_path
+from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+MANIFEST_VERSION = 2
+MANIFEST_FILE_NAME = "connector_manifest.json"
+CONNECTOR_EXCEPTIONS = ["paper_trade"]
+
+_USING_EXCHANGE_QUALNAME = f"{using_exchange.__qualname__}.<locals>.<lambda>"
+_CONFIG_VAR_DEFAULTS: Dict[str, Any] = {
+    name: parameter.default for name, parameter in inspect.signature(ConfigVar.__init__).parameters.items()
+}
+
+
+def manifest_path() -> str:
+    return join(root_path(), "hummingbot", "connector", MANIFEST_FILE_NAME)
+
+
+def _utils_modules() -> List[Dict[str, str]]:
+    """
+    Lists the connector directories (in the order the connectors are registered) with the path of their utils module
+    """
+    modules: List[Dict[str, str]] = []
+    type_dirs: List[DirEntry] = [
+        cast(DirEntry, f) for f in scandir(f"{root_path()}/hummingbot/connector")
+        if f.is_dir()
+    ]
+    for type_dir in type_dirs:
+        connector_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(type_dir.path)
+            if f.is_dir() and exists(join(f.path, "__init__.py"))
+        ]
+        for connector_dir in connector_dirs:
+            if connector_dir.name.startswith("_") or connector_dir.name in CONNECTOR_EXCEPTIONS:
+                continue
+            modules.append({
+                "type": type_dir.name,
+                "name": connector_dir.name,
+                "file_path": join(connector_dir.path, f"{connector_dir.name}_utils.py"),
+                "module_path": f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils",
+            })
+    return modules
+
+
+def connector_sources_fingerprint() -> Dict[str, int]:
+    """
+    The modification times (in ns) of the connector utils modules by module, 0 for the connectors without one
+    """
+    fingerprint: Dict[str, int] = {}
+    for module in _utils_modules():
+        fingerprint[module["module_path"]] = os.stat(module["file_path"]).st_mtime_ns if exists(
+            module["file_path"]) else 0
+    return fingerprint
+
+
+def _trade_fee_schema_entry(trade_fee_schema: Any) -> Any:
+    if not isinstance(trade_fee_schema, TradeFeeSchema):
+        # Percentages, see AllConnectorSettings._validate_trade_fee_schema()
+        return None if trade_fee_schema is None else [str(fee) for fee in trade_fee_schema]
+    return {
+        "percent_fee_token": trade_fee_schema.percent_fee_token,
+        "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+        "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+        "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+        "maker_fixed_fees": [[token, str(amount)] for token, amount in trade_fee_schema.maker_fixed_fees],
+        "taker_fixed_fees": [[token, str(amount)] for token, amount in trade_fee_schema.taker_fixed_fees],
+    }
+
+
+def trade_fee_schema_from_entry(entry: Any) -> Any:
+    """
+    Returns the trade fee settings of a connector as defined in its utils module, a TradeFeeSchema or percentages
+    """
+    if entry is None or isinstance(entry, list):
+        return None if entry is None else [Decimal(fee) for fee in entry]
+    return TradeFeeSchema(
+        percent_fee_token=entry["percent_fee_token"],
+        maker_percent_fee_decimal=Decimal(entry["maker_percent_fee_decimal"]),
+        taker_percent_fee_decimal=Decimal(entry["taker_percent_fee_decimal"]),
+        buy_percent_fee_deducted_from_returns=entry["buy_percent_fee_deducted_from_returns"],
+        maker_fixed_fees=[TokenAmount(token, Decimal(amount)) for token, amount in entry["maker_fixed_fees"]],
+        taker_fixed_fees=[TokenAmount(token, Decimal(amount)) for token, amount in entry["taker_fixed_fees"]],
+    )
+
+
+def _function_entry(function: Any, default: Any) -> Optional[Dict[str, Any]]:
+    """
+    Describes a function of a config var: None for the ConfigVar default, the exchange of a using_exchange()
+    function, or a function to call from the utils module.
+    """
+    if function is default:
+        return None
+    if getattr(function, "__qualname__", None) == _USING_EXCHANGE_QUALNAME:
+        exchange = function.__closure__[function.__code__.co_freevars.index("exchange")].cell_contents
+        return {"using_exchange": exchange}
+    return {"module": True, "coroutine": inspect.iscoroutinefunction(function)}
+
+
+def _config_var_entry(config_var: ConfigVar) -> Optional[Dict[str, Any]]:
+    """
+    Describes a config var, or returns None if it can't be described without its module
+    """
+    for value in (config_var.default, config_var.printable_key):
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            return None
+    entry: Dict[str, Any] = {
+        "key": config_var.key,
+        "is_secure": config_var.is_secure,
+        "default": config_var.default,
+        "type_str": config_var.type,
+        "prompt_on_new": config_var.prompt_on_new,
+        "is_connect_key": config_var.is_connect_key,
+        "printable_key": config_var.printable_key,
+        "required_if": _function_entry(config_var._required_if, _CONFIG_VAR_DEFAULTS["required_if"]),
+        "validator": _function_entry(config_var._validator, _CONFIG_VAR_DEFAULTS["validator"]),
+        "on_validated": _function_entry(config_var._on_validated, _CONFIG_VAR_DEFAULTS["on_validated"]),
+    }
+    if config_var.prompt is None or isinstance(config_var.prompt, str):
+        entry["prompt"] = config_var.prompt
+    else:
+        entry["prompt"] = _function_entry(config_var.prompt, None)
+    return entry
+
+
+def _config_keys_entry(config_keys: Dict[str, ConfigVar]) -> Optional[Dict[str, Dict[str, Any]]]:
+    entries: Dict[str, Dict[str, Any]] = {}
+    for key, config_var in config_keys.items():
+        entry: Optional[Dict[str, Any]] = _config_var_entry(config_var)
+        if entry is None:
+            return None
+        entries[key] = entry
+    return entries
+
+
+def _module_config_keys(module_path: str, domain: Optional[str]) -> Dict[str, ConfigVar]:
+    util_module = importlib.import_module(module_path)
+    if domain is None:
+        return getattr(util_module, "KEYS", {})
+    return getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]
+
+
+def _module_function(module_path: str, domain: Optional[str], key: str, attribute: str, coroutine: bool) -> Callable:
+    """
+    Returns a function calling a function of a config var of a utils module, the module is imported on the first call
+    """
+    def module_function():
+        return getattr(_module_config_keys(module_path, domain)[key], attribute)
+
+    if coroutine:
+        async def call_module_coroutine(*args, **kwargs):
+            return await module_function()(*args, **kwargs)
+        return call_module_coroutine
+
+    def call_module_function(*args, **kwargs):
+        return module_function()(*args, **kwargs)
+    return call_module_function
+
+
+def _function_from_entry(entry: Optional[Dict[str, Any]],
+                         default: Any,
+                         module_path: str,
+                         domain: Optional[str],
+                         key: str,
+                         attribute: str) -> Any:
+    if entry is None:
+        return default
+    if "using_exchange" in entry:
+        return using_exchange(entry["using_exchange"])
+    return _module_function(module_path, domain, key, attribute, entry["coroutine"])
+
+
+def config_keys_from_entry(config_keys_entry: Optional[Dict[str, Dict[str, Any]]],
+                           module_path: str,
+                           domain: Optional[str] = None) -> Dict[str, ConfigVar]:
+    """
+    Returns the config keys of a connector (or of one of its other domains), importing its utils module only if they
+    couldn't be described in the manifest
+    """
+    if config_keys_entry is None:
+        return _module_config_keys(module_path, domain)
+    config_keys: Dict[str, ConfigVar] = {}
+    for key, entry in config_keys_entry.items():
+        prompt = entry["prompt"]
+        if isinstance(prompt, dict):
+            prompt = _function_from_entry(prompt, None, module_path, domain, key, "prompt")
+        config_keys[key] = ConfigVar(
+            key=entry["key"],
+            prompt=prompt,
+            is_secure=entry["is_secure"],
+            default=entry["default"],
+            type_str=entry["type_str"],
+            required_if=_function_from_entry(
+                entry["required_if"], _CONFIG_VAR_DEFAULTS["required_if"], module_path, domain, key, "_required_if"),
+            validator=_function_from_entry(
+                entry["validator"], _CONFIG_VAR_DEFAULTS["validator"], module_path, domain, key, "_validator"),
+            on_validated=_function_from_entry(
+                entry["on_validated"], _CONFIG_VAR_DEFAULTS["on_validated"], module_path, domain, key, "_on_validated"),
+            prompt_on_new=entry["prompt_on_new"],
+            is_connect_key=entry["is_connect_key"],
+            printable_key=entry["printable_key"],
+        )
+    return config_keys
+
+
+def build_connector_manifest() -> Dict[str, Any]:
+    """
+    Builds the manifest from the connector utils modules, all of them are imported. The utils modules that can't be
+    imported because of a missing module are skipped, and listed with the missing module.
+    """
+    fingerprint: Dict[str, int] = {}
+    skipped_modules: Dict[str, Optional[str]] = {}
+    connectors: List[Dict[str, Any]] = []
+    for module in _utils_modules():
+        fingerprint[module["module_path"]] = os.stat(module["file_path"]).st_mtime_ns if exists(
+            module["file_path"]) else 0
+        try:
+            util_module = importlib.import_module(module["module_path"])
+        except ModuleNotFoundError as e:
+            skipped_modules[module["module_path"]] = e.name
+            continue
+        other_domains: List[Dict[str, Any]] = [
+            {
+                "name": domain,
+                "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                "trade_fee_schema": _trade_fee_schema_entry(getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]),
+                "config_keys": _config_keys_entry(getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]),
+                "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+            }
+            for domain in getattr(util_module, "OTHER_DOMAINS", [])
+        ]
+        connectors.append({
+            "name": module["name"],
+            "type": module["type"],
+            "module_path": module["module_path"],
+            "centralised": getattr(util_module, "CENTRALIZED", True),
+            "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+            "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            "trade_fee_schema": _trade_fee_schema_entry(getattr(util_module, "DEFAULT_FEES", None)),
+            "config_keys": _config_keys_entry(getattr(util_module, "KEYS", {})),
+            "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            "other_domains": other_domains,
+        })
+    return {"version": MANIFEST_VERSION, "fingerprint": fingerprint, "skipped_modules": skipped_modules,
+            "connectors": connectors}
+
+
+def _module_exists(module_name: Optional[str]) -> bool:
+    if module_name is None:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def skipped_modules_importable(manifest: Dict[str, Any]) -> bool:
+    """
+    Returns True if the missing module of one of the utils modules skipped by the manifest is now installed (or can't
+    be known), the manifest has to be rebuilt to list the connector.
+    """
+    return any(_module_exists(missing_module) for missing_module in manifest.get("skipped_modules", {}).values())
+
+
+def save_connector_manifest(manifest: Dict[str, Any], path: Optional[str] = None):
+    path = path or manifest_path()
+    temporary_path: str = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=1)
+    os.replace(temporary_path, path)
+
+
+def load_connector_manifest(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Loads the manifest, it is rebuilt (and saved if possible) when it is missing or outdated.
+    """
+    path = path or manifest_path()
+    if exists(path):
+        try:
+            with open(path) as manifest_file:
+                manifest: Dict[str, Any] = json.load(manifest_file)
+            if manifest.get("version") == MANIFEST_VERSION and \
+                    manifest.get("fingerprint") == connector_sources_fingerprint() and \
+                    not skipped_modules_importable(manifest):
+                return manifest
+        except Exception:
+            logging.getLogger(__name__).warning(f"Could not read the connector manifest {path}.", exc_info=True)
+    manifest = build_connector_manifest()
+    try:
+        save_connector_manifest(manifest, path)
+    except OSError:
+        logging.getLogger(__name__).warning(f"Could not save the connector manifest {path}.", exc_info=True)
+    return manifest
+
+
+if __name__ == "__main__":
+    save_connector_manifest(build_connector_manifest())
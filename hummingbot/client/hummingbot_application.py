@@ -33,7 +33,11 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.historical_market_data import default_market_data_path
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.market_data_service_order_book_data_source import MarketDataServiceOrderBookDataSource
 from hummingbot.client.config.security import Security
+from hummingbot.client.performance import TradePerformanceTracker
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import AllConnectorSettings, ConnectorType
 from hummingbot.client.tab.data_types import CommandTab
@@ -90,6 +94,8 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.trade_performance_tracker: Optional[TradePerformanceTracker] = None
+        self.market_data_recorders: List[MarketDataRecorder] = []
         self._script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -278,13 +284,64 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        market_data_service_socket_path = global_config_map.get("market_data_service_socket_path").value
+        if market_data_service_socket_path is not None:
+            self._use_market_data_service(market_data_service_socket_path)
+
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            write_behind=True,
         )
         self.markets_recorder.start()
+        self._initialize_trade_performance_tracker()
+        if global_config_map.get("market_data_recording_enabled").value:
+            self._initialize_market_data_recorders()
+
+    def _initialize_trade_performance_tracker(self):
+        # The trades of the session already in the database are loaded once, later fills come from the markets
+        self.trade_performance_tracker = TradePerformanceTracker(list(self.markets.values()))
+        with self.trade_fill_db.get_new_session() as session:
+            self.trade_performance_tracker.add_trade_fills(self._get_trades_from_session(
+                int(self.init_time * 1e3),
+                session=session,
+                config_file_path=self.strategy_file_name))
+        self.trade_performance_tracker.start()
+
+    def _use_market_data_service(self, socket_path: str):
+        for connector_name, connector in self.markets.items():
+            order_book_tracker = getattr(connector, "order_book_tracker", None)
+            if order_book_tracker is None:
+                continue
+            if not order_book_tracker.handles_generic_order_book_messages:
+                # The tracker of the connector needs the messages of its exchange
+                self.logger().info(f"The order books of {connector_name} can't be received from the market data "
+                                   f"service, they are received from the exchange.")
+                continue
+            order_book_tracker.set_data_source(MarketDataServiceOrderBookDataSource(
+                trading_pairs=self.market_trading_pairs_map[connector_name],
+                connector_name=connector_name,
+                socket_path=socket_path,
+                exchange_data_source=order_book_tracker.data_source))
+            self.logger().info(f"Using the order books of {connector_name} from the market data service.")
+
+    def _initialize_market_data_recorders(self):
+        for connector_name, connector in self.markets.items():
+            order_book_tracker = getattr(connector, "order_book_tracker", None)
+            if order_book_tracker is None or order_book_tracker.market_data_recorder is not None:
+                continue
+            if not order_book_tracker.handles_generic_order_book_messages:
+                # The tracker messages may have the format of the exchange and not go through the order book buffers
+                self.logger().warning(f"The market data of {connector_name} can't be recorded, its order book "
+                                      f"tracker needs the messages of its exchange.")
+                continue
+            recorder = MarketDataRecorder(default_market_data_path(), connector.name)
+            order_book_tracker.set_market_data_recorder(recorder)
+            recorder.start()
+            self.market_data_recorders.append(recorder)
+            self.logger().info(f"Recording the market data of {connector_name}.")
 
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
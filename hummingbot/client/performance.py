@@ -1,6 +1,8 @@
+import asyncio
 import logging
+import threading
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from decimal import Decimal
 from typing import (
     Any,
@@ -10,9 +12,12 @@ from typing import (
     Tuple,
 )
 
+from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import TradeType, PositionAction
 from hummingbot.core.data_type.trade_fee import TokenAmount
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -77,6 +82,17 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_summary(cls,
+                                  summary: 'TradesSummary',
+                                  current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Calculates the same metrics as create, from the running totals of the trades instead of the trades
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_summary(summary, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -200,6 +216,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -210,8 +231,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
@@ -236,6 +255,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fees_in_quote(quote)
+
+    async def _calculate_fees_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -253,22 +275,25 @@ class PerformanceMetrics:
 
         # Handle trade_pnl differently for derivatives
         if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
+            self.trade_pnl = self._positions_pnl(buys.copy(), sells.copy())
 
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
+    def _positions_pnl(self, buys: list, sells: list) -> Decimal:
+        buys, sells = self.aggregate_position_order(buys, sells)
+        long = []
+        short = []
 
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
+        while True:
+            lng = self.position_order(buys, sells)
+            if lng is not None:
+                long.append(lng)
 
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+            sht = self.position_order(sells, buys)
+            if sht is not None:
+                short.append(sht)
+            if lng is None and sht is None:
+                break
+
+        return Decimal(str(sum(self.derivative_pnl(long, short))))
 
     async def _initialize_metrics(self,
                                   trading_pair: str,
@@ -288,15 +313,60 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  Decimal(str(trades[0].price)),
+                                                  Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_summary(self, summary: 'TradesSummary', current_balances: Dict[str, Decimal]):
+        base, quote = split_hb_trading_pair(summary.trading_pair)
+
+        self.num_buys = summary.num_buys
+        self.num_sells = summary.num_sells
+        self.num_trades = summary.num_trades
+        self.b_vol_base = summary.b_vol_base
+        self.b_vol_quote = summary.b_vol_quote
+        self.s_vol_base = summary.s_vol_base
+        self.s_vol_quote = summary.s_vol_quote
+        self._calculate_volume_totals()
+
+        await self._calculate_balances_and_values(summary.trading_pair,
+                                                  current_balances,
+                                                  summary.start_price,
+                                                  summary.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+        if summary.are_derivatives:
+            # The fills are copied because aggregating the position orders modifies them
+            self.trade_pnl = self._positions_pnl([replace(fill) for fill in summary.position_buys],
+                                                 [replace(fill) for fill in summary.position_sells])
+
+        self.fees.update(summary.fees)
+        await self._calculate_fees_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             start_price: Decimal,
+                                             last_trade_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, 0)
         self.cur_quote_bal = current_balances.get(quote, 0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -304,9 +374,190 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(quote, trades)
 
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+@dataclass
+class PositionFill:
+    """
+    The fields of a derivative fill used to pair the opened and closed positions
+    """
+    order_id: str
+    position: str
+    price: Decimal
+    amount: Decimal
+
+
+class TradesSummary:
+    """
+    Running totals of the trades of one market and trading pair, updated in constant time for each fill.
+    PerformanceMetrics.create_from_summary calculates from it the same metrics PerformanceMetrics.create calculates
+    from the list of trades.
+
+    Derivative fills are kept while every fill of a side has a position, because pairing the opened and closed
+    positions needs them. Only the fills opening or closing a position are kept (the others are never paired), and the
+    fills of an order are merged as PerformanceMetrics.aggregate_orders does, so the kept fills grow with the number
+    of position orders, not with the number of fills.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair: str = trading_pair
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        # fees is a dictionary of token and total fee amount paid in that token.
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.position_buys: List[PositionFill] = []
+        self.position_sells: List[PositionFill] = []
+        # The merged fill of each order, the sum of its fill prices and its number of fills, by side and order id
+        self._position_orders: Dict[Tuple[bool, str], Tuple[PositionFill, Decimal, int]] = {}
+        self._buys_with_position: bool = True
+        self._sells_with_position: bool = True
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return ((self.num_buys > 0 and self._buys_with_position)
+                or (self.num_sells > 0 and self._sells_with_position))
+
+    def add_trade_fill(self, trade: TradeFill):
+        self.add_fill(trade_type=trade.trade_type,
+                      price=Decimal(str(trade.price)),
+                      amount=Decimal(str(trade.amount)),
+                      fee_percent=Decimal(str(trade.trade_fee.get("percent") or s_decimal_0)),
+                      flat_fees=[TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
+                                 for flat_fee in trade.trade_fee.get("flat_fees", [])],
+                      position=trade.position,
+                      order_id=trade.order_id)
+
+    def add_order_filled_event(self, event: OrderFilledEvent):
+        self.add_fill(trade_type=event.trade_type.name,
+                      price=Decimal(str(event.price)) if event.price == event.price else s_decimal_0,
+                      amount=Decimal(str(event.amount)),
+                      fee_percent=event.trade_fee.percent or s_decimal_0,
+                      flat_fees=event.trade_fee.flat_fees,
+                      position=event.position,
+                      order_id=event.order_id)
+
+    def add_fill(self,
+                 trade_type: str,
+                 price: Decimal,
+                 amount: Decimal,
+                 fee_percent: Decimal,
+                 flat_fees: List[TokenAmount],
+                 position: str,
+                 order_id: str):
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+
+        if fee_percent > 0:
+            self.fees[split_hb_trading_pair(self.trading_pair)[1]] += price * amount * fee_percent
+        for flat_fee in flat_fees:
+            self.fees[flat_fee.token] += flat_fee.amount
+
+        is_buy = trade_type.upper() == TradeType.BUY.name
+        if is_buy:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+        elif trade_type.upper() == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+        else:
+            return
+
+        self._add_position_fill(is_buy, PositionFill(order_id, position, price, amount))
+
+    def _add_position_fill(self, is_buy: bool, fill: PositionFill):
+        if fill.position == PositionAction.NIL.value:
+            if is_buy:
+                self._buys_with_position = False
+            else:
+                self._sells_with_position = False
+        elif self._buys_with_position or self._sells_with_position:
+            order_key: Tuple[bool, str] = (is_buy, fill.order_id)
+            position_order: Optional[Tuple[PositionFill, Decimal, int]] = self._position_orders.get(order_key)
+            if position_order is None:
+                (self.position_buys if is_buy else self.position_sells).append(fill)
+                self._position_orders[order_key] = (fill, fill.price, 1)
+            else:
+                # Same aggregation as PerformanceMetrics.aggregate_orders: mean fill price and total amount
+                merged_fill, price_sum, fills_count = position_order
+                price_sum += fill.price
+                fills_count += 1
+                merged_fill.price = price_sum / fills_count
+                merged_fill.amount += fill.amount
+                self._position_orders[order_key] = (merged_fill, price_sum, fills_count)
+        if not (self._buys_with_position or self._sells_with_position):
+            self.position_buys.clear()
+            self.position_sells.clear()
+            self._position_orders.clear()
+
+
+class TradePerformanceTracker:
+    """
+    Keeps the TradesSummary of each market and trading pair of the running strategy up to date with the fills
+    reported by the markets, so the performance can be calculated without querying and processing all the trades
+    in the database again. The summaries are initialized from the database once, when the strategy starts.
+    """
+    _tpt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tpt_logger is None:
+            cls._tpt_logger = logging.getLogger(__name__)
+        return cls._tpt_logger
+
+    def __init__(self, markets: List[ConnectorBase]):
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._markets: List[ConnectorBase] = markets
+        self._summaries: Dict[Tuple[str, str], TradesSummary] = {}
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def summaries(self) -> Dict[Tuple[str, str], TradesSummary]:
+        """
+        The trades summaries by market and trading pair
+        """
+        return self._summaries
+
+    @property
+    def num_trades(self) -> int:
+        return sum(summary.num_trades for summary in self._summaries.values())
+
+    def start(self):
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def add_trade_fills(self, trades: List[TradeFill]):
+        for trade in trades:
+            self._summary(trade.market, trade.symbol).add_trade_fill(trade)
+
+    def _summary(self, market: str, trading_pair: str) -> TradesSummary:
+        summary = self._summaries.get((market, trading_pair))
+        if summary is None:
+            summary = TradesSummary(trading_pair)
+            self._summaries[(market, trading_pair)] = summary
+        return summary
+
+    def _did_fill_order(self, event_tag: int, market: ConnectorBase, evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+        try:
+            self._summary(market.display_name, evt.trading_pair).add_order_filled_event(evt)
+        except Exception:
+            self.logger().error(f"Error adding the fill {evt} to the trades performance.", exc_info=True)
@@ -3,16 +3,20 @@ Define ConnectorSetting class (contains metadata about the exchanges hummingbot
 generate a dictionary of exchange names to ConnectorSettings.
 """
 
-import importlib
 import json
 from decimal import Decimal
 from enum import Enum
-from os import scandir, DirEntry
 from os.path import join, realpath, exists
-from typing import Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Union
 
-from hummingbot import get_strategy_list, root_path
+from hummingbot import get_strategy_list
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.connector_manifest import (
+    build_connector_manifest,
+    config_keys_from_entry,
+    load_connector_manifest,
+    trade_fee_schema_from_entry,
+)
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 # Global variables
@@ -189,69 +193,56 @@ class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Create a dictionary of exchange names to ConnectorSetting from the connector manifest, which holds the settings
+        defined in the utils modules of the connectors, so they are not imported at startup.
+
+        :param use_manifest: if False, the settings are read from the utils modules instead of the manifest file
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["paper_trade"]
+        manifest: Dict[str, Any] = load_connector_manifest() if use_manifest else build_connector_manifest()
 
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path()}/hummingbot/connector")
-            if f.is_dir()
-        ]
-        for type_dir in type_dirs:
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
+        for connector in manifest["connectors"]:
+            if connector["name"] in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector['name']} name.")
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector["name"], trade_fee_schema_from_entry(connector["trade_fee_schema"])
+            )
+            cls.all_connector_settings[connector["name"]] = ConnectorSetting(
+                name=connector["name"],
+                type=ConnectorType[connector["type"].capitalize()],
+                centralised=connector["centralised"],
+                example_pair=connector["example_pair"],
+                use_ethereum_wallet=connector["use_ethereum_wallet"],
+                trade_fee_schema=trade_fee_schema,
+                config_keys=config_keys_from_entry(connector["config_keys"], connector["module_path"]),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=connector["use_eth_gas_lookup"],
+            )
+            # Adds other domains of connector
+            for domain in connector["other_domains"]:
+                trade_fee_schema = cls._validate_trade_fee_schema(
+                    domain["name"], trade_fee_schema_from_entry(domain["trade_fee_schema"])
                 )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                parent = cls.all_connector_settings[connector["name"]]
+                cls.all_connector_settings[domain["name"]] = ConnectorSetting(
+                    name=domain["name"],
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=domain["example_pair"],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
                     trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", {}),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+                    config_keys=config_keys_from_entry(
+                        domain["config_keys"], connector["module_path"], domain["name"]
+                    ),
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=domain["domain_parameter"],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
                 )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -132,6 +132,10 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self) -> BinancePerpetualOrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def ready(self):
         return all(self.status_dict.values())
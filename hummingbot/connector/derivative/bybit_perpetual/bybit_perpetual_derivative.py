@@ -164,6 +164,10 @@ class BybitPerpetualDerivative(ExchangeBase, PerpetualTrading):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self) -> BybitPerpetualOrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [
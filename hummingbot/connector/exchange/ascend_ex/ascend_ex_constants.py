@@ -19,6 +19,9 @@ TRADES_PATH_URL = "trades"
 DEPTH_PATH_URL = "depth"
 INFO_PATH_URL = "info"
 
+# Maximum number of orders placed or cancelled with a single batch order request
+MAX_ORDERS_PER_BATCH_REQUEST = 10
+
 # WS API ENDPOINTS
 SUB_ENDPOINT_NAME = "sub"
 PONG_ENDPOINT_NAME = "pong"
@@ -148,6 +148,10 @@ class AscendExExchange(ExchangePyBase):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self) -> AscendExOrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def trading_rules(self) -> Dict[str, AscendExTradingRule]:
         return self._trading_rules
@@ -495,6 +499,165 @@ class AscendExExchange(ExchangePyBase):
         safe_ensure_future(self._execute_cancel(trading_pair, order_id))
         return order_id
 
+    def batch_order_create(self,
+                           orders_to_create: List[LimitOrder],
+                           order_type: OrderType = OrderType.LIMIT,
+                           **kwargs) -> List[LimitOrder]:
+        """
+        Creates several limit orders with the batch order API end point, which accepts up to
+        MAX_ORDERS_PER_BATCH_REQUEST orders per request. This function returns immediately.
+        To see the actual orders, you'll have to wait for BuyOrderCreatedEvent and SellOrderCreatedEvent.
+        :param orders_to_create: The orders to create (their client order ids are ignored)
+        :param order_type: The type of all the orders
+        :returns The orders to create, with their new internal order ids
+        """
+        created_orders = [
+            LimitOrder(
+                get_new_client_order_id(
+                    is_buy=order.is_buy, trading_pair=order.trading_pair,
+                    hbot_order_id_prefix=ascend_ex_utils.HBOT_BROKER_ID
+                ),
+                order.trading_pair,
+                order.is_buy,
+                order.base_currency,
+                order.quote_currency,
+                order.price,
+                order.quantity,
+            )
+            for order in orders_to_create
+        ]
+        for i in range(0, len(created_orders), CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST):
+            safe_ensure_future(
+                self._create_orders_batch(created_orders[i:i + CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST], order_type)
+            )
+        return created_orders
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels several orders with the batch order API end point. The orders without exchange order id yet are
+        cancelled one by one, as with cancel(). This function returns immediately.
+        To get the cancellation results, you'll have to wait for OrderCancelledEvent.
+        :param orders_to_cancel: The orders to cancel
+        """
+        tracked_orders = []
+        for order in orders_to_cancel:
+            tracked_order = self._in_flight_order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None and tracked_order.exchange_order_id is not None:
+                tracked_orders.append(tracked_order)
+            else:
+                self.cancel(order.trading_pair, order.client_order_id)
+        for i in range(0, len(tracked_orders), CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST):
+            safe_ensure_future(self._execute_cancel_batch(tracked_orders[i:i + CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST]))
+
+    def _order_request_params(
+            self,
+            order_uuid: str,
+            timestamp: int,
+            trade_type: TradeType,
+            trading_pair: str,
+            amount: Decimal,
+            price: Decimal,
+    ) -> Dict[str, Any]:
+        return {
+            "id": order_uuid,
+            "time": timestamp,
+            "symbol": ascend_ex_utils.convert_to_exchange_trading_pair(trading_pair),
+            "orderPrice": f"{price:f}",
+            "orderQty": f"{amount:f}",
+            "orderType": "limit",
+            "side": "buy" if trade_type == TradeType.BUY else "sell",
+        }
+
+    async def _create_orders_batch(self, orders: List[LimitOrder], order_type: OrderType):
+        """
+        Calls the batch order API end point to place several orders and starts tracking them. The exchange order ids
+        are taken from the response, the order states are then updated from the user stream and the status polling.
+        :param orders: The orders to place, with their internal order ids
+        :param order_type: The type of all the orders
+        """
+        if not order_type.is_limit_type():
+            raise Exception(f"Unsupported order type: {order_type}")
+        timestamp = ascend_ex_utils.get_ms_timestamp()
+        client_order_ids = {}
+        orders_params = []
+        for order in orders:
+            trade_type = TradeType.BUY if order.is_buy else TradeType.SELL
+            price = self.quantize_order_price(order.trading_pair, order.price)
+            amount = self.quantize_order_amount(order.trading_pair, order.quantity, price)
+            if amount <= s_decimal_0:
+                self.logger().error(f"Order amount must be greater than zero. The order {order.client_order_id} "
+                                    f"was not submitted.")
+                continue
+            order_uuid = f"{ascend_ex_utils.HBOT_BROKER_ID}-{ascend_ex_utils.uuid32()}"[:32]
+            orders_params.append(
+                self._order_request_params(order_uuid, timestamp, trade_type, order.trading_pair, amount, price)
+            )
+            client_order_ids[order_uuid] = order.client_order_id
+            self.start_tracking_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                trade_type=trade_type,
+                price=price,
+                amount=amount,
+                order_type=order_type,
+            )
+        if len(orders_params) == 0:
+            return
+
+        try:
+            resp = await self._api_request(
+                method="post",
+                path_url=CONSTANTS.ORDER_BATCH_PATH_URL,
+                data={"orders": orders_params},
+                is_auth_required=True,
+                force_auth_path_url="order/batch",
+            )
+            for order_info in resp["data"]["info"]:
+                client_order_id = client_order_ids.get(order_info["id"])
+                tracked_order = (self._in_flight_order_tracker.fetch_tracked_order(client_order_id)
+                                 if client_order_id is not None else None)
+                if tracked_order is not None and tracked_order.exchange_order_id is None:
+                    tracked_order.update_exchange_order_id(str(order_info["orderId"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().exception(f"The request to create the orders {list(client_order_ids.values())} failed")
+            for client_order_id in client_order_ids.values():
+                self.stop_tracking_order(client_order_id)
+
+    async def _execute_cancel_batch(self, tracked_orders: List[InFlightOrder]):
+        """
+        Calls the batch order API end point to cancel several orders with exchange order ids. As for a single order,
+        the API result doesn't confirm whether the cancellations are successful.
+        :param tracked_orders: The orders to cancel
+        """
+        timestamp = ascend_ex_utils.get_ms_timestamp()
+        cancel_payloads = [
+            {
+                "id": ascend_ex_utils.uuid32(),
+                "orderId": tracked_order.exchange_order_id,
+                "symbol": ascend_ex_utils.convert_to_exchange_trading_pair(tracked_order.trading_pair),
+                "time": timestamp,
+            }
+            for tracked_order in tracked_orders
+        ]
+        try:
+            await self._api_request(
+                method="delete",
+                path_url=CONSTANTS.ORDER_BATCH_PATH_URL,
+                data={"orders": cancel_payloads},
+                is_auth_required=True,
+                force_auth_path_url="order/batch",
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().error(
+                f"Failed to cancel orders {[tracked_order.client_order_id for tracked_order in tracked_orders]}: "
+                f"{str(e)}",
+                exc_info=True,
+            )
+
     async def _create_order(
             self,
             trade_type: TradeType,
@@ -523,16 +686,8 @@ class AscendExExchange(ExchangePyBase):
             timestamp = ascend_ex_utils.get_ms_timestamp()
             # Order UUID is strictly used to enable AscendEx to construct a unique(still questionable) exchange_order_id
             order_uuid = f"{ascend_ex_utils.HBOT_BROKER_ID}-{ascend_ex_utils.uuid32()}"[:32]
-            api_params = {
-                "id": order_uuid,
-                "time": timestamp,
-                "symbol": ascend_ex_utils.convert_to_exchange_trading_pair(trading_pair),
-                "orderPrice": f"{price:f}",
-                "orderQty": f"{amount:f}",
-                "orderType": "limit",
-                "side": "buy" if trade_type == TradeType.BUY else "sell",
-                "respInst": "ACCEPT",
-            }
+            api_params = self._order_request_params(order_uuid, timestamp, trade_type, trading_pair, amount, price)
+            api_params["respInst"] = "ACCEPT"
             self.start_tracking_order(
                 order_id=order_id,
                 trading_pair=trading_pair,
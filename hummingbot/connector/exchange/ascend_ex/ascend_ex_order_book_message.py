@@ -14,6 +14,9 @@ from hummingbot.core.data_type.order_book_message import (
 
 
 class AscendExOrderBookMessage(OrderBookMessage):
+    # The bids and asks are [price, amount] entries, order books can decode them without the properties below
+    has_raw_entries = True
+
     def __new__(
         cls,
         message_type: OrderBookMessageType,
@@ -58,6 +58,10 @@ class AscendExOrderBookTracker(OrderBookTracker):
         """
         return constants.EXCHANGE_NAME
 
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        return True
+
     def start(self):
         super().start()
         self._order_book_stream_listener_task = safe_ensure_future(
@@ -92,8 +96,7 @@ class AscendExOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    # bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -109,9 +112,9 @@ class AscendExOrderBookTracker(OrderBookTracker):
                     past_diffs = list(past_diffs_window)
                     replay_position = bisect.bisect_right(past_diffs, message)
                     replay_diffs = past_diffs[replay_position:]
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                    order_book.apply_snapshot_message(message)
                     for diff in replay_diffs:
-                        order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+                        order_book.apply_diff_message(diff)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
 
             except asyncio.CancelledError:
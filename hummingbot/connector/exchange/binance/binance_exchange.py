@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import time
+from collections import defaultdict
 from decimal import Decimal
 from typing import (
     Any,
@@ -885,13 +886,88 @@ class BinanceExchange(ExchangeBase):
     async def _update_order_status(self):
         # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
         # are not working.
+        # The open orders of a trading pair are reconciled with a single request when that costs less request weight
+        # than querying them one by one. Only the tracked orders missing from the open orders are then queried
+        # individually to get their final state (fills are reconciled in _update_order_fills_from_trades).
         # The minimum poll interval for order status is 10 seconds.
         last_tick = self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL
         current_tick = self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL
 
         tracked_orders: List[InFlightOrder] = list(self.in_flight_orders.values())
         if current_tick > last_tick and len(tracked_orders) > 0:
+            order_weight = self._request_weight(CONSTANTS.ORDER_PATH_URL)
+            open_orders_weight = self._request_weight(CONSTANTS.OPEN_ORDERS_PATH_URL)
+
+            orders_by_trading_pair: Dict[str, List[InFlightOrder]] = defaultdict(list)
+            for tracked_order in tracked_orders:
+                orders_by_trading_pair[tracked_order.trading_pair].append(tracked_order)
+            bulk_trading_pairs = [trading_pair for trading_pair, orders in orders_by_trading_pair.items()
+                                  if len(orders) * order_weight > open_orders_weight]
+            orders_to_query: List[InFlightOrder] = [
+                order for order in tracked_orders if order.trading_pair not in bulk_trading_pairs]
+
+            if len(bulk_trading_pairs) > 0:
+                orders_to_query.extend(await self._reconcile_open_orders(
+                    {trading_pair: orders_by_trading_pair[trading_pair] for trading_pair in bulk_trading_pairs}))
+
+            await self._update_orders_status_individually(orders_to_query)
+
+            used_weight = len(bulk_trading_pairs) * open_orders_weight + len(orders_to_query) * order_weight
+            self.logger().debug(
+                f"Order status of {len(tracked_orders)} orders updated with {used_weight} request weight "
+                f"({len(tracked_orders) * order_weight - used_weight} saved by the open orders reconciliation).")
+
+    async def _reconcile_open_orders(self,
+                                     orders_by_trading_pair: Dict[str, List[InFlightOrder]]) -> List[InFlightOrder]:
+        """
+        Requests the open orders of the trading pairs and updates the tracked orders still open.
+
+        :param orders_by_trading_pair: tracked orders of each trading pair to reconcile
+        :return: the tracked orders that are no longer open, or could not be reconciled
+        """
+        trading_pairs = list(orders_by_trading_pair.keys())
+        tasks = [self._api_request(
+            method=RESTMethod.GET,
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={
+                "symbol": await BinanceAPIOrderBookDataSource.exchange_symbol_associated_to_pair(
+                    trading_pair=trading_pair,
+                    domain=self._domain,
+                    api_factory=self._api_factory,
+                    throttler=self._throttler,
+                    time_synchronizer=self._binance_time_synchronizer)},
+            is_auth_required=True) for trading_pair in trading_pairs]
+        self.logger().debug(f"Polling for open orders of {len(tasks)} trading pairs.")
+        results = await safe_gather(*tasks, return_exceptions=True)
+
+        missing_orders: List[InFlightOrder] = []
+        for open_orders, trading_pair in zip(results, trading_pairs):
+            if isinstance(open_orders, Exception):
+                self.logger().network(
+                    f"Error fetching open orders for {trading_pair}: {open_orders}.",
+                    app_warning_msg=f"Failed to fetch open orders for {trading_pair}."
+                )
+                missing_orders.extend(orders_by_trading_pair[trading_pair])
+                continue
+
+            open_orders_by_client_id = {order["clientOrderId"]: order for order in open_orders}
+            for tracked_order in orders_by_trading_pair[trading_pair]:
+                open_order = open_orders_by_client_id.get(tracked_order.client_order_id)
+                if open_order is None:
+                    missing_orders.append(tracked_order)
+                elif tracked_order.client_order_id in self.in_flight_orders:
+                    update = OrderUpdate(
+                        client_order_id=tracked_order.client_order_id,
+                        exchange_order_id=str(open_order["orderId"]),
+                        trading_pair=tracked_order.trading_pair,
+                        update_timestamp=open_order["updateTime"] * 1e-3,
+                        new_state=CONSTANTS.ORDER_STATE[open_order["status"]],
+                    )
+                    self._order_tracker.process_order_update(update)
+        return missing_orders
 
+    async def _update_orders_status_individually(self, tracked_orders: List[InFlightOrder]):
+        if len(tracked_orders) > 0:
             tasks = [self._api_request(
                 method=RESTMethod.GET,
                 path_url=CONSTANTS.ORDER_PATH_URL,
@@ -946,6 +1022,12 @@ class BinanceExchange(ExchangeBase):
                     )
                     self._order_tracker.process_order_update(update)
 
+    @staticmethod
+    def _request_weight(limit_id: str) -> int:
+        rate_limit = next(limit for limit in CONSTANTS.RATE_LIMITS if limit.limit_id == limit_id)
+        return sum(linked_limit.weight for linked_limit in rate_limit.linked_limits
+                   if linked_limit.limit_id == CONSTANTS.REQUEST_WEIGHT)
+
     async def _iter_user_event_queue(self) -> AsyncIterable[Dict[str, any]]:
         while True:
             try:
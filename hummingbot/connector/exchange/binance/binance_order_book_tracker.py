@@ -57,6 +57,10 @@ class BinanceOrderBookTracker(OrderBookTracker):
         else:
             return f"binance_{self._domain}"
 
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        return True
+
     def start(self):
         """
         Starts the background task that connects to the exchange and listens to order book updates and trade events.
@@ -91,6 +95,9 @@ class BinanceOrderBookTracker(OrderBookTracker):
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
                     self._saved_message_queues[trading_pair].append(ob_message)
+                    if self._market_data_recorder is not None:
+                        # The saved messages are applied without going through the order book buffer
+                        self._market_data_recorder.record_message(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -151,6 +151,10 @@ cdef class KrakenExchange(ExchangeBase):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self) -> KrakenOrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def kraken_auth(self) -> KrakenAuth:
         return self._kraken_auth
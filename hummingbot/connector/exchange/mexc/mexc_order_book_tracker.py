@@ -47,6 +47,10 @@ class MexcOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "mexc"
 
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        return True
+
     def start(self):
         super().start()
         self._order_book_stream_listener_task = safe_ensure_future(self._data_source.listen_for_subscriptions())
@@ -164,6 +164,10 @@ class NdaxExchange(ExchangeBase):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self) -> NdaxOrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [
@@ -59,6 +59,10 @@ class NdaxOrderBookTracker(OrderBookTracker):
         """
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        return True
+
     async def _track_single_book(self, trading_pair: str):
         """
         Update an order book with changes from the latest batch of received messages
@@ -38,6 +38,10 @@ class OkexOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "okex"
 
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        return True
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
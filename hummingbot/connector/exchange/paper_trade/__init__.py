@@ -1,6 +1,7 @@
 from typing import List, Callable
 from hummingbot.client.config.config_helpers import get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.exchange.paper_trade.backtest_order_book_tracker import BacktestOrderBookTracker
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 
 
@@ -26,3 +27,13 @@ def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
     obt_obj = obt_class(**obt_kwargs)
     return PaperTradeExchange(obt_obj,
                               get_connector_class(exchange_name))
+
+
+def create_backtest_market(exchange_name: str, trading_pairs: List[str]):
+    """
+    Creates a paper trade market whose order books are not connected to the exchange, their content is replayed from
+    recorded market data.
+    """
+    obt_obj = BacktestOrderBookTracker(exchange_name=exchange_name, trading_pairs=trading_pairs)
+    return PaperTradeExchange(obt_obj,
+                              get_connector_class(exchange_name))
@@ -0,0 +1,59 @@
+import asyncio
+from typing import List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class BacktestOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source without any network activity. The order books it creates are empty, their content is replayed from
+    recorded market data by the MarketDataReplayer.
+    """
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class BacktestOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker used by the backtest markets. The order books are created synchronously when the tracker is
+    started, and they are kept when the tracker is stopped because the replayed state can not be fetched again.
+    """
+
+    def __init__(self, exchange_name: str, trading_pairs: List[str]):
+        super().__init__(data_source=BacktestOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+        self._exchange_name: str = exchange_name
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        # The order books are replayed from the recorded market data, the tracker doesn't start any data source listener
+        return False
+
+    def start(self):
+        for trading_pair in self._trading_pairs:
+            if trading_pair not in self._order_books:
+                self._order_books[trading_pair] = self._data_source.order_book_create_function()
+            self._ready_trading_pairs.add(trading_pair)
+        self._order_books_initialized.set()
+
+    def stop(self):
+        pass
@@ -0,0 +1,182 @@
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.historical_market_data import (
+    ASK_SIDE,
+    BID_SIDE,
+    DIFF_MESSAGE_TYPE,
+    ORDER_BOOK_RECORD_DTYPE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_RECORD_DTYPE,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.logger import HummingbotLogger
+
+
+class ReplayedTradingPair:
+    """
+    Replay state of a single trading pair: the order book being rebuilt and the position of the next record to
+    apply in each recorded stream.
+    """
+
+    def __init__(self,
+                 trading_pair: str,
+                 order_book: OrderBook,
+                 order_book_records: np.ndarray,
+                 trade_records: np.ndarray):
+        self.trading_pair: str = trading_pair
+        self.order_book: OrderBook = order_book
+        self.order_book_records: np.ndarray = order_book_records
+        self.trade_records: np.ndarray = trade_records
+        self.order_book_position: int = 0
+        self.trade_position: int = 0
+
+    @property
+    def is_exhausted(self) -> bool:
+        return (self.order_book_position >= len(self.order_book_records)
+                and self.trade_position >= len(self.trade_records))
+
+
+class MarketDataReplayer(PyTimeIterator):
+    """
+    Replays recorded order book snapshots, diffs and trades into order books following the simulated clock.
+
+    It has to be added to the clock before the markets using the order books, so on every tick the markets and the
+    strategy see the order books as they were at the tick timestamp. Trades are applied to the order books, which
+    emit the trade events used by the paper trade exchange to fill the resting limit orders.
+
+    The snapshots are recorded as received, so the diffs recorded before a snapshot but more recent than it are
+    re-applied on top of it, the same way the order book trackers restore their order books from the snapshots.
+    """
+    # Maximum number of records preceding a snapshot searched for diffs more recent than it
+    PAST_DIFF_RECORDS_WINDOW_SIZE: int = 10000
+
+    _mdr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdr_logger is None:
+            cls._mdr_logger = logging.getLogger(__name__)
+        return cls._mdr_logger
+
+    def __init__(self):
+        super().__init__()
+        self._trading_pairs: Dict[str, ReplayedTradingPair] = {}
+        self._applied_order_book_records: int = 0
+        self._applied_trades: int = 0
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._trading_pairs.keys())
+
+    @property
+    def is_exhausted(self) -> bool:
+        return all(replayed_pair.is_exhausted for replayed_pair in self._trading_pairs.values())
+
+    @property
+    def applied_order_book_records(self) -> int:
+        return self._applied_order_book_records
+
+    @property
+    def applied_trades(self) -> int:
+        return self._applied_trades
+
+    def add_trading_pair(self,
+                         trading_pair: str,
+                         order_book: OrderBook,
+                         order_book_records: np.ndarray,
+                         trade_records: Optional[np.ndarray] = None):
+        """
+        :param trading_pair: the trading pair the records belong to
+        :param order_book: the order book the records are applied to
+        :param order_book_records: snapshot and diff records (ORDER_BOOK_RECORD_DTYPE) sorted by timestamp
+        :param trade_records: trade records (TRADE_RECORD_DTYPE) sorted by timestamp
+        """
+        if trade_records is None:
+            trade_records = np.empty(0, dtype=TRADE_RECORD_DTYPE)
+        if order_book_records.dtype != ORDER_BOOK_RECORD_DTYPE or trade_records.dtype != TRADE_RECORD_DTYPE:
+            raise ValueError("The market data records do not have the expected format.")
+        self._trading_pairs[trading_pair] = ReplayedTradingPair(
+            trading_pair, order_book, order_book_records, trade_records)
+
+    def tick(self, timestamp: float):
+        for replayed_pair in self._trading_pairs.values():
+            try:
+                self._replay_order_book_records(replayed_pair, timestamp)
+                self._replay_trades(replayed_pair, timestamp)
+            except Exception:
+                self.logger().error(f"Unexpected error replaying market data for {replayed_pair.trading_pair}.",
+                                    exc_info=True)
+
+    def _replay_order_book_records(self, replayed_pair: ReplayedTradingPair, timestamp: float):
+        records = replayed_pair.order_book_records
+        end_position = int(np.searchsorted(records["timestamp"], timestamp, side="right"))
+        if end_position <= replayed_pair.order_book_position:
+            return
+        start_position = replayed_pair.order_book_position
+        chunk = records[start_position:end_position]
+        replayed_pair.order_book_position = end_position
+        self._applied_order_book_records += len(chunk)
+
+        is_snapshot = chunk["message_type"] == SNAPSHOT_MESSAGE_TYPE
+        if is_snapshot.any():
+            # Only the last snapshot in the chunk matters, everything before it is superseded
+            snapshot_update_id = chunk["update_id"][is_snapshot][-1]
+            is_last_snapshot = is_snapshot & (chunk["update_id"] == snapshot_update_id)
+            snapshot_rows = chunk[is_last_snapshot]
+            bids, asks = self._split_sides(snapshot_rows)
+            replayed_pair.order_book.apply_numpy_snapshot(bids, asks)
+            past_diff_rows = self._past_diff_rows(
+                records, start_position + int(np.flatnonzero(is_last_snapshot)[0]), snapshot_update_id)
+            if len(past_diff_rows) > 0:
+                bids, asks = self._split_sides(past_diff_rows)
+                replayed_pair.order_book.apply_numpy_diffs(bids, asks)
+            chunk = chunk[int(np.flatnonzero(is_last_snapshot)[-1]) + 1:]
+
+        diff_rows = chunk[chunk["message_type"] == DIFF_MESSAGE_TYPE]
+        if len(diff_rows) > 0:
+            # Diffs are applied in order, so a level updated several times keeps its last amount
+            bids, asks = self._split_sides(diff_rows)
+            replayed_pair.order_book.apply_numpy_diffs(bids, asks)
+
+    def _replay_trades(self, replayed_pair: ReplayedTradingPair, timestamp: float):
+        records = replayed_pair.trade_records
+        end_position = int(np.searchsorted(records["timestamp"], timestamp, side="right"))
+        if end_position <= replayed_pair.trade_position:
+            return
+        chunk = records[replayed_pair.trade_position:end_position]
+        replayed_pair.trade_position = end_position
+        self._applied_trades += len(chunk)
+        for trade_timestamp, price, amount, trade_type in chunk.tolist():
+            replayed_pair.order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=replayed_pair.trading_pair,
+                timestamp=trade_timestamp,
+                price=price,
+                amount=amount,
+                type=TradeType.SELL if trade_type == TradeType.SELL.value else TradeType.BUY
+            ))
+
+    def _past_diff_rows(self, records: np.ndarray, snapshot_position: int, snapshot_update_id: int) -> np.ndarray:
+        """
+        Returns the diff records immediately preceding the snapshot at the given position that are more recent than it
+        """
+        past_records = records[max(0, snapshot_position - self.PAST_DIFF_RECORDS_WINDOW_SIZE):snapshot_position]
+        is_older = ((past_records["message_type"] != DIFF_MESSAGE_TYPE)
+                    | (past_records["update_id"] <= snapshot_update_id))
+        older_positions = np.flatnonzero(is_older)
+        if len(older_positions) == 0:
+            return past_records
+        return past_records[int(older_positions[-1]) + 1:]
+
+    @staticmethod
+    def _split_sides(rows: np.ndarray):
+        """
+        Converts the records into the [price, amount, update_id] float arrays expected by the order book
+        """
+        values = np.column_stack((rows["price"], rows["amount"], rows["update_id"].astype(np.float64)))
+        return values[rows["side"] == BID_SIDE], values[rows["side"] == ASK_SIDE]
@@ -209,6 +209,47 @@ cdef class ExchangeBase(ConnectorBase):
     def cancel(self, trading_pair: str, client_order_id: str):
         raise NotImplementedError
 
+    def batch_order_create(self,
+                           orders_to_create: List[LimitOrder],
+                           order_type: OrderType = OrderType.LIMIT,
+                           **kwargs) -> List[LimitOrder]:
+        """
+        Creates several limit orders at once. This function returns immediately.
+        Connectors for exchanges with a batch order creation endpoint override this method to send the orders in as
+        few requests as possible. The default implementation submits each order with buy() or sell(), which start
+        the order creation requests concurrently (each connector throttles its own requests).
+        :param orders_to_create: the orders to create (their client order ids are ignored)
+        :param order_type: the type of all the orders (LIMIT or LIMIT_MAKER)
+        :param kwargs: additional arguments passed to buy() and sell()
+        :returns: the orders to create, with the client order ids assigned by the connector
+        """
+        cdef:
+            list created_orders = []
+            str client_order_id
+        for order in orders_to_create:
+            if order.is_buy:
+                client_order_id = self.c_buy(order.trading_pair, order.quantity, order_type, order.price, kwargs)
+            else:
+                client_order_id = self.c_sell(order.trading_pair, order.quantity, order_type, order.price, kwargs)
+            created_orders.append(LimitOrder(client_order_id,
+                                             order.trading_pair,
+                                             order.is_buy,
+                                             order.base_currency,
+                                             order.quote_currency,
+                                             order.price,
+                                             order.quantity))
+        return created_orders
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels several orders at once. This function returns immediately.
+        Connectors for exchanges with a batch cancellation endpoint override this method to send the cancellations in
+        as few requests as possible. The default implementation cancels each order with cancel().
+        :param orders_to_cancel: the orders to cancel
+        """
+        for order in orders_to_cancel:
+            self.c_cancel(order.trading_pair, order.client_order_id)
+
     def get_order_book(self, trading_pair: str) -> OrderBook:
         raise NotImplementedError
 
@@ -1,10 +1,10 @@
 import asyncio
+import logging
 import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -28,6 +28,8 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent
 )
+from hummingbot.core.utils.rotating_csv_writer import RotatingCsvWriter
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -35,20 +37,42 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position import RangePosition
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorder:
+    CSV_FLUSH_INTERVAL = 1.0
+    CSV_MAX_FILE_SIZE = 100 * 1024 * 1024
+    _mr_logger: Optional[HummingbotLogger] = None
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False,
+                 write_behind_interval: float = 0.5):
+        """
+        :param sql: the connection manager for the trades database
+        :param markets: the connectors whose events are recorded
+        :param config_file_path: the strategy config file the records belong to
+        :param strategy_name: the name of the running strategy
+        :param write_behind: if True, the records are written in bulk transactions by a background writer thread
+        instead of being committed synchronously by each event handler
+        :param write_behind_interval: time in seconds used to group records (and market state snapshots) in the
+        same transaction when write_behind is enabled
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -57,6 +81,14 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind_interval: float = write_behind_interval
+        self._write_queue: Optional[SQLWriteBehindQueue] = (
+            SQLWriteBehindQueue(sql, batch_interval=write_behind_interval) if write_behind else None
+        )
+        # Markets with a market state snapshot scheduled to be captured (only used in write behind mode)
+        self._markets_with_pending_state: Set[str] = set()
+        self._csv_writers: Dict[str, RotatingCsvWriter] = {}
+        self._csv_flush_scheduled: bool = False
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -110,7 +142,31 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind_enabled(self) -> bool:
+        return self._write_queue is not None
+
+    @property
+    def write_queue_depth(self) -> int:
+        """
+        Number of records waiting to be written to the database (always 0 if write behind is disabled)
+        """
+        return self._write_queue.queue_depth if self._write_queue is not None else 0
+
+    @property
+    def last_flush_latency(self) -> float:
+        """
+        Time in seconds spent writing the last batch of records (always 0 if write behind is disabled)
+        """
+        return self._write_queue.last_flush_latency if self._write_queue is not None else 0.0
+
+    @property
+    def average_flush_latency(self) -> float:
+        return self._write_queue.average_flush_latency if self._write_queue is not None else 0.0
+
     def start(self):
+        if self._write_queue is not None:
+            self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -119,6 +175,27 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._write_queue is not None:
+            # Capture the latest state of every market with a pending snapshot before flushing the queue
+            for market in self._markets:
+                if market.display_name in self._markets_with_pending_state:
+                    self._capture_market_states(market)
+            self._write_queue.stop()
+        self._close_csv_writers()
+
+    def flush(self):
+        """
+        Blocks until all the records received so far have been written to the database.
+        """
+        if self._write_queue is not None:
+            for market in self._markets:
+                if market.display_name in self._markets_with_pending_state:
+                    self._capture_market_states(market)
+            if self._write_queue.started:
+                self._write_queue.wait_until_empty()
+            else:
+                self._write_queue.flush()
+        self._flush_csv()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -149,17 +226,32 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states_snapshot(config_file_path=config_file_path,
+                                          market_name=market.display_name,
+                                          tracking_states=market.tracking_states,
+                                          timestamp=self.db_timestamp,
+                                          session=session)
+
+    def _save_market_states_snapshot(self,
+                                     config_file_path: str,
+                                     market_name: str,
+                                     tracking_states: Dict[str, Any],
+                                     timestamp: int,
+                                     session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -180,6 +272,50 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _record(self,
+                operation: Callable[[Session], None],
+                market: Optional[ConnectorBase] = None,
+                on_commit: Optional[Callable[[], None]] = None):
+        """
+        Applies a database operation, and saves the market states if a market is specified.
+        In write behind mode the operation is queued and the market states snapshot is coalesced with the other
+        snapshots of the same market captured during the write behind interval.
+        on_commit is called once the operation has been committed (never if it fails).
+        """
+        if self._write_queue is None:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    operation(session)
+                    if market is not None:
+                        self.save_market_states(self._config_file_path, market, session=session)
+            if on_commit is not None:
+                on_commit()
+        else:
+            self._write_queue.put(operation, on_commit)
+            if market is not None:
+                self._schedule_market_states_capture(market)
+
+    def _schedule_market_states_capture(self, market: ConnectorBase):
+        if market.display_name not in self._markets_with_pending_state:
+            self._markets_with_pending_state.add(market.display_name)
+            self._ev_loop.call_later(self._write_behind_interval, self._capture_market_states, market)
+
+    def _capture_market_states(self, market: ConnectorBase):
+        if market.display_name not in self._markets_with_pending_state:
+            return
+        self._markets_with_pending_state.discard(market.display_name)
+        config_file_path: str = self._config_file_path
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = market.tracking_states
+        timestamp: int = self.db_timestamp
+        self._write_queue.put_keyed(
+            ("market_states", market_name),
+            lambda session: self._save_market_states_snapshot(config_file_path=config_file_path,
+                                                              market_name=market_name,
+                                                              tracking_states=tracking_states,
+                                                              timestamp=timestamp,
+                                                              session=session))
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -191,32 +327,35 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        market_name: str = market.display_name
+
+        def record_order(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=config_file_path,
+                                        strategy=strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._record(record_order, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -230,48 +369,56 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        market_name: str = market.display_name
+        # The CSV row is built with the session (the order is needed), but only written once the fill is committed,
+        # so a retried or discarded operation doesn't write it again
+        csv_row: List[Tuple[str, Tuple[str, ...], Tuple[Any, ...]]] = []
+
+        def record_fill(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=config_file_path,
+                strategy=strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=Decimal(
+                    evt.price) if evt.price == evt.price else Decimal(0),
+                amount=Decimal(evt.amount),
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=evt.trade_fee.to_json(),
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            csv_row[:] = [self._csv_row(trade_fill_record)]
+
+        def append_fill_to_csv():
+            self._append_csv_row(*csv_row[0])
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._record(record_fill, market, on_commit=append_fill_to_csv)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -281,29 +428,62 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        config_file_path: str = self._config_file_path
+        market_name: str = market.display_name
+
+        def record_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._record(record_funding_payment)
+
+    def _get_csv_writer(self, csv_path: str, header: Tuple[str, ...]) -> RotatingCsvWriter:
+        csv_writer: Optional[RotatingCsvWriter] = self._csv_writers.get(csv_path)
+        if csv_writer is not None and csv_writer.header != header:
+            # The export columns changed, the writer will move the existing file away when it opens it again
+            csv_writer.close()
+            csv_writer = None
+        if csv_writer is None:
+            csv_writer = RotatingCsvWriter(file_path=csv_path,
+                                           header=header,
+                                           max_file_size=self.CSV_MAX_FILE_SIZE)
+            self._csv_writers[csv_path] = csv_writer
+        return csv_writer
+
+    def _schedule_csv_flush(self):
+        # Buffered rows are written at most CSV_FLUSH_INTERVAL seconds after they were appended, even if no other
+        # fill arrives
+        if not self._csv_flush_scheduled:
+            self._csv_flush_scheduled = True
+            self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, self.CSV_FLUSH_INTERVAL, self._flush_csv)
+
+    def _flush_csv(self):
+        self._csv_flush_scheduled = False
+        for csv_writer in list(self._csv_writers.values()):
+            csv_writer.flush()
+
+    def _close_csv_writers(self):
+        for csv_writer in list(self._csv_writers.values()):
+            csv_writer.close()
+        self._csv_writers.clear()
 
     def append_to_csv(self, trade: TradeFill):
+        self._append_csv_row(*self._csv_row(trade))
+
+    def _csv_row(self, trade: TradeFill) -> Tuple[str, Tuple[str, ...], Tuple[Any, ...]]:
+        """
+        Returns the CSV file path, the field names and the field values of a trade fill
+        """
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -316,15 +496,11 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def _append_csv_row(self, csv_path: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        self._get_csv_writer(csv_path, field_names).append(field_data)
+        self._schedule_csv_flush()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -342,18 +518,18 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def record_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._record(record_order_status, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -388,25 +564,28 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
-                                                     config_file_path=self._config_file_path,
-                                                     strategy=self._strategy_name,
-                                                     tx_hash=evt.tx_hash,
-                                                     connector=connector.display_name,
-                                                     trading_pair=evt.trading_pair,
-                                                     fee_tier=str(evt.fee_tier),
-                                                     lower_price=float(evt.lower_price),
-                                                     upper_price=float(evt.upper_price),
-                                                     base_amount=float(evt.base_amount),
-                                                     quote_amount=float(evt.quote_amount),
-                                                     status=evt.status,
-                                                     creation_timestamp=timestamp,
-                                                     last_update_timestamp=timestamp)
-                session.add(r_pos)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        connector_name: str = connector.display_name
+
+        def record_range_position(session: Session):
+            r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
+                                                 config_file_path=config_file_path,
+                                                 strategy=strategy_name,
+                                                 tx_hash=evt.tx_hash,
+                                                 connector=connector_name,
+                                                 trading_pair=evt.trading_pair,
+                                                 fee_tier=str(evt.fee_tier),
+                                                 lower_price=float(evt.lower_price),
+                                                 upper_price=float(evt.upper_price),
+                                                 base_amount=float(evt.base_amount),
+                                                 quote_amount=float(evt.quote_amount),
+                                                 status=evt.status,
+                                                 creation_timestamp=timestamp,
+                                                 last_update_timestamp=timestamp)
+            session.add(r_pos)
+
+        self._record(record_range_position, connector)
 
     def _did_update_range_position(self,
                                    event_tag: int,
@@ -418,18 +597,18 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
-                    RangePosition.hb_id == evt.hb_id).one_or_none()
-                if rp_record is not None:
-                    rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
-                                                                         timestamp=timestamp,
-                                                                         tx_hash=evt.tx_hash,
-                                                                         token_id=evt.token_id,
-                                                                         base_amount=float(evt.base_amount),
-                                                                         quote_amount=float(evt.quote_amount),
-                                                                         status=evt.status,
-                                                                         )
-                    session.add(rp_update)
-                    self.save_market_states(self._config_file_path, connector, session=session)
+        def record_range_position_update(session: Session):
+            rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
+                RangePosition.hb_id == evt.hb_id).one_or_none()
+            if rp_record is not None:
+                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
+                                                                     timestamp=timestamp,
+                                                                     tx_hash=evt.tx_hash,
+                                                                     token_id=evt.token_id,
+                                                                     base_amount=float(evt.base_amount),
+                                                                     quote_amount=float(evt.quote_amount),
+                                                                     status=evt.status,
+                                                                     )
+                session.add(rp_update)
+
+        self._record(record_range_position_update, connector)
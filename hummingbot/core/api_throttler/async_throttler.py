@@ -1,16 +1,32 @@
+import asyncio
 import time
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     AsyncRequestContextBase,
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
+
+# Extra delay added to the computed wake up times, to make sure the blocking requests are out of the window
+WAKE_UP_DELAY = 0.001
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
     """
     An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
     It uses async lock to prevent other instances of this class from running acquire fn before it finishes with it.
+    Note: AsyncThrottler uses SlidingWindowRequestContext, this polling implementation is kept for compatibility.
     """
 
     def within_capacity(self) -> bool:
@@ -39,6 +55,37 @@ class AsyncRequestContext(AsyncRequestContextBase):
         return True
 
 
+class PendingRequest:
+    """
+    A request waiting for capacity in the AsyncThrottler queue
+    """
+
+    def __init__(self, limits: List[Tuple[RateLimitWindow, int]], future: asyncio.Future):
+        self.limits: List[Tuple[RateLimitWindow, int]] = limits
+        self.limit_ids: Set[str] = {window.limit_id for window, _ in limits}
+        self.future: asyncio.Future = future
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until all the rate limits associated with the request
+    have capacity for it. The capacity checks and the wait are delegated to the AsyncThrottler.
+    """
+
+    def __init__(self, throttler: "AsyncThrottler", limits: List[Tuple[RateLimitWindow, int]]):
+        self._throttler: AsyncThrottler = throttler
+        self._limits: List[Tuple[RateLimitWindow, int]] = limits
+
+    async def acquire(self):
+        await self._throttler.acquire(self._limits)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
 class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
@@ -49,21 +96,149 @@ class AsyncThrottler(AsyncThrottlerBase):
         Pool 1 - rate limit is 10 calls per second
         Task A which consumes capacity from both Pool 0 and Pool 1 can be called at 10 calls per second, any calls after
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
+
+    Each RateLimit keeps its own sliding window with a running total of the capacity used, so checking the capacity
+    does not depend on the number of requests logged. Requests that have to wait are queued in arrival order and
+    woken up when the capacity they need is expected to be available, instead of polling every retry interval.
+    A queued request only blocks the requests that arrive after it and share at least one of its rate limits.
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
+                 ):
+        super().__init__(rate_limits=rate_limits, retry_interval=retry_interval, safety_margin_pct=safety_margin_pct)
+        self._windows: Dict[str, RateLimitWindow] = {
+            limit.limit_id: RateLimitWindow(rate_limit=limit, safety_margin_pct=self._safety_margin_pct)
+            for limit in self._rate_limits
+        }
+        self._waiting_requests: Deque[PendingRequest] = deque()
+        self._waiting_requests_per_limit: Dict[str, int] = {}
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._last_max_cap_warning_ts: float = 0.0
+
+    @property
+    def waiting_requests_count(self) -> int:
+        return len(self._waiting_requests)
+
+    def capacity_used(self, limit_id: str) -> int:
+        """
+        Returns the capacity currently used for the specified limit
+        """
+        return self._windows[limit_id].capacity_used(self._time())
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
         :return: An async context (used with async with syntax)
         """
-        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
-        return AsyncRequestContext(
-            task_logs=self._task_logs,
-            rate_limit=rate_limit,
-            related_limits=related_rate_limits,
-            lock=self._lock,
-            safety_margin_pct=self._safety_margin_pct,
-            retry_interval=self._retry_interval,
-        )
+        _, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        weights: Dict[str, int] = {}
+        for rate_limit, weight in related_rate_limits:
+            weights[rate_limit.limit_id] = weights.get(rate_limit.limit_id, 0) + weight
+        limits: List[Tuple[RateLimitWindow, int]] = [(self._windows[limit_id], weight)
+                                                     for limit_id, weight in weights.items()]
+        return SlidingWindowRequestContext(throttler=self, limits=limits)
+
+    async def acquire(self, limits: List[Tuple[RateLimitWindow, int]]):
+        """
+        Waits until all the specified windows have capacity for the request, and registers the request in them.
+        :param limits: the rate limit windows and the weight of the request for each of them
+        """
+        now: float = self._time()
+        if (not any(self._waiting_requests_per_limit.get(window.limit_id, 0) > 0 for window, _ in limits)
+                and self._within_capacity(limits, now)):
+            self._register(limits, now)
+            return
+
+        request: PendingRequest = PendingRequest(limits=limits, future=asyncio.get_event_loop().create_future())
+        self._waiting_requests.append(request)
+        for limit_id in request.limit_ids:
+            self._waiting_requests_per_limit[limit_id] = self._waiting_requests_per_limit.get(limit_id, 0) + 1
+        self._process_waiting_requests()
+        try:
+            await request.future
+        except asyncio.CancelledError:
+            if not request.future.done() or request.future.cancelled():
+                self._remove_waiting_request(request)
+                self._process_waiting_requests()
+            raise
+
+    def _time(self) -> float:
+        return time.time()
+
+    @staticmethod
+    def _within_capacity(limits: List[Tuple[RateLimitWindow, int]], now: float) -> bool:
+        return all(window.has_capacity(weight, now) for window, weight in limits)
+
+    @staticmethod
+    def _register(limits: List[Tuple[RateLimitWindow, int]], now: float):
+        for window, weight in limits:
+            window.register(weight, now)
+
+    def _remove_waiting_request(self, request: PendingRequest):
+        try:
+            self._waiting_requests.remove(request)
+        except ValueError:
+            return
+        self._release_waiting_limits(request)
+
+    def _release_waiting_limits(self, request: PendingRequest):
+        for limit_id in request.limit_ids:
+            self._waiting_requests_per_limit[limit_id] -= 1
+            if self._waiting_requests_per_limit[limit_id] == 0:
+                del self._waiting_requests_per_limit[limit_id]
+
+    def _process_waiting_requests(self):
+        """
+        Goes through the waiting requests in arrival order, releasing the ones that fit in their windows.
+        A request is not released if an older request sharing one of its limits is still waiting.
+        Schedules the next run for the earliest time at which a blocked request could fit.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+        now: float = self._time()
+        blocked_limit_ids: Set[str] = set()
+        next_wake_up: Optional[float] = None
+        still_waiting: Deque[PendingRequest] = deque()
+
+        for request in self._waiting_requests:
+            if request.future.done():
+                self._release_waiting_limits(request)
+                continue
+            if blocked_limit_ids.isdisjoint(request.limit_ids):
+                if self._within_capacity(request.limits, now):
+                    self._register(request.limits, now)
+                    self._release_waiting_limits(request)
+                    request.future.set_result(None)
+                    continue
+                available_time: float = max(window.next_available_time(weight, now)
+                                            for window, weight in request.limits)
+                next_wake_up = available_time if next_wake_up is None else min(next_wake_up, available_time)
+                self._log_capacity_reached(request, now)
+            blocked_limit_ids.update(request.limit_ids)
+            still_waiting.append(request)
+
+        self._waiting_requests = still_waiting
+        if next_wake_up is not None:
+            self._wake_up_handle = asyncio.get_event_loop().call_later(
+                max(0.0, next_wake_up - now) + WAKE_UP_DELAY, self._process_waiting_requests
+            )
+
+    def _log_capacity_reached(self, request: PendingRequest, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            for window, weight in request.limits:
+                if not window.has_capacity(weight, now):
+                    rate_limit: RateLimit = window.rate_limit
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.capacity_used(now)} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    self._last_max_cap_warning_ts = now
+                    break
@@ -0,0 +1,75 @@
+from collections import deque
+from typing import (
+    Deque,
+    Tuple,
+)
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the requests registered against a single RateLimit.
+    Keeps the requests (timestamp and weight) in arrival order and a running total of the weight inside the window,
+    so checking the capacity is O(1) amortized instead of a scan over all the logged tasks.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        :param rate_limit: the RateLimit tracked by the window
+        :param safety_margin_pct: percentage of the time interval added to the window length
+        """
+        self._rate_limit: RateLimit = rate_limit
+        self._window_length: float = rate_limit.time_interval * (1 + safety_margin_pct)
+        self._entries: Deque[Tuple[float, int]] = deque()
+        self._capacity_used: int = 0
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def limit_id(self) -> str:
+        return self._rate_limit.limit_id
+
+    @property
+    def window_length(self) -> float:
+        return self._window_length
+
+    def capacity_used(self, now: float) -> int:
+        self.expire(now)
+        return self._capacity_used
+
+    def expire(self, now: float):
+        """
+        Removes the requests that are no longer inside the window
+        """
+        while len(self._entries) > 0 and self._entries[0][0] + self._window_length < now:
+            _, weight = self._entries.popleft()
+            self._capacity_used -= weight
+
+    def has_capacity(self, weight: int, now: float) -> bool:
+        self.expire(now)
+        if self._capacity_used == 0:
+            # A request heavier than the limit itself can only run alone, otherwise it would wait forever
+            return True
+        return self._capacity_used + weight <= self._rate_limit.limit
+
+    def register(self, weight: int, now: float):
+        self._entries.append((now, weight))
+        self._capacity_used += weight
+
+    def next_available_time(self, weight: int, now: float) -> float:
+        """
+        Calculates the earliest time at which a request with the specified weight will fit in the window, assuming
+        no other request is registered in the meantime.
+        """
+        if self.has_capacity(weight, now):
+            return now
+        capacity_to_free: int = self._capacity_used + weight - self._rate_limit.limit
+        freed: int = 0
+        for timestamp, entry_weight in self._entries:
+            freed += entry_weight
+            if freed >= capacity_to_free:
+                return timestamp + self._window_length
+        return self._entries[-1][0] + self._window_length
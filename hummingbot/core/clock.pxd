@@ -10,3 +10,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _reactive_tick_interval
+        double _last_tick_time
+        double _tick_request_time
+        object _tick_request_event
+        object _order_book_change_forwarder
+        list _watched_order_books
+        object _reaction_latencies
+
+    cdef c_request_tick(self, double request_time)
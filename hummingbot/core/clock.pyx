@@ -3,14 +3,24 @@
 import asyncio
 import logging
 import time
-from typing import List
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+from libc.math cimport isnan
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
+# Number of reactive ticks kept for the reaction latency statistics
+REACTION_LATENCY_SAMPLES = 1000
+REACTION_LATENCY_REPORT_INTERVAL = 60.0
 
 
 cdef class Clock:
@@ -21,12 +31,15 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 reactive_tick_interval: Optional[float] = None):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param reactive_tick_interval: (real time mode only) if set, the clock also ticks between the regular ticks
+        when a watched order book changes, at least this many seconds after the previous tick
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +49,15 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._reactive_tick_interval = NaN
+        if reactive_tick_interval is not None and clock_mode is ClockMode.REALTIME:
+            self._reactive_tick_interval = reactive_tick_interval
+        self._last_tick_time = 0
+        self._tick_request_time = NaN
+        self._tick_request_event = None
+        self._order_book_change_forwarder = EventForwarder(self._did_change_order_book)
+        self._watched_order_books = []
+        self._reaction_latencies = deque(maxlen=REACTION_LATENCY_SAMPLES)
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +79,63 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def reactive_ticks_enabled(self) -> bool:
+        return not isnan(self._reactive_tick_interval)
+
+    @property
+    def reactive_tick_interval(self) -> float:
+        return self._reactive_tick_interval
+
+    @property
+    def reaction_latency_stats(self) -> Dict[str, float]:
+        """
+        Statistics, in seconds, of the time between an order book change (or a tick request) and the end of the tick
+        handling it, over the last reactive ticks
+        """
+        if len(self._reaction_latencies) == 0:
+            return {"ticks": 0, "mean": NaN, "median": NaN, "p99": NaN, "max": NaN}
+        latencies = np.array(self._reaction_latencies)
+        return {
+            "ticks": len(latencies),
+            "mean": float(latencies.mean()),
+            "median": float(np.median(latencies)),
+            "p99": float(np.percentile(latencies, 99)),
+            "max": float(latencies.max()),
+        }
+
+    def watch_order_book(self, order_book):
+        """
+        Requests a tick whenever the order book changes, if the reactive ticks are enabled.
+        """
+        if not self.reactive_ticks_enabled or order_book in self._watched_order_books:
+            return
+        order_book.add_listener(OrderBookEvent.ChangeEvent, self._order_book_change_forwarder)
+        self._watched_order_books.append(order_book)
+
+    def unwatch_order_book(self, order_book):
+        if order_book in self._watched_order_books:
+            order_book.remove_listener(OrderBookEvent.ChangeEvent, self._order_book_change_forwarder)
+            self._watched_order_books.remove(order_book)
+
+    def request_tick(self, request_time: Optional[float] = None):
+        """
+        Runs a tick as soon as the reactive tick interval allows it, if the reactive ticks are enabled and the clock
+        is running. The requests received before the tick are all handled by it.
+        :param request_time: the time of the event behind the request, used to measure the reaction latency
+        """
+        self.c_request_tick(time.time() if request_time is None else request_time)
+
+    cdef c_request_tick(self, double request_time):
+        if self._tick_request_event is None:
+            return
+        if isnan(self._tick_request_time):
+            self._tick_request_time = request_time
+            self._tick_request_event.set()
+
+    def _did_change_order_book(self, event):
+        self.c_request_tick(event.timestamp)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -68,6 +147,8 @@ cdef class Clock:
             for iterator in self._current_context:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
+        for order_book in list(self._watched_order_books):
+            self.unwatch_order_book(order_book)
 
     def add_iterator(self, iterator: TimeIterator):
         if self._current_context is not None:
@@ -90,6 +171,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_request_time
+            double earliest_reactive_tick_time
+            double last_report_time = now
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -101,16 +185,42 @@ cdef class Clock:
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
 
+        if self.reactive_ticks_enabled:
+            self._tick_request_event = asyncio.Event()
+
         try:
             while True:
                 now = time.time()
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                if self._tick_request_event is None:
+                    # Sleep until the next tick
+                    await asyncio.sleep(next_tick_time - now)
+                    self._current_tick = next_tick_time
+                else:
+                    # Sleep until the next tick or a tick request, whichever comes first
+                    if isnan(self._tick_request_time):
+                        try:
+                            await asyncio.wait_for(self._tick_request_event.wait(), next_tick_time - now)
+                        except asyncio.TimeoutError:
+                            pass
+                    now = time.time()
+                    if not isnan(self._tick_request_time):
+                        # Out of band ticks are spaced by the reactive tick interval, the requests received meanwhile
+                        # are handled by the same tick.
+                        earliest_reactive_tick_time = self._last_tick_time + self._reactive_tick_interval
+                        if now < earliest_reactive_tick_time:
+                            await asyncio.sleep(min(earliest_reactive_tick_time, next_tick_time) - now)
+                    elif now < next_tick_time:
+                        await asyncio.sleep(next_tick_time - now)
+                    self._current_tick = min(time.time(), next_tick_time)
+
+                tick_request_time = self._tick_request_time
+                if self._tick_request_event is not None:
+                    self._tick_request_time = NaN
+                    self._tick_request_event.clear()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
@@ -122,11 +232,28 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
+                self._last_tick_time = time.time()
+                if not isnan(tick_request_time):
+                    self._reaction_latencies.append(self._last_tick_time - tick_request_time)
+                if (self._tick_request_event is not None
+                        and self._last_tick_time - last_report_time >= REACTION_LATENCY_REPORT_INTERVAL):
+                    self.log_reaction_latency_stats()
+                    last_report_time = self._last_tick_time
         finally:
+            self._tick_request_event = None
+            self._tick_request_time = NaN
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def log_reaction_latency_stats(self):
+        stats = self.reaction_latency_stats
+        if stats["ticks"] > 0:
+            self.logger().debug(f"Reaction latency over the last {stats['ticks']} reactive ticks: "
+                                f"mean {stats['mean'] * 1e3:.2f} ms, median {stats['median'] * 1e3:.2f} ms, "
+                                f"p99 {stats['p99'] * 1e3:.2f} ms, max {stats['max'] * 1e3:.2f} ms.")
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
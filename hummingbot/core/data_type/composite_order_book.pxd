@@ -1,4 +1,6 @@
 # distutils: language=c++
+cimport numpy as np
+
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
@@ -6,3 +8,4 @@ cdef class CompositeOrderBook(OrderBook):
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef np.ndarray c_build_depth_array(self, bint is_buy)
@@ -3,6 +3,8 @@
 
 from typing import Iterator
 
+import numpy as np
+
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
@@ -28,6 +30,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_invalidate_depth_cache()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +74,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_depth_cache()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +179,19 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef np.ndarray c_build_depth_array(self, bint is_buy):
+        # The depth queries see the composite entries, i.e. the order book without the amounts already traded
+        cdef:
+            list entries = list(self.ask_entries() if is_buy else self.bid_entries())
+            np.ndarray[np.float64_t, ndim=2] depth = np.empty((len(entries), 4), dtype=np.float64)
+
+        if len(entries) > 0:
+            depth[:, 0] = [entry.price for entry in entries]
+            depth[:, 1] = [entry.amount for entry in entries]
+            np.cumsum(depth[:, 1], out=depth[:, 2])
+            np.cumsum(depth[:, 0] * depth[:, 1], out=depth[:, 3])
+        return depth
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
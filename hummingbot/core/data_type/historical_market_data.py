@@ -0,0 +1,135 @@
+import os
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import List
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+
+MARKET_DATA_DIR_NAME = "market_data"
+
+# Every order book row of a snapshot or diff message is stored as one record. The rows of a message share the
+# timestamp, update id and message type.
+ORDER_BOOK_RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("update_id", "<i8"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+    ("side", "u1"),
+    ("message_type", "u1"),
+])
+
+TRADE_RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+    ("trade_type", "u1"),
+])
+
+BID_SIDE = 0
+ASK_SIDE = 1
+SNAPSHOT_MESSAGE_TYPE = OrderBookMessageType.SNAPSHOT.value
+DIFF_MESSAGE_TYPE = OrderBookMessageType.DIFF.value
+
+
+class MarketDataStream(Enum):
+    ORDER_BOOK = "order_book"
+    TRADES = "trades"
+
+
+def default_market_data_path() -> str:
+    return os.path.join(data_path(), MARKET_DATA_DIR_NAME)
+
+
+def market_data_file_path(root_path: str,
+                          exchange: str,
+                          trading_pair: str,
+                          stream: MarketDataStream,
+                          date: str) -> str:
+    """
+    Builds the path of the file holding the records of a stream for a trading pair on a single UTC day.
+    :param date: the UTC day formatted as YYYYMMDD
+    """
+    return os.path.join(root_path, exchange, trading_pair, f"{stream.value}_{date}.bin")
+
+
+def utc_dates_between(start_timestamp: float, end_timestamp: float) -> List[str]:
+    """
+    Returns the UTC days (formatted as YYYYMMDD) overlapping the time range
+    """
+    current_date = datetime.fromtimestamp(start_timestamp, tz=timezone.utc).date()
+    end_date = datetime.fromtimestamp(end_timestamp, tz=timezone.utc).date()
+    dates = []
+    while current_date <= end_date:
+        dates.append(current_date.strftime("%Y%m%d"))
+        current_date += timedelta(days=1)
+    return dates
+
+
+class HistoricalMarketDataReader:
+    """
+    Loads recorded market data back into NumPy structured arrays.
+    Records are stored as fixed width binary rows in append-only files (one per stream, trading pair and UTC day), so
+    loading them does not require any parsing.
+    """
+
+    def __init__(self, root_path: str, exchange: str):
+        """
+        :param root_path: directory holding the recorded data of all the exchanges
+        :param exchange: name of the exchange the data was recorded from
+        """
+        self._root_path: str = root_path
+        self._exchange: str = exchange
+
+    @property
+    def exchange(self) -> str:
+        return self._exchange
+
+    def load_order_book_records(self, trading_pair: str, start_timestamp: float, end_timestamp: float) -> np.ndarray:
+        """
+        Loads the order book records of a trading pair up to the end timestamp. The returned records start with the
+        last snapshot recorded before (or at) the start timestamp, so the order book state at the start of the range
+        can be rebuilt. If there is no such snapshot all the records of the first day are included.
+        """
+        records = self._load_stream(MarketDataStream.ORDER_BOOK, ORDER_BOOK_RECORD_DTYPE,
+                                    trading_pair, start_timestamp, end_timestamp)
+        records = records[:np.searchsorted(records["timestamp"], end_timestamp, side="right")]
+        start_index = np.searchsorted(records["timestamp"], start_timestamp, side="right")
+        snapshot_indexes = np.flatnonzero(records["message_type"][:start_index] == SNAPSHOT_MESSAGE_TYPE)
+        if len(snapshot_indexes) > 0:
+            last_snapshot_update_id = records["update_id"][snapshot_indexes[-1]]
+            first_row = snapshot_indexes[records["update_id"][snapshot_indexes] == last_snapshot_update_id][0]
+            records = records[first_row:]
+        return records
+
+    def load_trade_records(self, trading_pair: str, start_timestamp: float, end_timestamp: float) -> np.ndarray:
+        """
+        Loads the trades of a trading pair with a timestamp in the range (start_timestamp, end_timestamp]
+        """
+        records = self._load_stream(MarketDataStream.TRADES, TRADE_RECORD_DTYPE,
+                                    trading_pair, start_timestamp, end_timestamp)
+        timestamps = records["timestamp"]
+        return records[np.searchsorted(timestamps, start_timestamp, side="right"):
+                       np.searchsorted(timestamps, end_timestamp, side="right")]
+
+    def _load_stream(self,
+                     stream: MarketDataStream,
+                     dtype: np.dtype,
+                     trading_pair: str,
+                     start_timestamp: float,
+                     end_timestamp: float) -> np.ndarray:
+        chunks = []
+        for date in utc_dates_between(start_timestamp, end_timestamp):
+            file_path = market_data_file_path(self._root_path, self._exchange, trading_pair, stream, date)
+            if os.path.exists(file_path):
+                file_size = os.path.getsize(file_path)
+                # A partially written last record (i.e. the recorder was killed while writing) is ignored
+                count = file_size // dtype.itemsize
+                chunks.append(np.fromfile(file_path, dtype=dtype, count=count))
+        if len(chunks) == 0:
+            return np.empty(0, dtype=dtype)
+        records = np.concatenate(chunks)
+        # Records are appended in arrival order, a stable sort keeps the rows of each message together
+        return records[np.argsort(records["timestamp"], kind="stable")]
@@ -0,0 +1,247 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.historical_market_data import (
+    ASK_SIDE,
+    BID_SIDE,
+    DIFF_MESSAGE_TYPE,
+    ORDER_BOOK_RECORD_DTYPE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_RECORD_DTYPE,
+    MarketDataStream,
+    market_data_file_path,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+# Buffers are grouped by trading pair, stream and UTC date (the destination file)
+BufferKey = Tuple[str, MarketDataStream, str]
+
+
+class MarketDataRecorder:
+    """
+    Records the order book snapshots, diffs and trades of an exchange in the append-only binary files read by
+    HistoricalMarketDataReader.
+
+    Messages are converted to plain tuples and buffered in memory. A background thread converts the buffers into
+    NumPy arrays and appends them to the files. If the writer can not keep up during a burst and the buffers reach
+    the maximum size, the producer writes them itself, so the memory used by the recorder is bounded and no message
+    is lost.
+
+    Every file of the order book stream starts with a snapshot of the order book, so any UTC day can be replayed on
+    its own.
+    """
+    _mdr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdr_logger is None:
+            cls._mdr_logger = logging.getLogger(__name__)
+        return cls._mdr_logger
+
+    def __init__(self,
+                 root_path: str,
+                 exchange: str,
+                 flush_interval: float = 1.0,
+                 max_buffered_records: int = 200000):
+        """
+        :param root_path: directory where the data of all the exchanges is recorded
+        :param exchange: name of the exchange the data is recorded from
+        :param flush_interval: time in seconds between background writes
+        :param max_buffered_records: maximum number of records kept in memory
+        """
+        self._root_path: str = root_path
+        self._exchange: str = exchange
+        self._flush_interval: float = flush_interval
+        self._max_buffered_records: int = max_buffered_records
+
+        self._buffers: Dict[BufferKey, List[Tuple]] = defaultdict(list)
+        self._buffered_records: int = 0
+        self._order_books: Dict[str, OrderBook] = {}
+        self._order_book_dates: Dict[str, str] = {}
+        self._last_day: int = -1
+        self._last_date: str = ""
+        self._condition: threading.Condition = threading.Condition()
+        self._write_lock: threading.Lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stopping: bool = False
+
+        self._written_records: int = 0
+        self._producer_flushes: int = 0
+
+    @property
+    def exchange(self) -> str:
+        return self._exchange
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def buffered_records(self) -> int:
+        with self._condition:
+            return self._buffered_records
+
+    @property
+    def written_records(self) -> int:
+        return self._written_records
+
+    @property
+    def producer_flushes(self) -> int:
+        """
+        Number of times the buffers were full and had to be written by the producer
+        """
+        return self._producer_flushes
+
+    def start(self):
+        if self.started:
+            return
+        self._stopping = False
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketDataRecorder", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes all the buffered records and stops the writer thread.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout)
+            self._writer_thread = None
+        self.flush()
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: Optional[float] = None):
+        """
+        Records the full content of the order book as a snapshot. The order book is also used to write the snapshot
+        at the start of the file of every new UTC day.
+        """
+        try:
+            self._record_order_book(trading_pair, order_book, timestamp or time.time())
+        except Exception:
+            self.logger().error(f"Error recording the order book of {trading_pair}.", exc_info=True)
+
+    def record_message(self, message: OrderBookMessage):
+        """
+        Records a diff, snapshot or trade message. Snapshot messages are recorded as they are, the more recent diffs
+        recorded before them are re-applied on top of them when the data is replayed.
+        """
+        try:
+            self._record_message(message)
+        except Exception:
+            self.logger().error(f"Error recording market data message {message}.", exc_info=True)
+
+    def _record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        date = self._date(timestamp)
+        self._order_books[trading_pair] = order_book
+        self._order_book_dates[trading_pair] = date
+        self._add_records((trading_pair, MarketDataStream.ORDER_BOOK, date),
+                          self._order_book_snapshot_records(order_book, timestamp))
+
+    def _record_message(self, message: OrderBookMessage):
+        timestamp = message.timestamp or time.time()
+        trading_pair = message.trading_pair
+        date = self._date(timestamp)
+        if message.type is OrderBookMessageType.TRADE:
+            content = message.content
+            self._add_records((trading_pair, MarketDataStream.TRADES, date),
+                              [(timestamp,
+                                float(content["price"]),
+                                float(content["amount"]),
+                                int(float(content["trade_type"])))])
+            return
+
+        if (message.type is OrderBookMessageType.DIFF
+                and trading_pair in self._order_books
+                and self._order_book_dates.get(trading_pair) != date):
+            self._record_order_book(trading_pair, self._order_books[trading_pair], timestamp)
+        self._order_book_dates[trading_pair] = date
+        message_type = SNAPSHOT_MESSAGE_TYPE if message.type is OrderBookMessageType.SNAPSHOT else DIFF_MESSAGE_TYPE
+        update_id = message.update_id
+        if message.has_raw_entries:
+            bids = message.content["bids"]
+            asks = message.content["asks"]
+        else:
+            # The message content has the format of the exchange, the entries are decoded by the message class
+            bids = [(row.price, row.amount) for row in message.bids]
+            asks = [(row.price, row.amount) for row in message.asks]
+        records = [(timestamp, update_id, float(price), float(amount), BID_SIDE, message_type)
+                   for price, amount, *_ in bids]
+        records.extend((timestamp, update_id, float(price), float(amount), ASK_SIDE, message_type)
+                       for price, amount, *_ in asks)
+        self._add_records((trading_pair, MarketDataStream.ORDER_BOOK, date), records)
+
+    def flush(self):
+        """
+        Writes all the buffered records in the calling thread.
+        """
+        # The lock keeps the records of a file in order when the producer and the writer thread flush at once
+        with self._write_lock:
+            with self._condition:
+                buffers = self._buffers
+                self._buffers = defaultdict(list)
+                self._buffered_records = 0
+            for (trading_pair, stream, date), records in buffers.items():
+                try:
+                    self._write_records(trading_pair, stream, date, records)
+                except Exception:
+                    self.logger().error(f"Error writing {stream.value} market data for {trading_pair}. "
+                                        f"{len(records)} records have been discarded.", exc_info=True)
+
+    def _add_records(self, key: BufferKey, records: List[Tuple]):
+        with self._condition:
+            self._buffers[key].extend(records)
+            self._buffered_records += len(records)
+            buffers_full = self._buffered_records >= self._max_buffered_records
+            if self._buffered_records >= self._max_buffered_records // 2:
+                self._condition.notify_all()
+        if buffers_full:
+            self._producer_flushes += 1
+            self.flush()
+
+    def _writer_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or self._buffered_records >= self._max_buffered_records // 2,
+                    self._flush_interval
+                )
+                if self._stopping:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                self.logger().error("Unexpected error writing market data.", exc_info=True)
+
+    def _write_records(self, trading_pair: str, stream: MarketDataStream, date: str, records: List[Tuple]):
+        dtype = ORDER_BOOK_RECORD_DTYPE if stream is MarketDataStream.ORDER_BOOK else TRADE_RECORD_DTYPE
+        file_path = market_data_file_path(self._root_path, self._exchange, trading_pair, stream, date)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "ab") as records_file:
+            np.array(records, dtype=dtype).tofile(records_file)
+        self._written_records += len(records)
+
+    @staticmethod
+    def _order_book_snapshot_records(order_book: OrderBook, timestamp: float) -> List[Tuple]:
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        records = [(timestamp, update_id, row.price, row.amount, BID_SIDE, SNAPSHOT_MESSAGE_TYPE)
+                   for row in order_book.bid_entries()]
+        records.extend((timestamp, update_id, row.price, row.amount, ASK_SIDE, SNAPSHOT_MESSAGE_TYPE)
+                       for row in order_book.ask_entries())
+        return records
+
+    def _date(self, timestamp: float) -> str:
+        day = int(timestamp // 86400)
+        if day != self._last_day:
+            self._last_day = day
+            self._last_date = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y%m%d")
+        return self._last_date
@@ -0,0 +1,402 @@
+import asyncio
+import importlib
+import json
+import logging
+import math
+import os
+import struct
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Frames are a (header size, payload size) prefix, a JSON header and a payload of little endian float64
+# [price, amount] entries, the bids first then the asks
+FRAME_PREFIX = struct.Struct(">II")
+
+MarketKey = Tuple[str, str]
+
+
+def encode_frame(header: Dict[str, Any],
+                 bids: Optional[np.ndarray] = None,
+                 asks: Optional[np.ndarray] = None) -> bytes:
+    """
+    Encodes a message of the market data service. The bids and asks are arrays whose first two columns are the price
+    and the amount of the entries.
+    """
+    header = dict(header)
+    payload: bytes = b""
+    if bids is not None and asks is not None:
+        header["bids"] = len(bids)
+        header["asks"] = len(asks)
+        payload = np.concatenate((bids[:, :2], asks[:, :2])).astype("<f8").tobytes()
+    header_bytes: bytes = json.dumps(header).encode("utf8")
+    return FRAME_PREFIX.pack(len(header_bytes), len(payload)) + header_bytes + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[Dict[str, Any], np.ndarray, np.ndarray]:
+    """
+    Reads a message of the market data service.
+    :return: the header, and the bids and asks as n x 2 arrays of [price, amount] (empty without payload)
+    """
+    header_size, payload_size = FRAME_PREFIX.unpack(await reader.readexactly(FRAME_PREFIX.size))
+    header: Dict[str, Any] = json.loads(await reader.readexactly(header_size))
+    entries: np.ndarray = np.frombuffer(await reader.readexactly(payload_size), dtype="<f8").reshape(-1, 2)
+    bids_count: int = header.get("bids", 0)
+    return header, entries[:bids_count], entries[bids_count:]
+
+
+def depth_diff(old_depth: np.ndarray, new_depth: np.ndarray) -> np.ndarray:
+    """
+    Computes the diff entries turning a side of an order book into another one.
+    :param old_depth: the previous depth array of the side (see OrderBook.get_depth_array)
+    :param new_depth: the current depth array of the side
+    :return: the n x 2 array of [price, amount] of the new and updated price levels, and of the removed price levels
+    with a 0 amount
+    """
+    new_prices, new_amounts = new_depth[:, 0], new_depth[:, 1]
+    old_prices, old_amounts = old_depth[:, 0], old_depth[:, 1]
+    if len(old_depth) == 0:
+        changed = np.ones(len(new_depth), dtype=bool)
+    else:
+        order: np.ndarray = np.argsort(old_prices)
+        sorted_prices: np.ndarray = old_prices[order]
+        positions: np.ndarray = np.minimum(np.searchsorted(sorted_prices, new_prices), len(sorted_prices) - 1)
+        changed = (sorted_prices[positions] != new_prices) | (old_amounts[order][positions] != new_amounts)
+    removed: np.ndarray = ~np.isin(old_prices, new_prices)
+    return np.concatenate((
+        np.column_stack((new_prices[changed], new_amounts[changed])),
+        np.column_stack((old_prices[removed], np.zeros(np.count_nonzero(removed)))),
+    ))
+
+
+def create_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
+    """
+    Creates the order book tracker of an exchange or derivative connector, the paper trade connectors use the order
+    books of their exchange.
+    """
+    connector_settings = AllConnectorSettings.get_connector_settings()
+    if connector_name not in connector_settings:
+        raise ValueError(f"Unknown connector {connector_name}.")
+    conn_setting = connector_settings[connector_name]
+    if connector_name.endswith("paper_trade"):
+        conn_setting = connector_settings[conn_setting.parent_name]
+    base_name: str = conn_setting.base_name()
+    module_path: str = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                       f"{base_name}.{base_name}_order_book_tracker"
+    class_name: str = "".join([o.capitalize() for o in base_name.split("_")]) + "OrderBookTracker"
+    try:
+        tracker_class = getattr(importlib.import_module(module_path), class_name)
+    except (ModuleNotFoundError, AttributeError):
+        raise ValueError(f"The connector {connector_name} has no order book tracker.")
+    return tracker_class(trading_pairs=trading_pairs, **conn_setting.add_domain_parameter({}))
+
+
+class _PublishedOrderBook:
+    """
+    The state of an order book last published to the subscribers
+    """
+
+    def __init__(self, order_book: OrderBook, bids: np.ndarray, asks: np.ndarray, update_id: int):
+        self.order_book: OrderBook = order_book
+        self.bids: np.ndarray = bids
+        self.asks: np.ndarray = asks
+        self.update_id: int = update_id
+        self.trade_forwarder: Optional[EventForwarder] = None
+
+
+class _Subscriber:
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer: asyncio.StreamWriter = writer
+        self.markets: Set[MarketKey] = set()
+        # The markets whose next message must be a snapshot
+        self.pending_snapshots: Set[MarketKey] = set()
+
+
+class MarketDataService:
+    """
+    Local service sharing the order books of the exchanges between several bot instances on the same host.
+
+    Each order book is maintained once, by the order book tracker of its exchange, and published over a Unix socket to
+    all the subscribers (see MarketDataServiceOrderBookDataSource). The subscribers get a snapshot when they
+    subscribe, then the diffs of the order book, conflated every publish_interval seconds, and the trades.
+
+    The clients send JSON requests framed like the other messages (see encode_frame()):
+    - {"type": "subscribe", "connector": ..., "trading_pairs": [...]} subscribes to order books
+    - {"type": "snapshot", "connector": ..., "trading_pair": ...} requests one snapshot of an order book
+    - {"type": "last_traded_prices", "connector": ..., "trading_pairs": [...]} requests the last traded prices known
+      for the order books, answered with {"type": "last_traded_prices", "prices": {trading_pair: price}}
+    The order books are tracked from the first request for their market, a tracker is restarted with all its trading
+    pairs when a new trading pair of its exchange is requested.
+    """
+    SNAPSHOT_REQUEST_TIMEOUT = 30.0
+    # Subscribers not reading their messages are disconnected when their write buffer exceeds this size
+    MAX_SUBSCRIBER_BUFFER_SIZE = 16 * 1024 * 1024
+
+    _mds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mds_logger is None:
+            cls._mds_logger = logging.getLogger(__name__)
+        return cls._mds_logger
+
+    def __init__(self,
+                 socket_path: str,
+                 publish_interval: float = 0.05,
+                 tracker_factory: Callable[[str, List[str]], OrderBookTracker] = create_order_book_tracker):
+        """
+        :param socket_path: path of the Unix socket the subscribers connect to
+        :param publish_interval: seconds between the publications of the order book diffs
+        :param tracker_factory: creates the order book tracker of a connector for a list of trading pairs
+        """
+        self._socket_path: str = socket_path
+        self._publish_interval: float = publish_interval
+        self._tracker_factory: Callable[[str, List[str]], OrderBookTracker] = tracker_factory
+        self._trackers: Dict[str, OrderBookTracker] = {}
+        self._tracked_trading_pairs: Dict[str, Set[str]] = {}
+        self._subscribers: Set[_Subscriber] = set()
+        self._published_order_books: Dict[MarketKey, _PublishedOrderBook] = {}
+        self._last_update_id: int = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._publish_task: Optional[asyncio.Task] = None
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    @property
+    def trackers(self) -> Dict[str, OrderBookTracker]:
+        return self._trackers
+
+    @property
+    def subscribers_count(self) -> int:
+        return len(self._subscribers)
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self._socket_path)
+        self._publish_task = safe_ensure_future(self._publish_loop())
+        self.logger().info(f"Market data service listening on {self._socket_path}.")
+
+    def stop(self):
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for subscriber in list(self._subscribers):
+            subscriber.writer.close()
+        self._subscribers.clear()
+        for tracker in self._trackers.values():
+            tracker.stop()
+        self._trackers.clear()
+        self._tracked_trading_pairs.clear()
+        for published in self._published_order_books.values():
+            self._remove_trade_forwarder(published)
+        self._published_order_books.clear()
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
+
+    def track(self, connector_name: str, trading_pairs: List[str]):
+        """
+        Starts tracking order books, the tracker of the connector is restarted if it doesn't track all of them yet.
+        """
+        tracked_trading_pairs: Set[str] = self._tracked_trading_pairs.get(connector_name, set())
+        if set(trading_pairs).issubset(tracked_trading_pairs):
+            return
+        tracked_trading_pairs = tracked_trading_pairs.union(trading_pairs)
+        tracker: OrderBookTracker = self._tracker_factory(connector_name, sorted(tracked_trading_pairs))
+        if connector_name in self._trackers:
+            self._trackers[connector_name].stop()
+        self._trackers[connector_name] = tracker
+        self._tracked_trading_pairs[connector_name] = tracked_trading_pairs
+        tracker.start()
+        self.logger().info(f"Tracking the order books of {connector_name}: {', '.join(sorted(tracked_trading_pairs))}.")
+
+    def _next_update_id(self) -> int:
+        # Increasing across the restarts of the service, so the subscribers never reject the diffs after a snapshot
+        self._last_update_id = max(self._last_update_id + 1, int(time.time() * 1e6))
+        return self._last_update_id
+
+    def _order_book(self, market: MarketKey) -> Optional[OrderBook]:
+        connector_name, trading_pair = market
+        tracker: Optional[OrderBookTracker] = self._trackers.get(connector_name)
+        return tracker.order_books.get(trading_pair) if tracker is not None else None
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        subscriber: _Subscriber = _Subscriber(writer)
+        self._subscribers.add(subscriber)
+        try:
+            while True:
+                request, _, _ = await read_frame(reader)
+                try:
+                    if request["type"] == "subscribe":
+                        self.track(request["connector"], request["trading_pairs"])
+                        markets: Set[MarketKey] = {(request["connector"], trading_pair)
+                                                   for trading_pair in request["trading_pairs"]}
+                        subscriber.pending_snapshots.update(markets - subscriber.markets)
+                        subscriber.markets.update(markets)
+                    elif request["type"] == "snapshot":
+                        writer.write(await self._snapshot_frame(request["connector"], request["trading_pair"]))
+                    elif request["type"] == "last_traded_prices":
+                        writer.write(self._last_traded_prices_frame(request["connector"], request["trading_pairs"]))
+                    else:
+                        raise ValueError(f"Unknown request type {request['type']}.")
+                except (KeyError, ValueError, asyncio.TimeoutError) as e:
+                    writer.write(encode_frame({"type": "error", "message": str(e) or type(e).__name__}))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error handling a market data service client.", exc_info=True)
+        finally:
+            self._subscribers.discard(subscriber)
+            writer.close()
+
+    async def _snapshot_frame(self, connector_name: str, trading_pair: str) -> bytes:
+        self.track(connector_name, [trading_pair])
+        market: MarketKey = (connector_name, trading_pair)
+        deadline: float = time.time() + self.SNAPSHOT_REQUEST_TIMEOUT
+        while self._order_book(market) is None:
+            if time.time() > deadline:
+                raise asyncio.TimeoutError(f"The order book of {trading_pair} on {connector_name} is not available.")
+            await asyncio.sleep(self._publish_interval)
+        order_book: OrderBook = self._order_book(market)
+        return encode_frame(self._message_header("snapshot", market, self._next_update_id()),
+                            order_book.get_depth_array(False),
+                            order_book.get_depth_array(True))
+
+    def _last_traded_prices_frame(self, connector_name: str, trading_pairs: List[str]) -> bytes:
+        prices: Dict[str, float] = {}
+        for trading_pair in trading_pairs:
+            order_book: Optional[OrderBook] = self._order_book((connector_name, trading_pair))
+            if order_book is not None and not math.isnan(order_book.last_trade_price):
+                prices[trading_pair] = order_book.last_trade_price
+        return encode_frame({"type": "last_traded_prices", "connector": connector_name, "prices": prices})
+
+    def _message_header(self, message_type: str, market: MarketKey, update_id: int) -> Dict[str, Any]:
+        return {
+            "type": message_type,
+            "connector": market[0],
+            "trading_pair": market[1],
+            "update_id": update_id,
+            "timestamp": time.time(),
+        }
+
+    async def _publish_loop(self):
+        while True:
+            try:
+                self.publish()
+                await asyncio.sleep(self._publish_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error publishing the order books. Retrying after 1 second.",
+                                    exc_info=True)
+                await asyncio.sleep(1.0)
+
+    def publish(self):
+        """
+        Sends the changes of the subscribed order books since the last publication, and the snapshots the subscribers
+        are waiting for.
+        """
+        subscribers_by_market: Dict[MarketKey, List[_Subscriber]] = {}
+        for subscriber in self._subscribers:
+            for market in subscriber.markets:
+                subscribers_by_market.setdefault(market, []).append(subscriber)
+
+        for market, subscribers in subscribers_by_market.items():
+            order_book: Optional[OrderBook] = self._order_book(market)
+            if order_book is None:
+                continue
+            bids: np.ndarray = order_book.get_depth_array(False)
+            asks: np.ndarray = order_book.get_depth_array(True)
+            published: Optional[_PublishedOrderBook] = self._published_order_books.get(market)
+            diff_frame: Optional[bytes] = None
+            if published is None or published.order_book is not order_book:
+                # New order book (or tracker restarted), everyone starts over from a snapshot
+                if published is not None:
+                    self._remove_trade_forwarder(published)
+                published = _PublishedOrderBook(order_book, bids, asks, self._next_update_id())
+                self._add_trade_forwarder(market, published)
+                self._published_order_books[market] = published
+                for subscriber in subscribers:
+                    subscriber.pending_snapshots.add(market)
+            elif bids is not published.bids or asks is not published.asks:
+                bids_diff: np.ndarray = depth_diff(published.bids, bids)
+                asks_diff: np.ndarray = depth_diff(published.asks, asks)
+                published.bids, published.asks = bids, asks
+                if len(bids_diff) > 0 or len(asks_diff) > 0:
+                    published.update_id = self._next_update_id()
+                    diff_frame = encode_frame(self._message_header("diff", market, published.update_id),
+                                              bids_diff,
+                                              asks_diff)
+
+            snapshot_frame: Optional[bytes] = None
+            for subscriber in subscribers:
+                if market in subscriber.pending_snapshots:
+                    if snapshot_frame is None:
+                        snapshot_frame = encode_frame(self._message_header("snapshot", market, published.update_id),
+                                                      published.bids,
+                                                      published.asks)
+                    subscriber.pending_snapshots.discard(market)
+                    self._send(subscriber, snapshot_frame)
+                elif diff_frame is not None:
+                    self._send(subscriber, diff_frame)
+
+    def _send(self, subscriber: _Subscriber, frame: bytes):
+        if subscriber not in self._subscribers:
+            return
+        transport: asyncio.WriteTransport = subscriber.writer.transport
+        if transport.is_closing():
+            self._subscribers.discard(subscriber)
+            return
+        if transport.get_write_buffer_size() > self.MAX_SUBSCRIBER_BUFFER_SIZE:
+            # The subscriber gets all the order books from a snapshot again when it reconnects
+            self.logger().warning("Disconnecting a market data service subscriber not reading its messages.")
+            self._subscribers.discard(subscriber)
+            subscriber.writer.close()
+            return
+        subscriber.writer.write(frame)
+
+    def _add_trade_forwarder(self, market: MarketKey, published: _PublishedOrderBook):
+        published.trade_forwarder = EventForwarder(lambda trade: self._publish_trade(market, trade))
+        published.order_book.add_listener(OrderBookEvent.TradeEvent, published.trade_forwarder)
+
+    @staticmethod
+    def _remove_trade_forwarder(published: _PublishedOrderBook):
+        if published.trade_forwarder is not None:
+            published.order_book.remove_listener(OrderBookEvent.TradeEvent, published.trade_forwarder)
+            published.trade_forwarder = None
+
+    def _publish_trade(self, market: MarketKey, trade: OrderBookTradeEvent):
+        header: Dict[str, Any] = self._message_header("trade", market, -1)
+        header.update(timestamp=float(trade.timestamp),
+                      price=float(trade.price),
+                      amount=float(trade.amount),
+                      trade_type=float(trade.type.value))
+        frame: bytes = encode_frame(header)
+        for subscriber in list(self._subscribers):
+            if market in subscriber.markets and market not in subscriber.pending_snapshots:
+                self._send(subscriber, frame)
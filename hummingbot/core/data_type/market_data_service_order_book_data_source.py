@@ -0,0 +1,204 @@
+import asyncio
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.market_data_service import encode_frame, read_frame
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.logger import HummingbotLogger
+
+
+class _DiscardedMessages:
+    """
+    Output of the exchange data source listeners whose order book messages are received from the service instead
+    """
+
+    def put_nowait(self, message: OrderBookMessage):
+        pass
+
+    async def put(self, message: OrderBookMessage):
+        pass
+
+
+class MarketDataServiceOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source getting the order books of a connector from the local MarketDataService, instead of
+    connecting to the exchange, so several bot instances share the exchange connections of the service.
+
+    A single connection receives the diffs, snapshots and trades of all the trading pairs. The snapshots and the trades
+    are forwarded to listen_for_order_book_snapshots() and listen_for_trades() by listen_for_order_book_diffs(), which
+    holds the connection.
+
+    The other attributes (e.g. the funding info of the perpetual connectors) are looked up in the exchange data source
+    it replaces, if any. The exchange subscriptions are kept when they also feed the funding info listeners of the
+    exchange data source, see listen_for_subscriptions().
+    """
+    RECONNECT_DELAY = 5.0
+
+    _mdsobds_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdsobds_logger is None:
+            cls._mdsobds_logger = logging.getLogger(__name__)
+        return cls._mdsobds_logger
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 connector_name: str,
+                 socket_path: str,
+                 exchange_data_source: Optional[OrderBookTrackerDataSource] = None):
+        """
+        :param trading_pairs: the trading pairs of the order books
+        :param connector_name: the name of the connector of the order books in the market data service
+        :param socket_path: the path of the Unix socket of the market data service
+        :param exchange_data_source: the data source of the connector, used for the attributes not related to the
+        order book messages
+        """
+        self._exchange_data_source: Optional[OrderBookTrackerDataSource] = exchange_data_source
+        super().__init__(trading_pairs)
+        self._connector_name: str = connector_name
+        self._socket_path: str = socket_path
+        self._snapshot_messages: asyncio.Queue = asyncio.Queue()
+        self._trade_messages: asyncio.Queue = asyncio.Queue()
+
+    def __getattr__(self, name: str) -> Any:
+        exchange_data_source: Optional[OrderBookTrackerDataSource] = self.__dict__.get("_exchange_data_source")
+        if exchange_data_source is None:
+            raise AttributeError(f"{type(self).__name__} object has no attribute {name}")
+        return getattr(exchange_data_source, name)
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        """
+        Returns the last traded prices known by the market data service, the other ones are requested from the
+        exchange data source if any.
+        """
+        reader, writer = await asyncio.open_unix_connection(self._socket_path)
+        try:
+            writer.write(encode_frame({"type": "last_traded_prices", "connector": self._connector_name,
+                                       "trading_pairs": trading_pairs}))
+            header, _, _ = await read_frame(reader)
+        finally:
+            writer.close()
+        if header["type"] == "error":
+            raise IOError(f"Error fetching the last traded prices from the market data service. {header['message']}")
+        prices: Dict[str, float] = header["prices"]
+        missing_trading_pairs: List[str] = [trading_pair for trading_pair in trading_pairs
+                                            if trading_pair not in prices]
+        if len(missing_trading_pairs) > 0 and self._exchange_data_source is not None:
+            args: Dict[str, Any] = {"trading_pairs": missing_trading_pairs}
+            if domain is not None:
+                args["domain"] = domain
+            prices.update(await self._exchange_data_source.get_last_traded_prices(**args))
+        return prices
+
+    async def listen_for_subscriptions(self):
+        """
+        Replaces the exchange websocket subscriptions started by the exchange trackers, the messages are received from
+        the service by listen_for_order_book_diffs(). The subscriptions of the exchange data source are only kept if
+        it gets the funding info from them, and the order book messages they output are then discarded.
+        """
+        exchange_data_source: Optional[OrderBookTrackerDataSource] = self._exchange_data_source
+        if exchange_data_source is None or not hasattr(exchange_data_source, "get_funding_info"):
+            return
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        discarded_messages: _DiscardedMessages = _DiscardedMessages()
+        await safe_gather(
+            exchange_data_source.listen_for_subscriptions(),
+            exchange_data_source.listen_for_order_book_diffs(ev_loop, discarded_messages),
+            exchange_data_source.listen_for_trades(ev_loop, discarded_messages),
+        )
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        reader, writer = await asyncio.open_unix_connection(self._socket_path)
+        try:
+            writer.write(encode_frame({"type": "snapshot", "connector": self._connector_name,
+                                       "trading_pair": trading_pair}))
+            header, bids, asks = await read_frame(reader)
+        finally:
+            writer.close()
+        if header["type"] == "error":
+            raise IOError(f"Error fetching the order book of {trading_pair} from the market data service. "
+                          f"{header['message']}")
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot_message(
+            self._order_book_message(OrderBookMessageType.SNAPSHOT, header, bids, asks))
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        while True:
+            writer: Optional[asyncio.StreamWriter] = None
+            try:
+                reader, writer = await asyncio.open_unix_connection(self._socket_path)
+                writer.write(encode_frame({"type": "subscribe", "connector": self._connector_name,
+                                           "trading_pairs": self._trading_pairs}))
+                await writer.drain()
+                while True:
+                    header, bids, asks = await read_frame(reader)
+                    message_type: str = header["type"]
+                    if message_type == "diff":
+                        output.put_nowait(self._order_book_message(OrderBookMessageType.DIFF, header, bids, asks))
+                    elif message_type == "snapshot":
+                        self._snapshot_messages.put_nowait(
+                            self._order_book_message(OrderBookMessageType.SNAPSHOT, header, bids, asks))
+                    elif message_type == "trade":
+                        self._trade_messages.put_nowait(self._trade_message(header))
+                    elif message_type == "error":
+                        self.logger().error(f"Market data service error: {header['message']}")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error with the market data service connection.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not connect to the market data service at {self._socket_path}. "
+                                    f"Retrying after {self.RECONNECT_DELAY:.0f} seconds..."
+                )
+                await self._sleep(self.RECONNECT_DELAY)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        while True:
+            output.put_nowait(await self._snapshot_messages.get())
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        while True:
+            output.put_nowait(await self._trade_messages.get())
+
+    @staticmethod
+    def _order_book_message(message_type: OrderBookMessageType,
+                            header: Dict[str, Any],
+                            bids: np.ndarray,
+                            asks: np.ndarray) -> OrderBookMessage:
+        return OrderBookMessage(message_type, {
+            "trading_pair": header["trading_pair"],
+            "update_id": header["update_id"],
+            "bids": bids.tolist(),
+            "asks": asks.tolist(),
+        }, timestamp=header["timestamp"])
+
+    @staticmethod
+    def _trade_message(header: Dict[str, Any]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": header["trading_pair"],
+            "trade_type": header["trade_type"],
+            "trade_id": int(header["timestamp"] * 1e6),
+            "update_id": int(header["timestamp"] * 1e6),
+            "price": header["price"],
+            "amount": header["amount"],
+        }, timestamp=header["timestamp"])
@@ -4,6 +4,7 @@ import bisect
 import logging
 import time
 from typing import (
+    Any,
     Dict,
     Iterator,
     List,
@@ -25,8 +26,10 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.order_book_entry_decoder cimport c_decode_order_book_entries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookChangeEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
@@ -36,9 +39,82 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+# Columns of the arrays returned by OrderBook.get_depth_array()
+cdef enum:
+    DEPTH_PRICE = 0
+    DEPTH_AMOUNT = 1
+    DEPTH_CUMULATIVE_AMOUNT = 2
+    DEPTH_CUMULATIVE_QUOTE = 3
+
+
+cdef inline Py_ssize_t c_first_index_reaching(const double[:, :] depth, int column, double value):
+    # First row whose cumulative column reaches the value, or the number of rows if none does
+    cdef:
+        Py_ssize_t low = 0
+        Py_ssize_t high = depth.shape[0]
+        Py_ssize_t middle
+
+    while low < high:
+        middle = (low + high) // 2
+        if not (depth[middle, column] >= value):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline Py_ssize_t c_levels_within_price(const double[:, :] depth, bint is_buy, double price):
+    # Number of levels priced at or better than the price: asks at or below it, bids at or above it
+    cdef:
+        Py_ssize_t low = 0
+        Py_ssize_t high = depth.shape[0]
+        Py_ssize_t middle
+        bint within
+
+    while low < high:
+        middle = (low + high) // 2
+        if is_buy:
+            within = not (depth[middle, DEPTH_PRICE] > price)
+        else:
+            within = not (depth[middle, DEPTH_PRICE] < price)
+        if within:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline double c_cumulative_value(const double[:, :] depth, int column, Py_ssize_t index):
+    # Cumulative value up to and including the row, clamped to the rows of the array
+    if index < 0 or depth.shape[0] == 0:
+        return 0
+    if index >= depth.shape[0]:
+        index = depth.shape[0] - 1
+    return depth[index, column]
+
+
+def _depth_column_at(depth: np.ndarray, column: int, indexes: np.ndarray) -> np.ndarray:
+    result = np.full_like(indexes, NaN, dtype=np.float64)
+    found = indexes < depth.shape[0]
+    result[found] = depth[indexes[found], column]
+    return result
+
+
+def _cumulative_column_before(depth: np.ndarray, column: int, indexes: np.ndarray) -> np.ndarray:
+    # Cumulative value of the rows before each index, i.e. of the first `index` levels
+    cumulative = np.concatenate(([0.0], depth[:, column]))
+    return cumulative[np.minimum(indexes, depth.shape[0])]
+
+
+def _levels_within_prices(depth: np.ndarray, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+    if is_buy:
+        return np.searchsorted(depth[:, DEPTH_PRICE], prices, side="right")
+    return np.searchsorted(-depth[:, DEPTH_PRICE], -prices, side="right")
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.ChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -56,6 +132,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._bid_depth_cache = None
+        self._ask_depth_cache = None
+        self._change_event_depth = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,6 +145,11 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            double min_bid_price
+            double max_ask_price
+            bint is_change_event
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -94,9 +178,27 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        self.c_invalidate_depth_cache()
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        # Signal the changes of the best prices, and the changes within the change event depth of the best prices.
+        if self._snapshots.get(self.ORDER_BOOK_CHANGE_EVENT_TAG) is not None:
+            is_change_event = not (self._best_bid == previous_best_bid and self._best_ask == previous_best_ask)
+            min_bid_price = self._best_bid * (1 - self._change_event_depth)
+            max_ask_price = self._best_ask * (1 + self._change_event_depth)
+            for bid in bids:
+                if is_change_event:
+                    break
+                is_change_event = bid.getPrice() >= min_bid_price
+            for ask in asks:
+                if is_change_event:
+                    break
+                is_change_event = ask.getPrice() <= max_ask_price
+            if is_change_event:
+                self.c_trigger_change_event()
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -134,14 +236,35 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        self.c_invalidate_depth_cache()
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_trigger_change_event()
+
+    cdef c_trigger_change_event(self):
+        if self._snapshots.get(self.ORDER_BOOK_CHANGE_EVENT_TAG) is not None:
+            self.c_trigger_event(self.ORDER_BOOK_CHANGE_EVENT_TAG,
+                                 OrderBookChangeEvent(time.time(), self._best_bid, self._best_ask))
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    @property
+    def change_event_depth(self) -> float:
+        """
+        Relative distance from the best prices within which the diff entries trigger an order book change event.
+        The change events are always triggered when the best prices change or when a snapshot is applied.
+        """
+        return self._change_event_depth
+
+    @change_event_depth.setter
+    def change_event_depth(self, value: float):
+        self._change_event_depth = value
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -198,6 +321,60 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diff(self, bids: List[List[Any]], asks: List[List[Any]], update_id: int):
+        """
+        Applies a diff from the raw entries of an exchange payload, [[price, amount, ...], ...] with the prices and
+        amounts as strings or numbers, without building OrderBookRow objects.
+        """
+        self.c_apply_diffs(c_decode_order_book_entries(bids, update_id),
+                           c_decode_order_book_entries(asks, update_id),
+                           update_id)
+
+    def apply_raw_snapshot(self, bids: List[List[Any]], asks: List[List[Any]], update_id: int):
+        """
+        Applies a snapshot from the raw entries of an exchange payload, see apply_raw_diff()
+        """
+        self.c_apply_snapshot(c_decode_order_book_entries(bids, update_id),
+                              c_decode_order_book_entries(asks, update_id),
+                              update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        if message.has_raw_entries:
+            self.apply_raw_diff(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_diff_messages(self, messages: List[OrderBookMessage]):
+        """
+        Applies several diff messages, in order, as a single update of the order book. The entries of the later
+        messages replace the ones of the earlier messages at the same prices.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            vector[OrderBookEntry] decoded
+
+        if len(messages) == 0:
+            return
+        for message in messages:
+            if message.has_raw_entries:
+                decoded = c_decode_order_book_entries(message.content["bids"], message.update_id)
+                cpp_bids.insert(cpp_bids.end(), decoded.begin(), decoded.end())
+                decoded = c_decode_order_book_entries(message.content["asks"], message.update_id)
+                cpp_asks.insert(cpp_asks.end(), decoded.begin(), decoded.end())
+            else:
+                for row in message.bids:
+                    cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+                for row in message.asks:
+                    cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        self.c_apply_diffs(cpp_bids, cpp_asks, messages[-1].update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        if message.has_raw_entries:
+            self.apply_raw_snapshot(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -281,6 +458,33 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def get_top_levels(self, int depth) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the best `depth` levels of each side of the book as two arrays with columns [price, amount].
+        Bids are sorted by descending price and asks by ascending price.
+        """
+        return self.c_get_top_levels(False, depth), self.c_get_top_levels(True, depth)
+
+    cdef np.ndarray c_get_top_levels(self, bint is_buy, int depth):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            int size = min(depth, <int>(self._ask_book.size() if is_buy else self._bid_book.size()))
+            np.ndarray[np.float64_t, ndim=2] levels = np.empty((size, 2), dtype=np.float64)
+            OrderBookEntry entry
+            int i
+
+        for i in range(size):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            levels[i, 0] = entry.getPrice()
+            levels[i, 1] = entry.getAmount()
+        return levels
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
@@ -319,144 +523,135 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef c_invalidate_depth_cache(self):
+        self._bid_depth_cache = None
+        self._ask_depth_cache = None
+
+    cdef np.ndarray c_build_depth_array(self, bint is_buy):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            size_t size = self._ask_book.size() if is_buy else self._bid_book.size()
+            np.ndarray[np.float64_t, ndim=2] depth = np.empty((size, 4), dtype=np.float64)
+            double cumulative_amount = 0
+            double cumulative_quote = 0
+            OrderBookEntry entry
+            size_t i
+
+        for i in range(size):
+            if is_buy:
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                entry = deref(bid_it)
+                inc(bid_it)
+            cumulative_amount += entry.getAmount()
+            cumulative_quote += entry.getAmount() * entry.getPrice()
+            depth[i, DEPTH_PRICE] = entry.getPrice()
+            depth[i, DEPTH_AMOUNT] = entry.getAmount()
+            depth[i, DEPTH_CUMULATIVE_AMOUNT] = cumulative_amount
+            depth[i, DEPTH_CUMULATIVE_QUOTE] = cumulative_quote
+        return depth
+
+    cdef np.ndarray c_get_depth_array(self, bint is_buy):
+        cdef:
+            np.ndarray depth = self._ask_depth_cache if is_buy else self._bid_depth_cache
+
+        if depth is None:
+            depth = self.c_build_depth_array(is_buy)
+            depth.setflags(write=False)
+            if is_buy:
+                self._ask_depth_cache = depth
+            else:
+                self._bid_depth_cache = depth
+        return depth
+
+    def get_depth_array(self, is_buy: bool) -> np.ndarray:
+        """
+        Returns a read only array with columns [price, amount, cumulative amount, cumulative quote volume] for the
+        asks (is_buy) sorted by ascending price, or the bids sorted by descending price.
+
+        The array is built on the first query after the order book changes and reused until the next diff or
+        snapshot, so repeated depth queries on an unchanged book are binary searches over it.
+        """
+        return self.c_get_depth_array(is_buy)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
+            const double[:, :] depth = self.c_get_depth_array(is_buy)
+            Py_ssize_t index = c_first_index_reaching(depth, DEPTH_CUMULATIVE_AMOUNT, volume)
+            double cumulative_volume = c_cumulative_value(depth, DEPTH_CUMULATIVE_AMOUNT, index)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-
+        if index < depth.shape[0]:
+            result_price = depth[index, DEPTH_PRICE]
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            const double[:, :] depth = self.c_get_depth_array(is_buy)
+            Py_ssize_t index = c_first_index_reaching(depth, DEPTH_CUMULATIVE_AMOUNT, volume)
             double total_cost = 0
-            double total_volume = 0
+            double total_volume = c_cumulative_value(depth, DEPTH_CUMULATIVE_AMOUNT, index)
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
 
+        if index < depth.shape[0]:
+            # Take the levels before the one reaching the volume, and only the missing amount of that one
+            total_volume = c_cumulative_value(depth, DEPTH_CUMULATIVE_AMOUNT, index - 1)
+            total_cost = c_cumulative_value(depth, DEPTH_CUMULATIVE_QUOTE, index - 1)
+            total_cost += (volume - total_volume) * depth[index, DEPTH_PRICE]
+            total_volume += volume - total_volume
+            result_vwap = total_cost / total_volume
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
+            const double[:, :] depth = self.c_get_depth_array(is_buy)
+            Py_ssize_t index = c_first_index_reaching(depth, DEPTH_CUMULATIVE_QUOTE, quote_volume)
+            double cumulative_volume = c_cumulative_value(depth, DEPTH_CUMULATIVE_QUOTE, index)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-
+        if index < depth.shape[0]:
+            result_price = depth[index, DEPTH_PRICE]
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-
+            const double[:, :] depth = self.c_get_depth_array(is_buy)
+            Py_ssize_t index = c_first_index_reaching(depth, DEPTH_CUMULATIVE_AMOUNT, base_amount)
+            double cumulative_volume = c_cumulative_value(depth, DEPTH_CUMULATIVE_QUOTE, index)
+
+        if index < depth.shape[0]:
+            cumulative_volume = (c_cumulative_value(depth, DEPTH_CUMULATIVE_QUOTE, index - 1)
+                                 + (base_amount - c_cumulative_value(depth, DEPTH_CUMULATIVE_AMOUNT, index - 1))
+                                 * depth[index, DEPTH_PRICE])
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            const double[:, :] depth = self.c_get_depth_array(is_buy)
+            Py_ssize_t levels = c_levels_within_price(depth, is_buy, price)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        if levels > 0:
+            result_price = depth[levels - 1, DEPTH_PRICE]
+        return OrderBookQueryResult(price,
+                                    NaN,
+                                    result_price,
+                                    c_cumulative_value(depth, DEPTH_CUMULATIVE_AMOUNT, levels - 1))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            const double[:, :] depth = self.c_get_depth_array(is_buy)
+            Py_ssize_t levels = c_levels_within_price(depth, is_buy, price)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        if levels > 0:
+            result_price = depth[levels - 1, DEPTH_PRICE]
+        return OrderBookQueryResult(price,
+                                    NaN,
+                                    result_price,
+                                    c_cumulative_value(depth, DEPTH_CUMULATIVE_QUOTE, levels - 1))
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -476,6 +671,53 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_price_for_volume. Returns the price of the level reaching each volume, or NaN when the
+        side of the book does not hold enough volume.
+        """
+        depth = self.c_get_depth_array(is_buy)
+        indexes = np.searchsorted(depth[:, DEPTH_CUMULATIVE_AMOUNT], np.asarray(volumes, dtype=np.float64))
+        return _depth_column_at(depth, DEPTH_PRICE, indexes)
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_vwap_for_volume. Returns the average price of taking each volume from the book, or NaN
+        when the side of the book does not hold enough volume.
+        """
+        depth = self.c_get_depth_array(is_buy)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        indexes = np.searchsorted(depth[:, DEPTH_CUMULATIVE_AMOUNT], volumes)
+        previous_volumes = _cumulative_column_before(depth, DEPTH_CUMULATIVE_AMOUNT, indexes)
+        previous_costs = _cumulative_column_before(depth, DEPTH_CUMULATIVE_QUOTE, indexes)
+        prices = _depth_column_at(depth, DEPTH_PRICE, indexes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (previous_costs + (volumes - previous_volumes) * prices) / volumes
+
+    def get_prices_for_quote_volumes(self, is_buy: bool, quote_volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_price_for_quote_volume.
+        """
+        depth = self.c_get_depth_array(is_buy)
+        indexes = np.searchsorted(depth[:, DEPTH_CUMULATIVE_QUOTE], np.asarray(quote_volumes, dtype=np.float64))
+        return _depth_column_at(depth, DEPTH_PRICE, indexes)
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_volume_for_price. Returns the amount available at each price or better.
+        """
+        depth = self.c_get_depth_array(is_buy)
+        levels = _levels_within_prices(depth, is_buy, np.asarray(prices, dtype=np.float64))
+        return _cumulative_column_before(depth, DEPTH_CUMULATIVE_AMOUNT, levels)
+
+    def get_quote_volumes_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_quote_volume_for_price. Returns the quote volume available at each price or better.
+        """
+        depth = self.c_get_depth_array(is_buy)
+        levels = _levels_within_prices(depth, is_buy, np.asarray(prices, dtype=np.float64))
+        return _cumulative_column_before(depth, DEPTH_CUMULATIVE_QUOTE, levels)
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -487,6 +729,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
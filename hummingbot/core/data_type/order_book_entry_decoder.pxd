@@ -0,0 +1,8 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef vector[OrderBookEntry] c_decode_order_book_entries(object entries, int64_t update_id) except *
@@ -0,0 +1,63 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from typing import Any, Sequence
+
+import numpy as np
+
+from libc.stdlib cimport strtod
+
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+
+
+cdef inline double c_to_double(object value) except? -1:
+    cdef:
+        const char *text
+        char *end
+        Py_ssize_t size
+        double result
+
+    if type(value) is float:
+        return <double>value
+    if type(value) is str:
+        text = PyUnicode_AsUTF8AndSize(value, &size)
+        result = strtod(text, &end)
+        if size > 0 and end == text + size:
+            return result
+    # Anything strtod() can't parse entirely is left to Python, which also raises the conversion errors
+    return float(value)
+
+
+cdef vector[OrderBookEntry] c_decode_order_book_entries(object entries, int64_t update_id) except *:
+    """
+    Decodes the raw order book entries of an exchange payload, [[price, amount, ...], ...] with the prices and amounts
+    as strings or numbers, without creating any intermediate Python object.
+    """
+    cdef:
+        vector[OrderBookEntry] result
+        object entry
+
+    result.reserve(len(entries))
+    for entry in entries:
+        result.push_back(OrderBookEntry(c_to_double(entry[0]), c_to_double(entry[1]), update_id))
+    return result
+
+
+def decode_order_book_entries(entries: Sequence[Sequence[Any]], update_id: int) -> np.ndarray:
+    """
+    Decodes the raw order book entries of an exchange payload, [[price, amount, ...], ...] with the prices and amounts
+    as strings or numbers.
+    :return: an array with 3 columns, [price, amount, update_id], as expected by OrderBook.apply_numpy_diffs()
+    """
+    cdef:
+        vector[OrderBookEntry] decoded = c_decode_order_book_entries(entries, update_id)
+        double[:, :] result_view
+        size_t i
+
+    result = np.empty((decoded.size(), 3), dtype="float64")
+    result_view = result
+    for i in range(decoded.size()):
+        result_view[i, 0] = decoded[i].getPrice()
+        result_view[i, 1] = decoded[i].getAmount()
+        result_view[i, 2] = <double>decoded[i].getUpdateId()
+    return result
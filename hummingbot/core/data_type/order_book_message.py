@@ -24,6 +24,18 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     content: Dict[str, any]
     timestamp: float
 
+    # True when content["bids"] and content["asks"] hold the raw [price, amount, ...] entries of the exchange payload,
+    # so the order book can decode them directly instead of going through the bids and asks properties
+    has_raw_entries: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Messages redefining bids or asks have their own content format, unless they declare the contrary
+        if "has_raw_entries" not in cls.__dict__:
+            cls.has_raw_entries = (cls.has_raw_entries
+                                   and cls.bids is OrderBookMessage.bids
+                                   and cls.asks is OrderBookMessage.asks)
+
     def __new__(
         cls,
         message_type: OrderBookMessageType,
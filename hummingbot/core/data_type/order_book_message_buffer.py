@@ -0,0 +1,202 @@
+import asyncio
+import time
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class OrderBookMessageBuffer:
+    """
+    Unbounded buffer of the messages of one order book, filled by the data source (through OrderBookMessageRouter)
+    and drained by the task tracking the order book.
+
+    It can be used as an asyncio.Queue with put(), put_nowait(), get(), get_nowait() and qsize(). drain() returns
+    all the pending messages at once, so they can be applied to the order book in a single update. The buffer also
+    keeps the statistics of the queue depth and of the apply lag, the time between the arrival of a message and its
+    application, reported by the tracking task through record_applied().
+
+    When a market data recorder is set, the messages are recorded as they are buffered, so the order book messages
+    are recorded whichever way the tracking task applies them.
+    """
+
+    def __init__(self, market_data_recorder: Optional[MarketDataRecorder] = None):
+        self._market_data_recorder: Optional[MarketDataRecorder] = market_data_recorder
+        self._messages: Deque[Tuple[OrderBookMessage, float]] = deque()
+        self._message_available: asyncio.Event = asyncio.Event()
+        self._oldest_drained_message_time: Optional[float] = None
+        self._max_queue_depth: int = 0
+        self._applied_messages: int = 0
+        self._applied_batches: int = 0
+        self._apply_lag_sum: float = 0
+        self._max_apply_lag: float = 0
+        self._last_apply_lag: float = 0
+
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    def set_market_data_recorder(self, recorder: Optional[MarketDataRecorder]):
+        self._market_data_recorder = recorder
+
+    def qsize(self) -> int:
+        return len(self._messages)
+
+    def empty(self) -> bool:
+        return len(self._messages) == 0
+
+    def put_nowait(self, message: OrderBookMessage):
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record_message(message)
+        self._messages.append((message, time.perf_counter()))
+        self._max_queue_depth = max(self._max_queue_depth, len(self._messages))
+        self._message_available.set()
+
+    async def put(self, message: OrderBookMessage):
+        self.put_nowait(message)
+
+    def get_nowait(self) -> OrderBookMessage:
+        if len(self._messages) == 0:
+            raise asyncio.QueueEmpty()
+        message, _ = self._messages.popleft()
+        if len(self._messages) == 0:
+            self._message_available.clear()
+        return message
+
+    async def get(self) -> OrderBookMessage:
+        while len(self._messages) == 0:
+            await self._message_available.wait()
+        return self.get_nowait()
+
+    async def drain(self) -> List[OrderBookMessage]:
+        """
+        Waits for at least one message, and returns all the pending messages in arrival order.
+        """
+        while len(self._messages) == 0:
+            await self._message_available.wait()
+        self._oldest_drained_message_time = self._messages[0][1]
+        messages = [message for message, _ in self._messages]
+        self._messages.clear()
+        self._message_available.clear()
+        return messages
+
+    def record_applied(self, messages_count: int):
+        """
+        Records the application of the messages returned by the last drain() call.
+        """
+        if self._oldest_drained_message_time is None:
+            return
+        lag = time.perf_counter() - self._oldest_drained_message_time
+        self._oldest_drained_message_time = None
+        self._applied_messages += messages_count
+        self._applied_batches += 1
+        self._apply_lag_sum += lag
+        self._max_apply_lag = max(self._max_apply_lag, lag)
+        self._last_apply_lag = lag
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        The queue depth statistics, and the apply lag statistics in seconds (measured for the oldest message of each
+        applied batch)
+        """
+        return {
+            "queue_depth": len(self._messages),
+            "max_queue_depth": self._max_queue_depth,
+            "applied_messages": self._applied_messages,
+            "applied_batches": self._applied_batches,
+            "mean_apply_lag": self._apply_lag_sum / self._applied_batches if self._applied_batches > 0 else 0,
+            "max_apply_lag": self._max_apply_lag,
+            "last_apply_lag": self._last_apply_lag,
+        }
+
+
+class OrderBookMessageRouter:
+    """
+    Routes the order book messages to the buffers of their order books as soon as the data source outputs them. It
+    replaces the asyncio.Queue given to OrderBookTrackerDataSource.listen_for_order_book_diffs(), so the messages
+    don't have to go through an intermediate queue and a routing task.
+
+    The messages of the tracked trading pairs whose order book is not registered yet (their initial snapshot is still
+    being fetched) are kept, and passed to the buffer once the order book is registered, except the ones older than
+    its snapshot. The diffs older than the snapshot of their order book, and the messages of the trading pairs not
+    tracked, are rejected.
+    """
+    EARLY_MESSAGES_LIMIT = 10000
+
+    def __init__(self,
+                 buffers: Dict[str, asyncio.Queue],
+                 order_books: Dict[str, OrderBook],
+                 trading_pairs: Optional[List[str]] = None):
+        """
+        :param buffers: the message buffers (or queues) by trading pair, shared with the tracker
+        :param order_books: the order books by trading pair, shared with the tracker
+        :param trading_pairs: the tracked trading pairs, shared with the tracker
+        """
+        self.bind(buffers, order_books, trading_pairs)
+        self._early_messages: Dict[str, Deque[OrderBookMessage]] = {}
+        self._messages_accepted: int = 0
+        self._messages_rejected: int = 0
+
+    def bind(self,
+             buffers: Dict[str, asyncio.Queue],
+             order_books: Dict[str, OrderBook],
+             trading_pairs: Optional[List[str]] = None):
+        """
+        Sets the containers shared with the tracker, for trackers replacing them after the router creation.
+        """
+        self._buffers: Dict[str, asyncio.Queue] = buffers
+        self._order_books: Dict[str, OrderBook] = order_books
+        self._trading_pairs: List[str] = trading_pairs if trading_pairs is not None else []
+
+    @property
+    def messages_accepted(self) -> int:
+        return self._messages_accepted
+
+    @property
+    def messages_rejected(self) -> int:
+        return self._messages_rejected
+
+    def put_nowait(self, message: OrderBookMessage):
+        trading_pair: str = message.trading_pair
+        buffer: Optional[asyncio.Queue] = self._buffers.get(trading_pair)
+        if buffer is None:
+            if trading_pair in self._trading_pairs:
+                self._early_messages.setdefault(
+                    trading_pair, deque(maxlen=self.EARLY_MESSAGES_LIMIT)).append(message)
+            else:
+                self._messages_rejected += 1
+            return
+        if trading_pair in self._early_messages:
+            self.register_order_book(trading_pair)
+        self._route(message, buffer)
+
+    async def put(self, message: OrderBookMessage):
+        self.put_nowait(message)
+
+    def register_order_book(self, trading_pair: str):
+        """
+        Passes the messages received before the order book of the trading pair was registered to its buffer, except
+        the ones older than the order book snapshot.
+        """
+        early_messages: Deque[OrderBookMessage] = self._early_messages.pop(trading_pair, deque())
+        buffer: asyncio.Queue = self._buffers[trading_pair]
+        for message in early_messages:
+            self._route(message, buffer)
+
+    def _route(self, message: OrderBookMessage, buffer: asyncio.Queue):
+        # Check the order book's initial update ID. If it's larger, don't bother.
+        if message.type is OrderBookMessageType.DIFF and \
+                self._order_books[message.trading_pair].snapshot_uid > message.update_id:
+            self._messages_rejected += 1
+            return
+        buffer.put_nowait(message)
+        self._messages_accepted += 1
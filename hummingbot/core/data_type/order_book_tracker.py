@@ -10,16 +10,19 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
 )
 
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message_buffer import OrderBookMessageBuffer, OrderBookMessageRouter
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 from .order_book_message import (
     OrderBookMessage,
@@ -37,6 +40,9 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Upper bound on in-flight snapshot requests while bootstrapping the order books. The effective request rate is
+    # still enforced by the AsyncThrottler used by the data source for its REST calls.
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -50,11 +56,15 @@ class OrderBookTracker(ABC):
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._ready_trading_pairs: Set[str] = set()
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
-        self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
+        self._tracking_message_queues: Dict[str, OrderBookMessageBuffer] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_message_router: OrderBookMessageRouter = OrderBookMessageRouter(
+            self._tracking_message_queues, self._order_books, self._trading_pairs)
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
@@ -80,6 +90,63 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> Set[str]:
+        """
+        Returns the trading pairs whose order book has already been initialized and is being tracked
+        """
+        return set(self._ready_trading_pairs)
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._ready_trading_pairs
+
+    @property
+    def handles_generic_order_book_messages(self) -> bool:
+        """
+        True if the tracker applies the order book messages through the generic OrderBookMessage interface (type,
+        trading pair, update id, bids and asks), so its data source can be replaced by a data source not specific to
+        the exchange (see set_data_source()). It is the case of the base _track_single_book, the trackers applying
+        the messages in their own _track_single_book override this property when they do it the same way.
+        """
+        return type(self)._track_single_book is OrderBookTracker._track_single_book
+
+    def set_data_source(self, data_source: OrderBookTrackerDataSource):
+        """
+        Replaces the source of the order book messages, before the tracker is started. The new data source creates
+        the order books with the function of the previous one.
+        """
+        data_source.order_book_create_function = self._data_source.order_book_create_function
+        self._data_source = data_source
+
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    def set_market_data_recorder(self, recorder: Optional[MarketDataRecorder]):
+        """
+        Enables (or disables, with None) the recording of the order book snapshots, diffs and trades applied by the
+        tracker. The order book messages are recorded by the buffers of the order books (see OrderBookMessageBuffer),
+        which the messages of the trackers handling generic order book messages go through.
+        """
+        self._market_data_recorder = recorder
+        for message_queue in self._tracking_message_queues.values():
+            if isinstance(message_queue, OrderBookMessageBuffer):
+                message_queue.set_market_data_recorder(recorder)
+        if recorder is not None:
+            for trading_pair, order_book in self._order_books.items():
+                recorder.record_order_book(trading_pair, order_book)
+
+    @property
+    def message_queue_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        The queue depth and apply lag statistics of the messages of each order book, see OrderBookMessageBuffer.stats
+        """
+        return {
+            trading_pair: message_queue.stats
+            for trading_pair, message_queue in self._tracking_message_queues.items()
+            if isinstance(message_queue, OrderBookMessageBuffer)
+        }
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -89,6 +156,7 @@ class OrderBookTracker(ABC):
 
     def start(self):
         self.stop()
+        self._bind_message_router()
         self._init_order_books_task = safe_ensure_future(
             self._init_order_books()
         )
@@ -96,7 +164,9 @@ class OrderBookTracker(ABC):
             self._emit_trade_event_loop()
         )
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(
+                self._ev_loop,
+                self._order_book_message_router if self._routes_diffs_directly else self._order_book_diff_stream)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -104,9 +174,10 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_listener_task = safe_ensure_future(
             self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
+        if not self._routes_diffs_directly:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -114,6 +185,15 @@ class OrderBookTracker(ABC):
             self._update_last_trade_prices_loop()
         )
 
+    def _bind_message_router(self):
+        # Some trackers replace the order book containers after calling the base constructor
+        self._order_book_message_router.bind(self._tracking_message_queues, self._order_books, self._trading_pairs)
+
+    @property
+    def _routes_diffs_directly(self) -> bool:
+        # The data source outputs the diffs straight to the order book buffers, unless the tracker has its own router
+        return type(self)._order_book_diff_router is OrderBookTracker._order_book_diff_router
+
     def stop(self):
         if self._init_order_books_task is not None:
             self._init_order_books_task.cancel()
@@ -144,6 +224,7 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        self._ready_trading_pairs.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -178,49 +259,68 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books.
+        Snapshots are requested concurrently (bounded by MAX_CONCURRENT_SNAPSHOT_REQUESTS and rate limited by the
+        data source throttler). Each order book starts being tracked as soon as its snapshot is available.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._bind_message_router()
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        completed: List[str] = []
+
+        async def init_single_order_book(trading_pair: str):
+            async with semaphore:
+                order_book: OrderBook = await self._fetch_initial_order_book(trading_pair)
+            self._order_books[trading_pair] = order_book
+            if self._market_data_recorder is not None:
+                self._market_data_recorder.record_order_book(trading_pair, order_book)
+            self._tracking_message_queues[trading_pair] = OrderBookMessageBuffer(self._market_data_recorder)
+            # The messages received while the snapshot was being fetched are passed to the new buffer
+            self._order_book_message_router.register_order_book(trading_pair)
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            self._ready_trading_pairs.add(trading_pair)
+            completed.append(trading_pair)
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+                               f"{len(completed)}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_single_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _fetch_initial_order_book(self, trading_pair: str) -> OrderBook:
+        while True:
+            try:
+                return await self._initial_order_book_for_trading_pair(trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching the initial order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not fetch the order book for {trading_pair}. Retrying after 5 seconds."
+                )
+                await self._sleep(5.0)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
+        Only used when the diffs are not routed directly by the data source, see _routes_diffs_directly.
         """
         last_message_timestamp: float = time.time()
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-        await self._order_books_initialized.wait()
+        router: OrderBookMessageRouter = self._order_book_message_router
+        messages_accepted: int = router.messages_accepted
+        messages_rejected: int = router.messages_rejected
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
+                # The diffs of the order books whose snapshot is being fetched are kept until they are registered
+                router.put_nowait(ob_message)
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
-                    messages_accepted = 0
-                    messages_rejected = 0
+                    self.logger().debug(f"Diff messages processed: {router.messages_accepted - messages_accepted}, "
+                                        f"rejected: {router.messages_rejected - messages_rejected}")
+                    messages_accepted = router.messages_accepted
+                    messages_rejected = router.messages_rejected
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -233,15 +333,10 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
-                trading_pair: str = ob_message.trading_pair
-                if trading_pair not in self._tracking_message_queues:
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                await message_queue.put(ob_message)
+                self._order_book_message_router.put_nowait(ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -252,40 +347,55 @@ class OrderBookTracker(ABC):
         past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+        message_queue: OrderBookMessageBuffer = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                # All the pending messages are handled at once, the consecutive diffs in a single order book update
+                messages: List[OrderBookMessage] = await message_queue.drain()
+                diff_messages: List[OrderBookMessage] = []
+                for message in messages:
+                    if message.type is OrderBookMessageType.DIFF:
+                        diff_messages.append(message)
+                    elif message.type is OrderBookMessageType.SNAPSHOT:
+                        self._apply_diff_messages(trading_pair, order_book, diff_messages)
+                        diff_messages_accepted += len(diff_messages)
+                        diff_messages = []
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                        self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                self._apply_diff_messages(trading_pair, order_book, diff_messages)
+                diff_messages_accepted += len(diff_messages)
+                message_queue.record_applied(len(messages))
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    stats: Dict[str, float] = message_queue.stats
+                    self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair} "
+                                        f"(mean apply lag: {stats['mean_apply_lag'] * 1e3:.2f} ms, "
+                                        f"max queue depth: {stats['max_queue_depth']}).")
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _apply_diff_messages(self, trading_pair: str, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        if len(diff_messages) == 0:
+            return
+        order_book.apply_diff_messages(diff_messages)
+        self._past_diffs_windows[trading_pair].extend(diff_messages)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -304,6 +414,8 @@ class OrderBookTracker(ABC):
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                if self._market_data_recorder is not None:
+                    self._market_data_recorder.record_message(trade_message)
 
                 messages_accepted += 1
 
@@ -324,3 +436,9 @@ class OrderBookTracker(ABC):
                     app_warning_msg="Unexpected error routing order book messages. Retrying after 5 seconds."
                 )
                 await asyncio.sleep(5.0)
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
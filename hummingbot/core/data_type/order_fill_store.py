@@ -0,0 +1,219 @@
+import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.logger import HummingbotLogger
+
+s_decimal_0 = Decimal("0")
+
+
+class _SortedFills:
+    """
+    Fills sorted by timestamp, with the timestamps kept in a separate list for binary searches. The oldest fills are
+    evicted by moving the start of the window, and the lists are compacted once the evicted part is as long as the
+    window, so eviction is amortized O(1).
+    """
+
+    def __init__(self):
+        self._fills: List[OrderFilledEvent] = []
+        self._timestamps: List[float] = []
+        self._start: int = 0
+
+    def __len__(self) -> int:
+        return len(self._fills) - self._start
+
+    def add(self, fill: OrderFilledEvent):
+        timestamp = fill.timestamp
+        if len(self) == 0 or timestamp >= self._timestamps[-1]:
+            self._fills.append(fill)
+            self._timestamps.append(timestamp)
+        else:
+            # Fills are reported almost always in order, so this is only for the odd late fill
+            index = bisect_right(self._timestamps, timestamp, self._start)
+            self._fills.insert(index, fill)
+            self._timestamps.insert(index, timestamp)
+
+    def evict_oldest(self) -> OrderFilledEvent:
+        fill = self._fills[self._start]
+        self._fills[self._start] = None
+        self._start += 1
+        if self._start >= len(self._fills) - self._start:
+            del self._fills[:self._start]
+            del self._timestamps[:self._start]
+            self._start = 0
+        return fill
+
+    def slice(self, start_timestamp: Optional[float] = None, end_timestamp: Optional[float] = None,
+              include_start: bool = True) -> List[OrderFilledEvent]:
+        start = self._start
+        end = len(self._fills)
+        if start_timestamp is not None:
+            bisect_function = bisect_left if include_start else bisect_right
+            start = bisect_function(self._timestamps, start_timestamp, self._start)
+        if end_timestamp is not None:
+            end = bisect_left(self._timestamps, end_timestamp, start)
+        return self._fills[start:end]
+
+    def clear(self):
+        self._fills.clear()
+        self._timestamps.clear()
+        self._start = 0
+
+
+class OrderFillStore:
+    """
+    Stores the order filled events of a connector in a window of fixed capacity, indexed by timestamp and trading pair.
+
+    The fills are kept sorted by timestamp, so the fills of a time range or of a trading pair are read as pre-sorted
+    slices without filtering or sorting the whole history. Once the capacity is reached the oldest fills are evicted
+    (a warning is logged the first time), so the fills returned, and the strategy trades read from them, only cover
+    the last capacity fills. Evicted fills are passed to the spill handler, if one is set (e.g. to write them to the
+    trades database), and their balance changes are kept in the running totals, so the balance changes since the
+    store was created remain exact.
+    """
+    _ofs_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ofs_logger is None:
+            cls._ofs_logger = logging.getLogger(__name__)
+        return cls._ofs_logger
+
+    def __init__(self,
+                 capacity: int = 10000,
+                 spill_handler: Optional[Callable[[List[OrderFilledEvent]], None]] = None,
+                 spill_batch_size: int = 100):
+        """
+        :param capacity: maximum number of fills kept in memory
+        :param spill_handler: function called with the evicted fills, in batches of spill_batch_size fills
+        :param spill_batch_size: number of evicted fills passed to the spill handler at once
+        """
+        if capacity < 1:
+            raise ValueError(f"The order fill store capacity must be positive (got {capacity}).")
+        self._capacity: int = capacity
+        self._spill_handler: Optional[Callable[[List[OrderFilledEvent]], None]] = spill_handler
+        self._spill_batch_size: int = spill_batch_size
+        self._pending_spill: List[OrderFilledEvent] = []
+        self._fills: _SortedFills = _SortedFills()
+        self._fills_by_trading_pair: Dict[str, _SortedFills] = defaultdict(_SortedFills)
+        self._balance_changes: Dict[str, Decimal] = {}
+        self._evicted_fills_count: int = 0
+        self._last_evicted_timestamp: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._fills)
+
+    def __iter__(self) -> Iterator[OrderFilledEvent]:
+        return iter(self._fills.slice())
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def spill_handler(self) -> Optional[Callable[[List[OrderFilledEvent]], None]]:
+        return self._spill_handler
+
+    @spill_handler.setter
+    def spill_handler(self, spill_handler: Optional[Callable[[List[OrderFilledEvent]], None]]):
+        self._spill_handler = spill_handler
+
+    @property
+    def evicted_fills_count(self) -> int:
+        return self._evicted_fills_count
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair, fills in self._fills_by_trading_pair.items() if len(fills) > 0]
+
+    def add(self, fill: OrderFilledEvent):
+        self._fills.add(fill)
+        self._fills_by_trading_pair[fill.trading_pair].add(fill)
+        for asset, balance_change in self._fill_balance_changes(fill).items():
+            self._balance_changes[asset] = self._balance_changes.get(asset, s_decimal_0) + balance_change
+        while len(self._fills) > self._capacity:
+            self._evict_oldest()
+
+    def fills(self,
+              trading_pair: Optional[str] = None,
+              start_timestamp: Optional[float] = None,
+              end_timestamp: Optional[float] = None) -> List[OrderFilledEvent]:
+        """
+        Returns the fills sorted by timestamp
+        :param trading_pair: only the fills of this trading pair are returned, if specified
+        :param start_timestamp: only the fills at or after this timestamp are returned, if specified
+        :param end_timestamp: only the fills before this timestamp are returned, if specified
+        """
+        fills = self._fills if trading_pair is None else self._fills_by_trading_pair.get(trading_pair)
+        if fills is None:
+            return []
+        return fills.slice(start_timestamp, end_timestamp)
+
+    def balance_changes(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        Calculates the asset balance changes from the fills after the timestamp. For a BUY fill the quote balance goes
+        down while the base balance goes up, and for a SELL fill it's the opposite. This does not account for fees.
+        Fills already evicted are only accounted for when starting_timestamp is 0, i.e. for all the fills since the
+        store was created.
+        :param starting_timestamp: the fills at or before this timestamp are excluded
+        """
+        if starting_timestamp <= 0:
+            return dict(self._balance_changes)
+        if self._last_evicted_timestamp is not None and starting_timestamp < self._last_evicted_timestamp:
+            self.logger().debug(f"Fills after {starting_timestamp} have been evicted from the order fill store, "
+                                f"only the fills in memory are included in the balance changes.")
+        balances = {}
+        for fill in self._fills.slice(starting_timestamp, include_start=False):
+            for asset, balance_change in self._fill_balance_changes(fill).items():
+                balances[asset] = balances.get(asset, s_decimal_0) + balance_change
+        return balances
+
+    def flush_spill(self):
+        """
+        Passes the evicted fills not spilled yet to the spill handler.
+        """
+        if len(self._pending_spill) == 0:
+            return
+        fills = self._pending_spill
+        self._pending_spill = []
+        if self._spill_handler is None:
+            return
+        try:
+            self._spill_handler(fills)
+        except Exception:
+            self.logger().error(f"Error spilling {len(fills)} order fills.", exc_info=True)
+
+    def clear(self):
+        self.flush_spill()
+        self._fills.clear()
+        self._fills_by_trading_pair.clear()
+        self._balance_changes.clear()
+        self._last_evicted_timestamp = None
+
+    def _evict_oldest(self):
+        if self._evicted_fills_count == 0:
+            self.logger().warning(f"More than {self._capacity} order fills received, the oldest fills are no longer "
+                                  f"kept in memory nor included in the strategy trades. They remain in the trades "
+                                  f"database.")
+        fill = self._fills.evict_oldest()
+        pair_fills = self._fills_by_trading_pair[fill.trading_pair]
+        pair_fills.evict_oldest()
+        if len(pair_fills) == 0:
+            del self._fills_by_trading_pair[fill.trading_pair]
+        self._evicted_fills_count += 1
+        self._last_evicted_timestamp = fill.timestamp
+        if self._spill_handler is not None:
+            self._pending_spill.append(fill)
+            if len(self._pending_spill) >= self._spill_batch_size:
+                self.flush_spill()
+
+    @staticmethod
+    def _fill_balance_changes(fill: OrderFilledEvent) -> Dict[str, Decimal]:
+        base, quote = fill.trading_pair.split("-")[0], fill.trading_pair.split("-")[1]
+        if fill.trade_type is TradeType.BUY:
+            return {base: fill.amount, quote: Decimal("-1") * fill.price * fill.amount}
+        return {base: Decimal("-1") * fill.amount, quote: fill.price * fill.amount}
@@ -7,24 +7,29 @@ from typing import (
     Optional,
 )
 
+from hummingbot.core.data_type.order_fill_store import OrderFillStore
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, order_fill_store: Optional[OrderFillStore] = None):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # Order fill events are kept in an order fill store, because they are required for PnL calculation. The store
+        # has a fixed capacity and keeps the fills indexed by trading pair and timestamp.
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
-        self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
+        self._order_fill_store = order_fill_store if order_fill_store is not None else OrderFillStore()
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return list(self._generic_logged_events) + list(self._order_filled_logged_events)
+        return list(self._generic_logged_events) + self._order_fill_store.fills()
+
+    @property
+    def order_fill_store(self) -> OrderFillStore:
+        return self._order_fill_store
 
     @property
     def event_source(self) -> str:
@@ -32,7 +37,7 @@ cdef class EventLogger(EventListener):
 
     def clear(self):
         self._generic_logged_events.clear()
-        self._order_filled_logged_events.clear()
+        self._order_fill_store.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -51,8 +56,11 @@ cdef class EventLogger(EventListener):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.get(type(event_object), self._generic_logged_events).append(event_object)
         event_object_type = type(event_object)
+        if event_object_type is OrderFilledEvent:
+            self._order_fill_store.add(event_object)
+        else:
+            self._generic_logged_events.append(event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
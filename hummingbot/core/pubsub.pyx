@@ -1,20 +1,11 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/PyRef.cpp
 
 from cpython cimport(
-    PyObject,
     PyWeakref_NewRef,
     PyWeakref_GetObject
 )
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +15,38 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class _DeadListenerCallback:
+    """
+    Weak reference callback removing a collected listener from the pubsub it was registered to. The pubsub itself is
+    only weakly referenced, so the listener weak references stored by a pubsub do not keep it alive.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_weakref
+        int64_t _event_tag
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag):
+        self._pubsub_weakref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, listener_weakref):
+        cdef PubSub pubsub = <object>PyWeakref_GetObject(self._pubsub_weakref)
+        if pubsub is not None:
+            pubsub.c_remove_listener_weakref(self._event_tag, listener_weakref)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem by removing the event listeners as soon as
+    they are garbage collected.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    The listeners of every event tag are stored as weak references with a callback, so a dead listener is removed by
+    its own weak reference callback instead of periodic O(n) sweeps over all the listeners.
+
+    Every event tag also keeps an immutable snapshot (a tuple) of its listener weak references, which is rebuilt only
+    when a listener is added, removed or collected. c_trigger_event() iterates over the snapshot directly, so
+    triggering an event neither sweeps nor copies the listeners, and listeners are still allowed to call
+    c_remove_listener() while the event is being processed. Listeners are called in the order they were added.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +55,9 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self):
+        self._listeners = {}
+        self._snapshots = {}
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -72,94 +76,70 @@ cdef class PubSub:
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+            dict listeners = self._listeners.get(event_tag)
+            object listener_weakref = PyWeakref_NewRef(listener, _DeadListenerCallback(self, event_tag))
+        if listeners is None:
+            listeners = {}
+            self._listeners[event_tag] = listeners
+        # Weak references to live objects compare equal when their referents are equal, so a listener that has
+        # already been added is not added twice.
+        if listener_weakref in listeners:
+            return
+        listeners[listener_weakref] = None
+        self.c_update_snapshot(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
+        self.c_remove_listener_weakref(event_tag, PyWeakref_NewRef(listener, None))
+
+    cdef c_remove_listener_weakref(self, int64_t event_tag, object listener_weakref):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+            dict listeners = self._listeners.get(event_tag)
+        if listeners is None or listener_weakref not in listeners:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+        del listeners[listener_weakref]
+        self.c_update_snapshot(event_tag)
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_update_snapshot(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+            dict listeners = self._listeners.get(event_tag)
+        if listeners:
+            self._snapshots[event_tag] = tuple(listeners)
+        else:
+            self._listeners.pop(event_tag, None)
+            self._snapshots.pop(event_tag, None)
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            tuple snapshot = self._snapshots.get(event_tag)
+            object listener_weakref
+            object listener
 
-        if it == self._events.end():
+        if snapshot is None:
             return []
 
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple snapshot = self._snapshots.get(event_tag)
+            object listener_weakref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
+        if snapshot is None:
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            # A listener collected while the event is being processed is skipped. Its callback has already removed it
+            # from the snapshots of the following events.
+            if listener is None:
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -3,9 +3,12 @@ import logging
 from decimal import Decimal
 from enum import Enum
 from typing import (
+    Any,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
 )
 
 import aiohttp
@@ -18,7 +21,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import convert_from_excha
     kucoin_convert_from_exchange_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateIndex, find_rate
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
@@ -38,12 +41,20 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are indexed with a
+    RateIndex every time they are refreshed, so the rates are resolved once per refresh.
+
+    In streaming mode (only supported by the Binance source) the prices needed to convert between the required tokens
+    are kept up to date with the book ticker websocket streams, and all the other prices are still requested every
+    PRICES_REFRESH_INTERVAL seconds.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
     global_token: str = "USDT"
     global_token_symbol: str = "$"
+    streaming: bool = False
+    # The prices of the sources are cached for 30 seconds
+    PRICES_REFRESH_INTERVAL: float = 30.0
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -57,6 +68,8 @@ class RateOracle(NetworkBase):
     coingecko_supported_vs_tokens_url = "https://api.coingecko.com/api/v3/simple/supported_vs_currencies"
     kucoin_price_url = "https://api.kucoin.com/api/v1/market/allTickers"
     ascend_ex_price_url = "https://ascendex.com/api/pro/v1/ticker"
+    binance_ws_url = "wss://stream.binance.com:9443/ws"
+    binance_us_ws_url = "wss://stream.binance.us:9443/ws"
 
     @classmethod
     def get_instance(cls) -> "RateOracle":
@@ -75,8 +88,11 @@ class RateOracle(NetworkBase):
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_index: Optional[RateIndex] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
+        self._required_tokens: Set[str] = set()
+        self._required_tokens_updated_event = asyncio.Event()
 
     def __str__(self):
         return f"{self.source.name.title()} rate oracle"
@@ -111,6 +127,22 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def required_tokens(self) -> Set[str]:
+        return self._required_tokens.copy()
+
+    def set_required_tokens(self, tokens: Iterable[str]):
+        """
+        Sets the tokens the running strategies need conversion rates for. In streaming mode only the prices used to
+        convert between these tokens (and the global token) are streamed.
+
+        :param tokens: A list of token symbols, e.g. [BTC, USDT]
+        """
+        tokens = set(tokens)
+        if tokens != self._required_tokens:
+            self._required_tokens = tokens
+            self._required_tokens_updated_event.set()
+
     def rate(self, pair: str) -> Decimal:
         """
         Finds a conversion rate for a given symbol, this can be direct or indirect prices as long as it can find a route
@@ -120,7 +152,17 @@ class RateOracle(NetworkBase):
 
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._current_rate_index().rate(pair)
+
+    def rates(self, pairs: Iterable[str]) -> Dict[str, Decimal]:
+        """
+        Finds the conversion rates for a list of symbols, as rate does for each one of them.
+
+        :param pairs: A list of trading pairs, e.g. [BTC-USDT, ETH-USDT]
+
+        :return A dictionary of trading pairs and conversion rates
+        """
+        return self._current_rate_index().rates(pairs)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -175,7 +217,7 @@ class RateOracle(NetworkBase):
     async def fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self.get_prices()
+                self._set_prices(await self.get_prices())
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -185,6 +227,111 @@ class RateOracle(NetworkBase):
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
             await asyncio.sleep(1)
 
+    async def stream_price_loop(self):
+        while True:
+            try:
+                await self._stream_binance_prices()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Error streaming prices from Binance.", exc_info=True,
+                                      app_warning_msg="Couldn't stream the newest prices from Binance. "
+                                                      "Reconnecting in 5 seconds.")
+                await asyncio.sleep(5)
+
+    async def _stream_binance_prices(self):
+        """
+        Requests the prices, subscribes to the book ticker streams of the trading pairs needed to convert between the
+        required tokens, and updates their prices until a stream is closed or the required tokens change. The other
+        prices are refreshed periodically in the meantime.
+        """
+        self._required_tokens_updated_event.clear()
+        # The prices are copied because they are updated in place and the source caches them
+        self._set_prices(dict(await self.get_prices()))
+        if self._prices:
+            self._ready_event.set()
+        trading_pairs_by_domain = await self._streamed_trading_pairs_by_domain()
+        streamed_trading_pairs = {trading_pair
+                                  for trading_pairs in trading_pairs_by_domain.values()
+                                  for trading_pair in trading_pairs}
+        tasks = [safe_ensure_future(self._listen_to_binance_book_tickers(domain, trading_pairs))
+                 for domain, trading_pairs in trading_pairs_by_domain.items()]
+        tasks.append(safe_ensure_future(self._required_tokens_updated_event.wait()))
+        tasks.append(safe_ensure_future(self._refresh_prices_loop(streamed_trading_pairs)))
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _refresh_prices_loop(self, streamed_trading_pairs: Set[str]):
+        """
+        Requests all the prices every PRICES_REFRESH_INTERVAL seconds, keeping the current prices of the streamed
+        trading pairs.
+        """
+        while True:
+            await asyncio.sleep(self.PRICES_REFRESH_INTERVAL)
+            try:
+                prices = dict(await self.get_prices())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
+                                      app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
+                continue
+            for trading_pair in streamed_trading_pairs:
+                if trading_pair in self._prices:
+                    prices[trading_pair] = self._prices[trading_pair]
+            self._set_prices(prices)
+
+    async def _streamed_trading_pairs_by_domain(self) -> Dict[str, List[str]]:
+        tokens = sorted(self._required_tokens | {self.global_token}) if self._required_tokens else []
+        trading_pairs = set()
+        for base in tokens:
+            for quote in tokens:
+                if base != quote:
+                    trading_pairs.update(self._current_rate_index().route(f"{base}-{quote}"))
+
+        com_symbols = (await BinanceAPIOrderBookDataSource.trading_pair_symbol_map(domain="com")).inverse
+        us_symbols = (await BinanceAPIOrderBookDataSource.trading_pair_symbol_map(domain="us")).inverse
+        trading_pairs_by_domain = {}
+        for trading_pair in sorted(trading_pairs):
+            # Same precedence as get_binance_prices, where only the USD pairs of binance.us are used
+            if trading_pair in us_symbols and trading_pair.split("-")[1] == "USD":
+                trading_pairs_by_domain.setdefault("us", []).append(trading_pair)
+            elif trading_pair in com_symbols:
+                trading_pairs_by_domain.setdefault("com", []).append(trading_pair)
+        return trading_pairs_by_domain
+
+    async def _listen_to_binance_book_tickers(self, domain: str, trading_pairs: List[str]):
+        symbol_map = await BinanceAPIOrderBookDataSource.trading_pair_symbol_map(domain=domain)
+        trading_pairs_by_symbol = {symbol_map.inverse[trading_pair]: trading_pair for trading_pair in trading_pairs}
+        url = self.binance_us_ws_url if domain == "us" else self.binance_ws_url
+        client = await self._http_client()
+        async with client.ws_connect(url) as ws:
+            await ws.send_json({
+                "method": "SUBSCRIBE",
+                "params": [f"{symbol.lower()}@bookTicker" for symbol in trading_pairs_by_symbol],
+                "id": 1,
+            })
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+                self._update_price_from_book_ticker(msg.json(), trading_pairs_by_symbol)
+        raise ConnectionError(f"The Binance ({domain}) book ticker stream was closed.")
+
+    def _update_price_from_book_ticker(self, book_ticker: Dict[str, Any], trading_pairs_by_symbol: Dict[str, str]):
+        trading_pair = trading_pairs_by_symbol.get(book_ticker.get("s"))
+        if trading_pair is None:
+            # Subscription results and unrequested symbols
+            return
+        bid_price = Decimal(book_ticker["b"])
+        ask_price = Decimal(book_ticker["a"])
+        if bid_price > 0 and ask_price > 0:
+            self._current_rate_index().update_price(trading_pair, (bid_price + ask_price) / Decimal("2"))
+
     @classmethod
     async def get_prices(cls) -> Dict[str, Decimal]:
         """
@@ -341,16 +488,31 @@ class RateOracle(NetworkBase):
                     results[pair] = Decimal(str(record["current_price"]))
         return results
 
+    def _set_prices(self, prices: Dict[str, Decimal]):
+        # The sources cache their prices, so the same prices are set again until the cache expires
+        if prices is not self._prices:
+            self._prices = prices
+            self._rate_index = RateIndex(prices)
+
+    def _current_rate_index(self) -> RateIndex:
+        if self._rate_index is None or self._rate_index.prices is not self._prices:
+            # The prices have not been indexed yet, or have been replaced without _set_prices
+            self._rate_index = RateIndex(self._prices)
+        return self._rate_index
+
     async def start_network(self):
         await self.stop_network()
-        self._fetch_price_task = safe_ensure_future(self.fetch_price_loop())
+        if self.streaming and self.source == RateOracleSource.binance:
+            self._fetch_price_task = safe_ensure_future(self.stream_price_loop())
+        else:
+            self._fetch_price_task = safe_ensure_future(self.fetch_price_loop())
 
     async def stop_network(self):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
         # Reset stored prices so that they are not used if they are not being updated
-        self._prices = {}
+        self._set_prices({})
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -1,4 +1,5 @@
-from typing import Dict
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
 from decimal import Decimal
 
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -15,22 +16,98 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
-    if pair in prices:
-        return prices[pair]
-    base, quote = pair.split("-")
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = f"{quote}-{base}"
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = base_pair.split("-")[1]
-        link_pair = f"{link_quote}-{quote}"
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = f"{quote}-{link_quote}"
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateIndex(prices).rate(pair)
+
+
+class RateIndex:
+    '''
+    Index of a dictionary of prices to find exchange rates with the same routes as find_rate, without going through
+    all the prices for every rate.
+    The pairs are grouped by base token when the index is created, so the two-hop routes from a token are known in
+    advance, and every resolved rate is memoized. The prices must only be modified through update_price after the
+    index is created.
+    '''
+
+    def __init__(self, prices: Dict[str, Decimal]):
+        '''
+        :param prices: The dictionary of trading pairs and their prices
+        '''
+        self._prices: Dict[str, Decimal] = prices
+        # The first hop of the routes from each token: the quote tokens and the pairs of the token as base
+        self._routes: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for trading_pair in prices:
+            self._add_route(trading_pair)
+        self._rates: Dict[str, Optional[Decimal]] = {}
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        '''
+        Finds the exchange rate for a given trading pair
+        :param pair: The trading pair
+        :return The rate, or None if there is no route for the pair
+        '''
+        if pair in self._rates:
+            return self._rates[pair]
+        rate, _ = self._find_route(pair)
+        self._rates[pair] = rate
+        return rate
+
+    def rates(self, pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        '''
+        Finds the exchange rates for a list of trading pairs
+        :param pairs: The trading pairs
+        :return A dictionary of trading pairs and rates (None for the pairs without route)
+        '''
+        return {pair: self.rate(pair) for pair in pairs}
+
+    def route(self, pair: str) -> List[str]:
+        '''
+        Finds the pairs whose prices are used to calculate the exchange rate of a given trading pair
+        :param pair: The trading pair
+        :return The list of pairs of the route, empty if the rate is 1 or there is no route for the pair
+        '''
+        _, route = self._find_route(pair)
+        return route
+
+    def update_price(self, trading_pair: str, price: Decimal):
+        '''
+        Updates the price of a trading pair. The memoized rates are discarded if the price changes.
+        :param trading_pair: The trading pair
+        :param price: The new price
+        '''
+        current_price = self._prices.get(trading_pair)
+        if current_price == price:
+            return
+        if current_price is None:
+            self._add_route(trading_pair)
+        self._prices[trading_pair] = price
+        self._rates.clear()
+
+    def _add_route(self, trading_pair: str):
+        tokens = trading_pair.split("-")
+        if len(tokens) > 1:
+            self._routes[tokens[0]].append((tokens[1], trading_pair))
+
+    def _find_route(self, pair: str) -> Tuple[Optional[Decimal], List[str]]:
+        prices = self._prices
+        if pair in prices:
+            return prices[pair], [pair]
+        base, quote = pair.split("-")
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1"), []
+        reverse_pair = f"{quote}-{base}"
+        if reverse_pair in prices:
+            return Decimal("1") / prices[reverse_pair], [reverse_pair]
+        for link_quote, base_pair in self._routes.get(base, []):
+            link_pair = f"{link_quote}-{quote}"
+            if link_pair in prices:
+                return prices[base_pair] * prices[link_pair], [base_pair, link_pair]
+            common_denom_pair = f"{quote}-{link_quote}"
+            if common_denom_pair in prices:
+                return prices[base_pair] / prices[common_denom_pair], [base_pair, common_denom_pair]
+        return None, []
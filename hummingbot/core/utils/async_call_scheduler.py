@@ -2,34 +2,197 @@
 
 import asyncio
 from async_timeout import timeout
+from bisect import bisect_left
+from collections import deque
 import logging
+import time
 from typing import (
-    Optional,
     Coroutine,
+    Callable,
+    Deque,
+    Dict,
+    List,
     NamedTuple,
-    Callable
+    Optional,
+    Set,
+    Tuple,
 )
 
 import hummingbot
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
+DEFAULT_LANE = "default"
+SECURITY_LANE = "security"
+CELO_LANE = "celo"
+NOTIFIER_LANE = "notifier"
+
 
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    scheduled_timestamp: float = 0.0
+
+
+class CallTimeHistogram:
+    """
+    Histogram of call times in seconds, with fixed buckets. Each bucket counts the times up to its upper bound, and
+    the last bucket counts the times above all the bounds.
+    """
+    DEFAULT_BUCKET_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+    def __init__(self, bucket_bounds: Tuple[float, ...] = DEFAULT_BUCKET_BOUNDS):
+        self._bucket_bounds: Tuple[float, ...] = tuple(sorted(bucket_bounds))
+        self._counts: List[int] = [0] * (len(self._bucket_bounds) + 1)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        The upper bound and the count of every bucket, the upper bound of the last bucket is infinite
+        """
+        return list(zip(self._bucket_bounds + (float("inf"),), self._counts))
+
+    def add(self, seconds: float):
+        self._counts[bisect_left(self._bucket_bounds, seconds)] += 1
+        self._count += 1
+        self._total += seconds
+        self._max = max(self._max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the upper bound of the bucket containing the percentile, or the maximum time for the last bucket
+        :param percent: the percentile, from 0 to 100
+        """
+        if self._count == 0:
+            return 0.0
+        rank = self._count * percent / 100
+        cumulative_count = 0
+        for bound, count in zip(self._bucket_bounds, self._counts):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return min(bound, self._max)
+        return self._max
+
+
+class AsyncCallSchedulerLane:
+    """
+    Queue of the calls of one kind, with the number of calls of the lane that can run at once, the priority of the
+    lane over the other lanes and the minimum interval between the end of a call and the start of the next one.
+    """
+
+    def __init__(self, name: str, concurrency: int = 1, priority: int = 0, call_interval: float = 0.0):
+        if concurrency < 1:
+            raise ValueError(f"The concurrency of the lane {name} must be positive (got {concurrency}).")
+        self._name: str = name
+        self._concurrency: int = concurrency
+        self._priority: int = priority
+        self._call_interval: float = call_interval
+        self._queue: Deque[AsyncCallSchedulerItem] = deque()
+        self._running_calls: int = 0
+        self._next_call_timestamp: float = 0.0
+        self._wait_time_histogram: CallTimeHistogram = CallTimeHistogram()
+        self._run_time_histogram: CallTimeHistogram = CallTimeHistogram()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def call_interval(self) -> float:
+        return self._call_interval
+
+    @property
+    def queue(self) -> Deque[AsyncCallSchedulerItem]:
+        return self._queue
+
+    @property
+    def running_calls(self) -> int:
+        return self._running_calls
+
+    @property
+    def wait_time_histogram(self) -> CallTimeHistogram:
+        """
+        Time between the scheduling of the calls and their start
+        """
+        return self._wait_time_histogram
+
+    @property
+    def run_time_histogram(self) -> CallTimeHistogram:
+        """
+        Time between the start of the calls and their end, including the calls that failed or timed out
+        """
+        return self._run_time_histogram
+
+    @property
+    def can_start_call(self) -> bool:
+        return len(self._queue) > 0 and self._running_calls < self._concurrency
+
+    def next_call_delay(self, now: float) -> float:
+        """
+        Returns the time in seconds until the call interval since the last call has elapsed
+        """
+        return max(0.0, self._next_call_timestamp - now)
+
+    def start_call(self, item: AsyncCallSchedulerItem, now: float):
+        self._wait_time_histogram.add(now - item.scheduled_timestamp)
+        self._running_calls += 1
+
+    def end_call(self, start_timestamp: float, end_timestamp: float):
+        self._run_time_histogram.add(end_timestamp - start_timestamp)
+        self._running_calls -= 1
+        self._next_call_timestamp = max(self._next_call_timestamp, end_timestamp + self._call_interval)
 
 
 class AsyncCallScheduler:
+    """
+    Runs scheduled coroutines and blocking functions in named lanes. Each lane runs up to its concurrency limit of
+    calls at once, so slow calls of one lane (e.g. Celo CLI calls) don't hold back the calls of the other lanes. When
+    the total number of running calls is limited by max_concurrency, the lanes with the highest priority start their
+    calls first.
+
+    The default lane runs one call at a time with call_interval seconds between calls, like the scheduler did before
+    lanes were added.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
     @classmethod
     def shared_instance(cls):
         if cls._acs_shared_instance is None:
-            cls._acs_shared_instance = AsyncCallScheduler()
+            cls._acs_shared_instance = AsyncCallScheduler(max_concurrency=4)
+            # Decrypting the configs blocks the start of the bot, so it goes before any other call
+            cls._acs_shared_instance.add_lane(SECURITY_LANE, priority=10)
+            cls._acs_shared_instance.add_lane(CELO_LANE, call_interval=1.0)
+            cls._acs_shared_instance.add_lane(NOTIFIER_LANE)
         return cls._acs_shared_instance
 
     @classmethod
@@ -38,15 +201,21 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
+    def __init__(self, call_interval: float = 0.01, max_concurrency: Optional[int] = None):
+        """
+        :param call_interval: interval in seconds between the calls of the default lane
+        :param max_concurrency: maximum number of calls running at once in all the lanes, unlimited if None
+        """
         self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._max_concurrency: Optional[int] = max_concurrency
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-
-    @property
-    def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+        self._lanes: Dict[str, AsyncCallSchedulerLane] = {}
+        self._lanes_by_priority: List[AsyncCallSchedulerLane] = []
+        self._running_calls: int = 0
+        self._call_tasks: Set[asyncio.Task] = set()
+        self._dispatch_event: asyncio.Event = asyncio.Event()
+        self.add_lane(DEFAULT_LANE, call_interval=call_interval)
 
     @property
     def coro_scheduler_task(self) -> Optional[asyncio.Task]:
@@ -56,62 +225,124 @@ class AsyncCallScheduler:
     def started(self) -> bool:
         return self._coro_scheduler_task is not None
 
+    @property
+    def lanes(self) -> Dict[str, AsyncCallSchedulerLane]:
+        return self._lanes
+
+    @property
+    def running_calls(self) -> int:
+        return self._running_calls
+
+    def add_lane(self, name: str, concurrency: int = 1, priority: int = 0, call_interval: float = 0.0):
+        """
+        Adds a lane, or replaces the settings of an existing lane keeping its pending calls.
+        :param name: name of the lane, used to schedule calls in it
+        :param concurrency: maximum number of calls of the lane running at once
+        :param priority: lanes with higher priority start their calls first
+        :param call_interval: interval in seconds between the end of a call and the start of the next one
+        """
+        lane = AsyncCallSchedulerLane(name, concurrency=concurrency, priority=priority, call_interval=call_interval)
+        if name in self._lanes:
+            lane.queue.extend(self._lanes[name].queue)
+        self._lanes[name] = lane
+        self._lanes_by_priority = sorted(self._lanes.values(), key=lambda lane: lane.priority, reverse=True)
+        self._dispatch_event.set()
+
     def start(self):
         if self._coro_scheduler_task is not None:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        self._coro_scheduler_task = safe_ensure_future(self._coro_scheduler())
 
     def stop(self):
         if self._coro_scheduler_task is not None:
             self._coro_scheduler_task.cancel()
             self._coro_scheduler_task = None
+        for call_task in list(self._call_tasks):
+            call_task.cancel()
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    async def _coro_scheduler(self):
         while True:
-            app_warning_msg = "API call error."
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
-            except asyncio.CancelledError:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
-                raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
-
-            try:
-                await asyncio.sleep(interval)
+                self._dispatch_event.clear()
+                next_call_delay = self._start_ready_calls()
+                if next_call_delay is None:
+                    await self._dispatch_event.wait()
+                else:
+                    try:
+                        await asyncio.wait_for(self._dispatch_event.wait(), timeout=next_call_delay)
+                    except asyncio.TimeoutError:
+                        pass
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Scheduler sleep interrupted.", exc_info=True)
+                self.logger().error("Unexpected error scheduling calls.", exc_info=True)
+                await asyncio.sleep(self._call_interval)
+
+    def _start_ready_calls(self) -> Optional[float]:
+        """
+        Starts the calls that can run now, from the lane with the highest priority to the lowest one.
+        :return: the time in seconds until a lane waiting for its call interval can start a call, or None
+        """
+        now = time.monotonic()
+        next_call_delay = None
+        for lane in self._lanes_by_priority:
+            while lane.can_start_call:
+                if self._max_concurrency is not None and self._running_calls >= self._max_concurrency:
+                    return next_call_delay
+                delay = lane.next_call_delay(now)
+                if delay > 0:
+                    next_call_delay = delay if next_call_delay is None else min(next_call_delay, delay)
+                    break
+                item = lane.queue.popleft()
+                if item.future.done():
+                    # The caller is not waiting for the result anymore
+                    if asyncio.iscoroutine(item.coroutine):
+                        item.coroutine.close()
+                    continue
+                lane.start_call(item, now)
+                self._running_calls += 1
+                call_task = safe_ensure_future(self._run_call(lane, item))
+                self._call_tasks.add(call_task)
+                call_task.add_done_callback(self._call_tasks.discard)
+        return next_call_delay
+
+    async def _run_call(self, lane: AsyncCallSchedulerLane, item: AsyncCallSchedulerItem):
+        fut, coro, timeout_seconds, app_warning_msg, _ = item
+        start_timestamp = time.monotonic()
+        try:
+            async with timeout(timeout_seconds):
+                result = await coro
+            if not fut.done():
+                fut.set_result(result)
+        except asyncio.CancelledError:
+            if not fut.done():
+                fut.cancel()
+            raise
+        except Exception as e:
+            # Add exception information.
+            app_warning_msg += f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            if not fut.done():
+                fut.set_exception(e)
+        finally:
+            lane.end_call(start_timestamp, time.monotonic())
+            self._running_calls -= 1
+            self._dispatch_event.set()
 
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  lane: str = DEFAULT_LANE) -> any:
+        if lane not in self._lanes:
+            raise ValueError(f"The async call scheduler has no lane {lane}.")
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
+        self._lanes[lane].queue.append(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                              app_warning_msg=app_warning_msg,
+                                                              scheduled_timestamp=time.monotonic()))
+        self._dispatch_event.set()
         if self._coro_scheduler_task is None:
             self.start()
         return await fut
@@ -119,10 +350,16 @@ class AsyncCallScheduler:
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         lane: str = DEFAULT_LANE) -> any:
+        async def run_in_executor():
+            # The function is only submitted to the executor when the lane starts the call, so the lane limits how
+            # many of its functions run at once
+            return await self._ev_loop.run_in_executor(
+                hummingbot.get_executor(),
+                func,
+                *args,
+            )
+
+        coro: Coroutine = run_in_executor()
+        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg, lane=lane)
@@ -0,0 +1,148 @@
+import csv
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from shutil import move
+from typing import IO, Any, List, Optional, Sequence, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+
+class RotatingCsvWriter:
+    """
+    Append-only CSV sink.
+    The header of an existing file is checked only once, when the file is opened. Rows are buffered and written in
+    batches to a file that is kept open, so the cost of appending a row does not depend on the size of the file.
+    The file can be rotated when it exceeds a maximum size and/or when the UTC date changes.
+
+    The writer is thread safe.
+    """
+    _rcw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rcw_logger is None:
+            cls._rcw_logger = logging.getLogger(__name__)
+        return cls._rcw_logger
+
+    def __init__(self,
+                 file_path: str,
+                 header: Sequence[str],
+                 max_buffered_rows: int = 100,
+                 flush_interval: float = 1.0,
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False):
+        """
+        :param file_path: path of the CSV file
+        :param header: column names, written as the first row of every new file
+        :param max_buffered_rows: rows kept in memory before they are written to the file
+        :param flush_interval: maximum time in seconds a row can stay buffered when new rows are appended
+        :param max_file_size: size in bytes after which the file is rotated (None to disable size rotation)
+        :param rotate_daily: if True the file is rotated every time the UTC date changes
+        """
+        self._file_path: str = file_path
+        self._header: Tuple[str, ...] = tuple(str(name) for name in header)
+        self._max_buffered_rows: int = max_buffered_rows
+        self._flush_interval: float = flush_interval
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+
+        self._lock: threading.RLock = threading.RLock()
+        self._buffer: List[Sequence[Any]] = []
+        self._file: Optional[IO] = None
+        self._csv_writer = None
+        self._file_size: int = 0
+        self._file_date: Optional[str] = None
+        self._last_flush_time: float = time.monotonic()
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    @property
+    def buffered_rows(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def append(self, row: Sequence[Any]):
+        """
+        Buffers a row, and writes the buffer to the file if it is full or the flush interval has elapsed.
+        """
+        with self._lock:
+            self._buffer.append(row)
+            if (len(self._buffer) >= self._max_buffered_rows
+                    or time.monotonic() - self._last_flush_time >= self._flush_interval):
+                self.flush()
+
+    def flush(self):
+        """
+        Writes all the buffered rows to the file.
+        """
+        with self._lock:
+            self._last_flush_time = time.monotonic()
+            if len(self._buffer) == 0:
+                return
+            if self._file is None:
+                self._open()
+            elif self._should_rotate():
+                self._rotate()
+            self._csv_writer.writerows(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
+            self._file_size = self._file.tell()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._csv_writer = None
+
+    def _open(self):
+        if (os.path.exists(self._file_path)
+                and os.path.getsize(self._file_path) > 0
+                and not self._file_matches_header()):
+            self._move_current_file("old")
+        is_new_file: bool = not os.path.exists(self._file_path) or os.path.getsize(self._file_path) == 0
+        self._file = open(self._file_path, mode="a", newline="")
+        self._csv_writer = csv.writer(self._file)
+        if is_new_file:
+            self._csv_writer.writerow(self._header)
+            self._file.flush()
+        self._file_size = self._file.tell()
+        self._file_date = self._current_date()
+
+    def _file_matches_header(self) -> bool:
+        with open(self._file_path, mode="r", newline="") as csv_file:
+            first_row: Optional[List[str]] = next(csv.reader(csv_file), None)
+        return first_row is not None and tuple(first_row) == self._header
+
+    def _should_rotate(self) -> bool:
+        if self._max_file_size is not None and self._file_size >= self._max_file_size:
+            return True
+        return self._rotate_daily and self._file_date != self._current_date()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        self._csv_writer = None
+        self._move_current_file(self._file_date)
+        self._open()
+
+    def _move_current_file(self, suffix: str):
+        timestamp: str = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+        root, extension = os.path.splitext(self._file_path)
+        destination: str = f"{root}_{suffix}_{timestamp}{extension}"
+        move(self._file_path, destination)
+        self.logger().info(f"CSV file {self._file_path} moved to {destination}.")
+
+    @staticmethod
+    def _current_date() -> str:
+        return datetime.now(tz=timezone.utc).strftime("%Y%m%d")
@@ -1,12 +1,16 @@
+import asyncio
 import importlib
+import json
+import os
+import time
 from typing import (
     Dict,
     Any,
     Optional,
-    Callable,
     Awaitable,
     List
 )
+from hummingbot import data_path
 from hummingbot.logger import HummingbotLogger
 from hummingbot.client.settings import AllConnectorSettings
 import logging
@@ -15,6 +19,18 @@ from .async_utils import safe_ensure_future
 
 
 class TradingPairFetcher:
+    """
+    Catalog of the trading pairs of the connectors, used for the trading pairs autocompletion and validation.
+
+    The catalog is persisted in the data directory. The trading pairs of a connector are only fetched when they are
+    first requested with get_trading_pairs(), and fetched again in the background once they expire, the outdated
+    trading pairs being used in the meantime. They expire after the TRADING_PAIRS_CATALOG_TTL seconds of the
+    connector data source module (DEFAULT_TTL if it doesn't define it).
+    """
+    CATALOG_FILE_NAME = "trading_pair_catalog.json"
+    DEFAULT_TTL = 60 * 60 * 24
+    FAILED_FETCH_RETRY_INTERVAL = 60.0
+
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -30,50 +46,143 @@ class TradingPairFetcher:
             cls._sf_shared_instance = TradingPairFetcher()
         return cls._sf_shared_instance
 
-    def __init__(self):
+    def __init__(self, catalog_path: Optional[str] = None):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
-        safe_ensure_future(self.fetch_all())
-
-    async def fetch_all(self):
-        for conn_setting in AllConnectorSettings.get_connector_settings().values():
-            if conn_setting.base_name().endswith("paper_trade"):
-                if conn_setting.parent_name in self.trading_pairs:
-                    self.trading_pairs[conn_setting.base_name()] = self.trading_pairs[conn_setting.parent_name]
-                    continue
-                exchange_name = conn_setting.parent_name
-            else:
-                exchange_name = conn_setting.base_name()
-
-            module_name = f"{exchange_name}_api_order_book_data_source"
-            module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
-                          f"{exchange_name}.{module_name}" if not conn_setting.uses_gateway_generic_connector() \
-                          else conn_setting.module_path()
-            class_name = "".join([o.capitalize() for o in exchange_name.split("_")]) + \
-                         "APIOrderBookDataSource" if not conn_setting.uses_gateway_generic_connector() \
-                         else conn_setting.class_name()
-
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
-            try:
-                module = getattr(importlib.import_module(module_path), class_name)
-            except ModuleNotFoundError:
-                continue
-            args = {}
-            args = conn_setting.add_domain_parameter(args)
-            if conn_setting.uses_gateway_generic_connector():
-                connector_params = conn_setting.name.split("_")
-                safe_ensure_future(self.call_fetch_pairs(module.fetch_trading_pairs(connector_params[1], connector_params[2]), conn_setting.name))
-            else:
-                safe_ensure_future(self.call_fetch_pairs(module.fetch_trading_pairs(**args), conn_setting.name))
-
+        self._catalog_path: str = catalog_path or os.path.join(data_path(), self.CATALOG_FILE_NAME)
+        self._expiration_timestamps: Dict[str, float] = {}
+        self._fetch_tasks: Dict[str, asyncio.Future] = {}
+        self._load_catalog()
         self.ready = True
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the trading pairs of a connector known so far, and fetches them in the background if they are not
+        known yet or expired.
+        """
+        if self.is_expired(connector_name):
+            self.refresh(connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    def has_trading_pairs(self, connector_name: str) -> bool:
+        """
+        Returns True if the trading pairs of a connector have been fetched, even if they are expired.
+        """
+        return connector_name in self.trading_pairs
+
+    def is_expired(self, connector_name: str) -> bool:
+        return self._expiration_timestamps.get(connector_name, 0) <= time.time()
+
+    def refresh(self, connector_name: str) -> asyncio.Future:
+        """
+        Fetches the trading pairs of a connector, unless they are already being fetched.
+        """
+        fetch_task: Optional[asyncio.Future] = self._fetch_tasks.get(connector_name)
+        if fetch_task is None or fetch_task.done():
+            fetch_task = safe_ensure_future(self._fetch_connector_trading_pairs(connector_name))
+            self._fetch_tasks[connector_name] = fetch_task
+        return fetch_task
+
+    async def fetch(self, connector_name: str) -> List[str]:
+        """
+        Returns the trading pairs of a connector, waiting for them to be fetched if they are not known yet or expired.
+        """
+        if self.is_expired(connector_name):
+            await self.refresh(connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    async def _fetch_connector_trading_pairs(self, connector_name: str):
+        conn_setting = AllConnectorSettings.get_connector_settings().get(connector_name)
+        if conn_setting is None:
+            return
+        if conn_setting.base_name().endswith("paper_trade"):
+            trading_pairs = await self.fetch(conn_setting.parent_name)
+            self._set_trading_pairs(connector_name,
+                                    trading_pairs,
+                                    self._expiration_timestamps.get(conn_setting.parent_name, 0),
+                                    persist=False)
+            return
+
+        exchange_name = conn_setting.base_name()
+        module_name = f"{exchange_name}_api_order_book_data_source"
+        module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                      f"{exchange_name}.{module_name}" if not conn_setting.uses_gateway_generic_connector() \
+                      else conn_setting.module_path()
+        class_name = "".join([o.capitalize() for o in exchange_name.split("_")]) + \
+                     "APIOrderBookDataSource" if not conn_setting.uses_gateway_generic_connector() \
+                     else conn_setting.class_name()
+
+        # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+        # data source module for them.
         try:
-            self.trading_pairs[exchange_name] = await fetch_fn
+            module = importlib.import_module(module_path)
+            data_source_class = getattr(module, class_name)
+        except ModuleNotFoundError:
+            self._set_trading_pairs(connector_name, [], time.time() + self.DEFAULT_TTL, persist=False)
+            return
+        args = {}
+        args = conn_setting.add_domain_parameter(args)
+        if conn_setting.uses_gateway_generic_connector():
+            connector_params = conn_setting.name.split("_")
+            fetch_fn = data_source_class.fetch_trading_pairs(connector_params[1], connector_params[2])
+        else:
+            fetch_fn = data_source_class.fetch_trading_pairs(**args)
+        ttl = getattr(module, "TRADING_PAIRS_CATALOG_TTL", self.DEFAULT_TTL)
+        await self.call_fetch_pairs(fetch_fn, connector_name, ttl)
+
+    async def call_fetch_pairs(self, fetch_fn: Awaitable[List[str]], exchange_name: str, ttl: Optional[float] = None):
+        try:
+            trading_pairs = await fetch_fn
+            self._set_trading_pairs(exchange_name, trading_pairs, time.time() + (ttl or self.DEFAULT_TTL))
+        except asyncio.CancelledError:
+            raise
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error the outdated trading pairs (if any) are kept, st. the bot won't stop working, and they
+            # are fetched again after a while
+            self._set_trading_pairs(exchange_name,
+                                    self.trading_pairs.get(exchange_name, []),
+                                    time.time() + self.FAILED_FETCH_RETRY_INTERVAL,
+                                    persist=False)
+
+    def _set_trading_pairs(self, connector_name: str, trading_pairs: List[str], expiration_timestamp: float,
+                           persist: bool = True):
+        self.trading_pairs[connector_name] = trading_pairs
+        self._expiration_timestamps[connector_name] = expiration_timestamp
+        if persist:
+            self._save_catalog(connector_name)
+
+    def _load_catalog(self):
+        if not os.path.exists(self._catalog_path):
+            return
+        try:
+            with open(self._catalog_path) as catalog_file:
+                catalog: Dict[str, Dict[str, Any]] = json.load(catalog_file)
+            for connector_name, entry in catalog.items():
+                self.trading_pairs[connector_name] = entry["trading_pairs"]
+                self._expiration_timestamps[connector_name] = entry["expiration_timestamp"]
+        except Exception:
+            self.logger().warning(f"Could not read the trading pair catalog {self._catalog_path}, the trading pairs "
+                                  f"will be fetched again.", exc_info=True)
+
+    def _save_catalog(self, connector_name: str):
+        catalog: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self._catalog_path):
+            try:
+                with open(self._catalog_path) as catalog_file:
+                    catalog = json.load(catalog_file)
+            except Exception:
+                catalog = {}
+        # The catalog is read again since other bot instances may have updated it
+        catalog[connector_name] = {
+            "trading_pairs": self.trading_pairs[connector_name],
+            "expiration_timestamp": self._expiration_timestamps[connector_name],
+        }
+        try:
+            temporary_path: str = f"{self._catalog_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w") as catalog_file:
+                json.dump(catalog, catalog_file)
+            os.replace(temporary_path, self._catalog_path)
+        except Exception:
+            self.logger().warning(f"Could not save the trading pair catalog {self._catalog_path}.", exc_info=True)
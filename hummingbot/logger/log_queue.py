@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+
+import logging
+import queue
+import threading
+from collections import defaultdict
+from logging.handlers import BaseRotatingHandler
+from typing import Dict, List, Optional, Tuple
+
+# A queued record and the handlers it has to be written to
+QueuedRecord = Tuple[logging.LogRecord, Tuple[logging.Handler, ...]]
+
+
+class LogQueue:
+    """
+    Bounded queue of log records written by a background thread.
+
+    Records are enqueued by QueueLogHandler on the thread that logs them, which only merges the message arguments.
+    The writer thread formats the records and writes them in batches, with one write and one flush per handler and
+    batch. When the queue is full the new records are dropped and counted, and the writer thread logs how many
+    records were dropped.
+    """
+
+    def __init__(self, max_size: int = 10000, batch_size: int = 200, flush_interval: float = 0.2):
+        """
+        :param max_size: maximum number of records waiting to be written
+        :param batch_size: maximum number of records written at once
+        :param flush_interval: maximum time in seconds the writer thread waits for a record before checking if it
+        has to stop
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stopping: bool = False
+        self._counters_lock: threading.Lock = threading.Lock()
+        self._dropped_records: int = 0
+        self._dropped_records_by_level: Dict[str, int] = defaultdict(int)
+        self._reported_dropped_records: int = 0
+        self._written_records: int = 0
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def dropped_records(self) -> int:
+        return self._dropped_records
+
+    @property
+    def dropped_records_by_level(self) -> Dict[str, int]:
+        with self._counters_lock:
+            return dict(self._dropped_records_by_level)
+
+    @property
+    def written_records(self) -> int:
+        return self._written_records
+
+    def start(self):
+        if self.started:
+            return
+        self._stopping = False
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="LogQueue", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the writer thread after all the queued records have been written.
+        """
+        self._stopping = True
+        if self._writer_thread is not None:
+            if self._writer_thread is not threading.current_thread():
+                self._writer_thread.join(timeout)
+            self._writer_thread = None
+        self.flush()
+
+    def put(self, record: logging.LogRecord, handlers: Tuple[logging.Handler, ...]):
+        """
+        Enqueues a record, or writes it right away if the writer thread is not running.
+        """
+        if not self.started:
+            self._write_batch([(record, handlers)])
+            return
+        try:
+            self._queue.put_nowait((record, handlers))
+        except queue.Full:
+            with self._counters_lock:
+                self._dropped_records += 1
+                self._dropped_records_by_level[record.levelname] += 1
+
+    def flush(self):
+        """
+        Writes all the queued records in the calling thread.
+        """
+        batch = self._get_batch()
+        while len(batch) > 0:
+            self._write_batch(batch)
+            batch = self._get_batch()
+
+    def _writer_loop(self):
+        while not self._stopping:
+            try:
+                batch = [self._queue.get(timeout=self._flush_interval)]
+            except queue.Empty:
+                continue
+            batch.extend(self._get_batch(self._batch_size - 1))
+            self._write_batch(batch)
+
+    def _get_batch(self, max_records: Optional[int] = None) -> List[QueuedRecord]:
+        max_records = self._batch_size if max_records is None else max_records
+        batch = []
+        while len(batch) < max_records:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[QueuedRecord]):
+        records_by_handler: Dict[logging.Handler, List[logging.LogRecord]] = {}
+        for record, handlers in batch:
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    records_by_handler.setdefault(handler, []).append(record)
+        for handler, records in records_by_handler.items():
+            self._write_records(handler, records)
+        self._written_records += len(batch)
+        self._report_dropped_records(batch)
+
+    def _report_dropped_records(self, batch: List[QueuedRecord]):
+        with self._counters_lock:
+            dropped_records = self._dropped_records - self._reported_dropped_records
+            self._reported_dropped_records = self._dropped_records
+        if dropped_records == 0:
+            return
+        _, handlers = batch[-1]
+        report = logging.LogRecord(__name__, logging.WARNING, __file__, 0,
+                                   f"The log queue was full, {dropped_records} log records have been dropped.",
+                                   None, None)
+        for handler in handlers:
+            if report.levelno >= handler.level:
+                self._write_records(handler, [report])
+
+    @staticmethod
+    def _write_records(handler: logging.Handler, records: List[logging.LogRecord]):
+        if not isinstance(handler, logging.StreamHandler) or handler.stream is None:
+            for record in records:
+                handler.handle(record)
+            return
+        handler.acquire()
+        try:
+            lines = []
+            for record in records:
+                try:
+                    if not handler.filter(record):
+                        continue
+                    if isinstance(handler, BaseRotatingHandler) and handler.shouldRollover(record):
+                        LogQueue._write_lines(handler, lines)
+                        lines = []
+                        handler.doRollover()
+                    lines.append(handler.format(record) + handler.terminator)
+                except Exception:
+                    handler.handleError(record)
+            try:
+                LogQueue._write_lines(handler, lines)
+            except Exception:
+                handler.handleError(records[-1])
+        finally:
+            handler.release()
+
+    @staticmethod
+    def _write_lines(handler: logging.StreamHandler, lines: List[str]):
+        if len(lines) > 0:
+            handler.stream.write("".join(lines))
+            handler.flush()
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Handler passing the records to a log queue, to be written to the target handlers by the log queue writer thread.
+    """
+
+    def __init__(self, log_queue: LogQueue, handlers: List[logging.Handler]):
+        super().__init__()
+        self._log_queue: LogQueue = log_queue
+        self._handlers: Tuple[logging.Handler, ...] = tuple(handlers)
+        # Records below the level of all the target handlers are not queued
+        self.setLevel(min(handler.level for handler in handlers))
+
+    @property
+    def log_queue(self) -> LogQueue:
+        return self._log_queue
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        return self._handlers
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # The message arguments might be changed by the caller before the record is written
+            if record.args:
+                record.msg = record.getMessage()
+                record.args = None
+            self._log_queue.put(record, self._handlers)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        # The queued records are written before the target handlers are closed
+        self._log_queue.stop()
+        super().close()
+
+
+def enable_log_queue(max_size: int = 10000, batch_size: int = 200) -> LogQueue:
+    """
+    Moves the handlers of the root logger and of all the loggers with handlers behind queue log handlers sharing a
+    log queue, and starts the log queue writer thread. The loggers with the same handlers share a queue log handler.
+    :param max_size: maximum number of records waiting to be written
+    :param batch_size: maximum number of records written at once
+    :return: the log queue
+    """
+    log_queue = LogQueue(max_size=max_size, batch_size=batch_size)
+    queue_handlers: Dict[Tuple[logging.Handler, ...], QueueLogHandler] = {}
+    loggers = [logging.getLogger()] + [logger for logger in logging.Logger.manager.loggerDict.values()
+                                       if isinstance(logger, logging.Logger)]
+    for logger in loggers:
+        handlers = tuple(logger.handlers)
+        if len(handlers) == 0 or any(isinstance(handler, QueueLogHandler) for handler in handlers):
+            continue
+        if handlers not in queue_handlers:
+            queue_handlers[handlers] = QueueLogHandler(log_queue, list(handlers))
+        logger.handlers = [queue_handlers[handlers]]
+    log_queue.start()
+    return log_queue
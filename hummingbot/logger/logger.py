@@ -12,6 +12,9 @@ import pandas as pd
 from .application_warning import ApplicationWarning
 
 TESTING_TOOLS = ["nose", "unittest", "pytest"]
+# Log record attributes set from the caller stack frame
+CALLER_RECORD_ATTRIBUTES = ["pathname", "filename", "module", "lineno", "funcName"]
+UNKNOWN_CALLER = ("(unknown file)", 0, "(unknown function)", None)
 
 #  --- Copied from logging module ---
 if hasattr(sys, '_getframe'):
@@ -28,9 +31,21 @@ else:   # pragma: no cover
 
 
 class HummingbotLogger(PythonLogger):
+    # The stack is only walked to find the caller of the log functions if the log formats include the caller, or to
+    # get the stack info when it is requested
+    caller_lookup_enabled: bool = True
+
     def __init__(self, name: str):
         super().__init__(name)
 
+    @classmethod
+    def set_caller_lookup_enabled(cls, enabled: bool):
+        HummingbotLogger.caller_lookup_enabled = enabled
+
+    @staticmethod
+    def format_uses_caller(log_format: str) -> bool:
+        return any(attribute in log_format for attribute in CALLER_RECORD_ATTRIBUTES)
+
     @staticmethod
     def is_testing_mode() -> bool:
         return any(tools in arg
@@ -67,6 +82,8 @@ class HummingbotLogger(PythonLogger):
         Find the stack frame of the caller so that we can note the source
         file name, line number and function name.
         """
+        if not HummingbotLogger.caller_lookup_enabled and not stack_info:
+            return UNKNOWN_CALLER
         f = currentframe()
         # On some versions of IronPython, currentframe() returns None if
         # IronPython isn't run with -X:Frames.
@@ -78,7 +95,7 @@ class HummingbotLogger(PythonLogger):
             stacklevel -= 1
         if not f:
             f = orig_f
-        rv = "(unknown file)", 0, "(unknown function)", None
+        rv = UNKNOWN_CALLER
         while hasattr(f, "f_code"):
             co = f.f_code
             filename = os.path.normcase(co.co_filename)
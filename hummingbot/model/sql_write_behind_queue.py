@@ -0,0 +1,239 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+SessionOperation = Callable[[Session], None]
+CommitCallback = Callable[[], None]
+QueuedOperation = Tuple[SessionOperation, Optional[CommitCallback]]
+
+
+class SQLWriteBehindQueue:
+    """
+    Collects database write operations and applies them in bulk transactions on a background writer thread, so that
+    the caller (usually the event loop thread) never waits for SQL commits.
+
+    Operations are callables receiving an open session. Regular operations are applied in the order they were
+    submitted. Keyed operations (i.e. snapshots that supersede each other) are merged: only the last operation
+    submitted for a key before a flush is applied, after all the regular operations of the same batch.
+
+    A regular operation can have a commit callback, called once after the transaction writing the operation is
+    committed, for the side effects that must not be repeated when a failed batch is retried operation by operation
+    (and must not happen at all if the operation is discarded).
+    """
+    _swbq_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._swbq_logger is None:
+            cls._swbq_logger = logging.getLogger(__name__)
+        return cls._swbq_logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 batch_interval: float = 0.5,
+                 max_batch_size: int = 500):
+        """
+        :param sql: the connection manager used to open the writer sessions
+        :param batch_interval: time in seconds the writer waits to group operations after the first one arrives
+        :param max_batch_size: maximum number of operations applied in a single transaction
+        """
+        self._sql_manager: SQLConnectionManager = sql
+        self._batch_interval: float = batch_interval
+        self._max_batch_size: int = max_batch_size
+        self._operations: List[QueuedOperation] = []
+        self._keyed_operations: Dict[Hashable, QueuedOperation] = OrderedDict()
+        self._condition: threading.Condition = threading.Condition()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stopping: bool = False
+        self._is_flushing: bool = False
+
+        self._flush_count: int = 0
+        self._flushed_operations: int = 0
+        self._failed_operations: int = 0
+        self._last_flush_latency: float = 0.0
+        self._total_flush_latency: float = 0.0
+        self._max_flush_latency: float = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of operations waiting to be written
+        """
+        with self._condition:
+            return len(self._operations) + len(self._keyed_operations)
+
+    @property
+    def flush_count(self) -> int:
+        return self._flush_count
+
+    @property
+    def flushed_operations(self) -> int:
+        return self._flushed_operations
+
+    @property
+    def failed_operations(self) -> int:
+        return self._failed_operations
+
+    @property
+    def last_flush_latency(self) -> float:
+        """
+        Time in seconds spent applying and committing the last batch
+        """
+        return self._last_flush_latency
+
+    @property
+    def average_flush_latency(self) -> float:
+        return self._total_flush_latency / self._flush_count if self._flush_count > 0 else 0.0
+
+    @property
+    def max_flush_latency(self) -> float:
+        return self._max_flush_latency
+
+    def start(self):
+        if self.started:
+            return
+        self._stopping = False
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="SQLWriteBehindQueue", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes all the pending operations and stops the writer thread.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout)
+            self._writer_thread = None
+        # Operations submitted while the writer was not running are written synchronously
+        self.flush()
+
+    def put(self, operation: SessionOperation, on_commit: Optional[CommitCallback] = None):
+        """
+        Submits an operation, on_commit (if any) is called in the writer thread once the operation is committed.
+        """
+        with self._condition:
+            self._operations.append((operation, on_commit))
+            self._condition.notify_all()
+
+    def put_keyed(self, key: Hashable, operation: SessionOperation):
+        """
+        Submits an operation that replaces any pending operation registered with the same key.
+        """
+        with self._condition:
+            self._keyed_operations.pop(key, None)
+            self._keyed_operations[key] = (operation, None)
+            self._condition.notify_all()
+
+    def wait_until_empty(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every submitted operation has been written.
+        :return: True if the queue was drained before the timeout expired
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._is_flushing and len(self._operations) == 0 and len(self._keyed_operations) == 0,
+                timeout
+            )
+
+    def flush(self):
+        """
+        Writes all the pending operations in the calling thread.
+        """
+        while True:
+            with self._condition:
+                batch = self._take_batch()
+                if len(batch) == 0:
+                    return
+                self._is_flushing = True
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._condition:
+                    self._is_flushing = False
+                    self._condition.notify_all()
+
+    def _take_batch(self) -> List[QueuedOperation]:
+        batch: List[QueuedOperation] = self._operations[:self._max_batch_size]
+        del self._operations[:len(batch)]
+        if len(self._operations) == 0:
+            # Keyed operations always go at the end so they reflect the state after the regular operations
+            batch.extend(self._keyed_operations.values())
+            self._keyed_operations.clear()
+        return batch
+
+    def _writer_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or len(self._operations) > 0 or len(self._keyed_operations) > 0
+                )
+                if self._stopping and len(self._operations) == 0 and len(self._keyed_operations) == 0:
+                    return
+                if not self._stopping:
+                    # Give the producers some time to group more operations in the same transaction
+                    deadline: float = time.monotonic() + self._batch_interval
+                    self._condition.wait_for(
+                        lambda: self._stopping or len(self._operations) >= self._max_batch_size,
+                        max(0.0, deadline - time.monotonic())
+                    )
+            try:
+                self.flush()
+            except Exception:
+                self.logger().error("Unexpected error writing to the database.", exc_info=True)
+
+    def _write_batch(self, batch: List[QueuedOperation]):
+        start: float = time.perf_counter()
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for operation, _ in batch:
+                        operation(session)
+            self._flushed_operations += len(batch)
+        except Exception:
+            self.logger().warning("Error writing a batch of database operations. Retrying them one by one.",
+                                  exc_info=True)
+            self._write_individually(batch)
+        else:
+            for _, on_commit in batch:
+                self._call_commit_callback(on_commit)
+
+        latency: float = time.perf_counter() - start
+        self._flush_count += 1
+        self._last_flush_latency = latency
+        self._total_flush_latency += latency
+        self._max_flush_latency = max(self._max_flush_latency, latency)
+
+    def _write_individually(self, batch: List[QueuedOperation]):
+        for operation, on_commit in batch:
+            try:
+                with self._sql_manager.get_new_session() as session:
+                    with session.begin():
+                        operation(session)
+                self._flushed_operations += 1
+            except Exception:
+                self._failed_operations += 1
+                self.logger().error("Error writing database operation. The operation has been discarded.",
+                                    exc_info=True)
+            else:
+                self._call_commit_callback(on_commit)
+
+    def _call_commit_callback(self, on_commit: Optional[CommitCallback]):
+        if on_commit is None:
+            return
+        try:
+            on_commit()
+        except Exception:
+            self.logger().error("Unexpected error after writing a database operation.", exc_info=True)
@@ -30,7 +30,7 @@ import pandas as pd
 from hummingbot.logger import HummingbotLogger
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import NOTIFIER_LANE, AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
@@ -132,7 +132,7 @@ class TelegramNotifier(NotifierBase):
                 pd.set_option('display.max_columns', 500)
                 pd.set_option('display.width', 1000)
 
-                await async_scheduler.call_async(self._hb._handle_command, input_text)
+                await async_scheduler.call_async(self._hb._handle_command, input_text, lane=NOTIFIER_LANE)
 
                 # Reset to normal, so that pandas's default autodetect width still works
                 pd.set_option('display.max_rows', 0)
@@ -184,7 +184,7 @@ class TelegramNotifier(NotifierBase):
                     text=formatted_msg,
                     parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
-                ))
+                ), lane=NOTIFIER_LANE)
             except NetworkError as network_err:
                 # Sometimes the telegram server resets the current connection,
                 # if this is the case we send the message again.
@@ -195,7 +195,7 @@ class TelegramNotifier(NotifierBase):
                     text=msg,
                     parse_mode=ParseMode.MARKDOWN,
                     reply_markup=reply_markup
-                ))
+                ), lane=NOTIFIER_LANE)
         except TelegramError as telegram_err:
             self.logger().network(f"TelegramError: {telegram_err.message}! Giving up on that message.",
                                   exc_info=True)
@@ -0,0 +1,114 @@
+from decimal import Decimal
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+
+class MultiMarketVolatilityIndicator:
+    """
+    Average true range volatility of several markets, computed from a shared ring buffer of mid prices with one row per
+    market and one column per sample.
+
+    The volatility of a market is the average, over the last processing_length intervals of sampling_length samples,
+    of the interval price range divided by the interval lowest price. The intervals end at the last sample. Until a
+    whole interval of samples has been added, the volatility is computed over all the samples added so far.
+
+    The samples of all the markets are added at once, and the volatility of all the markets is calculated in a single
+    vectorized pass the first time it is requested after a sample is added.
+    """
+
+    def __init__(self, markets: List[str], sampling_length: int = 60 * 5, processing_length: int = 10):
+        """
+        :param markets: the markets (usually trading pairs) tracked, in the order their samples are added
+        :param sampling_length: number of samples in each interval
+        :param processing_length: number of intervals averaged
+        """
+        self._markets: List[str] = list(markets)
+        self._sampling_length: int = sampling_length
+        self._processing_length: int = processing_length
+        self._buffer: np.ndarray = np.full((len(self._markets), sampling_length * processing_length), np.nan)
+        self._delimiter: int = 0
+        self._samples_count: int = 0
+        self._volatility: np.ndarray = np.full(len(self._markets), np.nan)
+        self._is_volatility_updated: bool = True
+
+    @property
+    def markets(self) -> List[str]:
+        return self._markets
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_length
+
+    @property
+    def processing_length(self) -> int:
+        return self._processing_length
+
+    @property
+    def samples_count(self) -> int:
+        """
+        Number of samples currently stored for each market
+        """
+        return min(self._samples_count, self._buffer.shape[1])
+
+    @property
+    def volatility(self) -> np.ndarray:
+        """
+        The volatility of every market, in the order of the markets (NaN if it can't be calculated yet)
+        """
+        if not self._is_volatility_updated:
+            self._volatility = self._volatility_calculation()
+            self._is_volatility_updated = True
+        return self._volatility
+
+    def add_samples(self, mid_prices: Sequence[Union[float, Decimal]]):
+        """
+        Adds a sample for every market.
+        :param mid_prices: the mid price of every market, in the order of the markets
+        """
+        self._buffer[:, self._delimiter] = np.asarray(mid_prices, dtype=np.float64)
+        self._delimiter = (self._delimiter + 1) % self._buffer.shape[1]
+        self._samples_count += 1
+        self._is_volatility_updated = False
+
+    def add_samples_by_market(self, mid_prices: Dict[str, Union[float, Decimal]]):
+        """
+        Adds a sample for every market.
+        :param mid_prices: the mid price of every market, by market
+        """
+        self.add_samples([mid_prices[market] for market in self._markets])
+
+    def volatility_by_market(self) -> Dict[str, float]:
+        return dict(zip(self._markets, self.volatility.tolist()))
+
+    def mid_prices(self, market: str) -> np.ndarray:
+        """
+        Returns the mid prices stored for a market, from the oldest to the newest.
+        """
+        return self._last_samples(self.samples_count)[self._markets.index(market)]
+
+    def _last_samples(self, count: int) -> np.ndarray:
+        indexes = np.arange(self._delimiter - count, self._delimiter) % self._buffer.shape[1]
+        return self._buffer[:, indexes]
+
+    def _volatility_calculation(self) -> np.ndarray:
+        samples_count = self.samples_count
+        if samples_count == 0:
+            return np.full(len(self._markets), np.nan)
+        if samples_count < self._sampling_length:
+            intervals = self._last_samples(samples_count)[:, np.newaxis, :]
+        else:
+            intervals_count = samples_count // self._sampling_length
+            intervals = self._last_samples(intervals_count * self._sampling_length).reshape(
+                len(self._markets), intervals_count, self._sampling_length)
+
+        # fmax and fmin ignore the samples without mid price, an interval without any mid price gives NaN
+        highs = np.fmax.reduce(intervals, axis=2)
+        lows = np.fmin.reduce(intervals, axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ranges = (highs - lows) / lows
+            valid_ranges = np.isfinite(ranges)
+            valid_ranges_count = valid_ranges.sum(axis=1)
+            return np.where(valid_ranges_count > 0,
+                            np.where(valid_ranges, ranges, 0).sum(axis=1) / valid_ranges_count,
+                            np.nan)
@@ -1,15 +1,19 @@
-from libc.stdint cimport int64_t
+cimport numpy as np
 
 
 cdef class TradingIntensityIndicator():
     cdef:
         double _alpha
         double _kappa
-        list _trades
-        object _bids_df
-        object _asks_df
+        object _trades
+        np.ndarray _bids
+        np.ndarray _asks
         int _sampling_length
         int _samples_length
+        int _depth
+        int _refit_interval
+        int _samples_since_refit
 
-    cdef c_simulate_execution(self, bids_df, asks_df)
+    cdef c_add_sample_arrays(self, np.ndarray bids, np.ndarray asks)
+    cdef c_simulate_execution(self, np.ndarray bids, np.ndarray asks)
     cdef c_estimate_intensity(self)
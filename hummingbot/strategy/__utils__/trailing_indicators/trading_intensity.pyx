@@ -1,5 +1,5 @@
+from collections import deque
 from decimal import Decimal
-from math import floor, ceil
 import numpy as np
 import pandas as pd
 from scipy.optimize import curve_fit
@@ -9,111 +9,101 @@ from typing import (
 )
 import warnings
 
+cimport numpy as np
 
-cdef class TradingIntensityIndicator():
 
-    def __init__(self, sampling_length: int = 30):
+cdef class TradingIntensityIndicator():
+    """
+    Estimates the order book liquidity parameters (alpha and kappa) used by the Avellaneda-Stoikov model.
+
+    Samples are the top levels of the order book as arrays with columns [price, amount] (bids sorted by descending
+    price, asks by ascending price). Every change in the top of the book is assumed to be caused by a market order,
+    and the executed amounts are stored per price level in a fixed size ring with the last `sampling_length` ticks.
+    The exponential intensity curve is refitted every `refit_interval` new samples once the ring is full.
+    """
+
+    def __init__(self, sampling_length: int = 30, depth: int = 100, refit_interval: int = 1):
+        """
+        :param sampling_length: number of ticks with estimated executions kept to fit the intensity curve
+        :param depth: number of order book levels per side the strategies should sample from the order book
+        :param refit_interval: number of new samples between two estimations of alpha and kappa
+        """
         self._alpha = 0
         self._kappa = 0
-        self._trades = []
-        self._bids_df = None
-        self._asks_df = None
+        self._trades = deque(maxlen=sampling_length)
+        self._bids = None
+        self._asks = None
         self._sampling_length = sampling_length
         self._samples_length = 0
+        self._depth = depth
+        self._refit_interval = max(1, refit_interval)
+        self._samples_since_refit = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
     def _simulate_execution(self, bids_df, asks_df):
-        self.c_simulate_execution(bids_df, asks_df)
+        self.c_simulate_execution(self._levels_from_df(bids_df), self._levels_from_df(asks_df))
 
-    cdef c_simulate_execution(self, new_bids_df, new_asks_df):
+    cdef c_simulate_execution(self, np.ndarray bids, np.ndarray asks):
         cdef:
-            object _bids_df = self._bids_df
-            object _asks_df = self._asks_df
-            object bids_df = new_bids_df
-            object asks_df = new_asks_df
-            int _sampling_length = self._sampling_length
-            object bid
-            object ask
-            object price
-            object bid_prev
-            object ask_prev
-            object price_prev
-            list trades
+            np.ndarray prev_bids = self._bids
+            np.ndarray prev_asks = self._asks
+            double bid = bids[0, 0]
+            double ask = asks[0, 0]
+            double price_prev = (prev_bids[0, 0] + prev_asks[0, 0]) / 2
+            np.ndarray candidates
+            np.ndarray is_filled
+            np.ndarray bid_levels
+            np.ndarray bid_amounts
+            np.ndarray ask_levels
+            np.ndarray ask_amounts
 
         # Estimate market orders that happened
         # Assume every movement in the BBO is caused by a market order and its size is the volume differential
 
-        bid = bids_df["price"].iloc[0]
-        ask = asks_df["price"].iloc[0]
-        price = (bid + ask) / 2
-
-        bid_prev = _bids_df["price"].iloc[0]
-        ask_prev = _asks_df["price"].iloc[0]
-        price_prev = (bid_prev + ask_prev) / 2
-
-        trades = []
-
         # Higher bids were filled - someone matched them - a determined seller
         # Equal bids - if amount lower - partially filled
-        for index, row in _bids_df[_bids_df['price'] >= bid].iterrows():
-            if row['price'] == bid:
-                if bids_df["amount"].iloc[0] < row['amount']:
-                    amount = row['amount'] - bids_df["amount"].iloc[0]
-                    price_level = abs(row['price'] - price_prev)
-                    trades += [{'price_level': price_level, 'amount': amount}]
-            else:
-                amount = row['amount']
-                price_level = abs(row['price'] - price_prev)
-                trades += [{'price_level': price_level, 'amount': amount}]
+        candidates = prev_bids[prev_bids[:, 0] >= bid]
+        is_filled = (candidates[:, 0] != bid) | (bids[0, 1] < candidates[:, 1])
+        bid_levels = candidates[is_filled, 0]
+        bid_amounts = np.where(candidates[:, 0] == bid, candidates[:, 1] - bids[0, 1], candidates[:, 1])[is_filled]
 
         # Lower asks were filled - someone matched them - a determined buyer
         # Equal asks - if amount lower - partially filled
-        for index, row in _asks_df[_asks_df['price'] <= ask].iterrows():
-            if row['price'] == ask:
-                if asks_df["amount"].iloc[0] < row['amount']:
-                    amount = row['amount'] - asks_df["amount"].iloc[0]
-                    price_level = abs(row['price'] - price_prev)
-                    trades += [{'price_level': price_level, 'amount': amount}]
-            else:
-                amount = row['amount']
-                price_level = abs(row['price'] - price_prev)
-                trades += [{'price_level': price_level, 'amount': amount}]
+        candidates = prev_asks[prev_asks[:, 0] <= ask]
+        is_filled = (candidates[:, 0] != ask) | (asks[0, 1] < candidates[:, 1])
+        ask_levels = candidates[is_filled, 0]
+        ask_amounts = np.where(candidates[:, 0] == ask, candidates[:, 1] - asks[0, 1], candidates[:, 1])[is_filled]
 
         # Add trades
-        self._trades += [trades]
-        if len(self._trades) > _sampling_length:
-            self._trades = self._trades[-_sampling_length:]
+        self._trades.append((np.abs(np.concatenate((bid_levels, ask_levels)) - price_prev),
+                             np.concatenate((bid_amounts, ask_amounts))))
 
     def _estimate_intensity(self):
         self.c_estimate_intensity()
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
+            np.ndarray all_price_levels
+            np.ndarray all_amounts
+            np.ndarray price_levels
+            np.ndarray level_indexes
+            np.ndarray lambdas
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for tick in self._trades:
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
+        if len(self._trades) == 0:
+            return
 
-        price_levels = sorted(price_levels, reverse=True)
+        all_price_levels = np.concatenate([price_levels for price_levels, _ in self._trades])
+        all_amounts = np.concatenate([amounts for _, amounts in self._trades])
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Consolidate the executed amounts per price level (lambdas / trading intensities)
+        price_levels, level_indexes = np.unique(all_price_levels, return_inverse=True)
+        lambdas = np.bincount(level_indexes, weights=all_amounts, minlength=len(price_levels))
+        price_levels = price_levels[::-1]
+        lambdas = lambdas[::-1]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
@@ -129,31 +119,54 @@ cdef class TradingIntensityIndicator():
         except (RuntimeError, ValueError) as e:
             pass
 
+    @staticmethod
+    def _levels_from_df(df: pd.DataFrame) -> np.ndarray:
+        return df[["price", "amount"]].to_numpy(dtype=np.float64)
+
     def add_sample(self, value: Tuple[pd.DataFrame, pd.DataFrame]):
+        """
+        Adds a sample from an order book snapshot in data frame format (as returned by OrderBook.snapshot)
+        """
         bids_df = value[0]
         asks_df = value[1]
 
         if bids_df.empty or asks_df.empty:
             return
 
+        self.c_add_sample_arrays(self._levels_from_df(bids_df), self._levels_from_df(asks_df))
+
+    def add_sample_arrays(self, bids: np.ndarray, asks: np.ndarray):
+        """
+        Adds a sample from the top levels of the order book
+        :param bids: array with columns [price, amount], sorted by descending price
+        :param asks: array with columns [price, amount], sorted by ascending price
+        """
+        self.c_add_sample_arrays(bids, asks)
+
+    cdef c_add_sample_arrays(self, np.ndarray bids, np.ndarray asks):
+        if len(bids) == 0 or len(asks) == 0:
+            return
+
         # Skip snapshots where no trades occured
-        if self._bids_df is not None and self._bids_df.equals(bids_df):
+        if self._bids is not None and np.array_equal(self._bids, bids):
             return
 
-        if self._asks_df is not None and self._asks_df.equals(asks_df):
+        if self._asks is not None and np.array_equal(self._asks, asks):
             return
 
-        if self._bids_df is not None and self._asks_df is not None:
+        if self._bids is not None and self._asks is not None:
             # Retrieve previous order book, evaluate execution
-            self.c_simulate_execution(bids_df, asks_df)
+            self.c_simulate_execution(bids, asks)
+            self._samples_since_refit += 1
 
-            if self.is_sampling_buffer_full:
+            if self.is_sampling_buffer_full and self._samples_since_refit >= self._refit_interval:
                 # Estimate alpha and kappa
                 self.c_estimate_intensity()
+                self._samples_since_refit = 0
 
         # Store the orderbook
-        self._bids_df = bids_df
-        self._asks_df = asks_df
+        self._bids = bids
+        self._asks = asks
 
     @property
     def current_value(self) -> Tuple[float, float]:
@@ -172,3 +185,11 @@ cdef class TradingIntensityIndicator():
     @property
     def sampling_length(self) -> int:
         return self._sampling_length
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def refit_interval(self) -> int:
+        return self._refit_interval
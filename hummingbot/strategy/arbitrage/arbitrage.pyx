@@ -252,6 +252,9 @@ cdef class ArbitrageStrategy(StrategyBase):
                 else:
                     if self.OPTION_LOG_STATUS_REPORT:
                         self.logger().info(f"Markets are ready. Trading started.")
+                    self.watch_order_books([market_info
+                                            for market_pair in self._market_pairs
+                                            for market_info in (market_pair.first, market_pair.second)])
 
             if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
                 if should_report_warnings:
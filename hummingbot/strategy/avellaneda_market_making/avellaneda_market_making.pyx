@@ -81,6 +81,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                     debug_csv_path: str = '',
                     volatility_buffer_size: int = 200,
                     trading_intensity_buffer_size: int = 200,
+                    trading_intensity_refit_interval: int = 5,
                     trading_intensity_price_levels: Tuple[float] = tuple(np.geomspace(1, 2, 10) - 1),
                     should_wait_order_cancel_confirmation = True,
                     is_debug: bool = False,
@@ -117,7 +118,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self.c_add_markets([market_info.market])
         self._ticks_to_be_ready = max(volatility_buffer_size, trading_intensity_buffer_size)
         self._avg_vol = InstantVolatilityIndicator(sampling_length=volatility_buffer_size)
-        self._trading_intensity = TradingIntensityIndicator(trading_intensity_buffer_size)
+        self._trading_intensity = TradingIntensityIndicator(trading_intensity_buffer_size,
+                                                            refit_interval=trading_intensity_refit_interval)
         self._last_sampling_timestamp = 0
         self._alpha = None
         self._kappa = None
@@ -641,9 +643,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._last_sampling_timestamp = timestamp
 
         price = self.get_price()
-        snapshot = self.get_order_book_snapshot()
+        bids, asks = self._market_info.order_book.get_top_levels(self._trading_intensity.depth)
         self._avg_vol.add_sample(price)
-        self._trading_intensity.add_sample(snapshot)
+        self._trading_intensity.add_sample_arrays(bids, asks)
         # Calculate adjustment factor to have 0.01% of inventory resolution
         base_balance = market.get_balance(base_asset)
         quote_balance = market.get_balance(quote_asset)
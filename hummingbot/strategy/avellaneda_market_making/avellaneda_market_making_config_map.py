@@ -202,6 +202,12 @@ avellaneda_market_making_config_map = {
                   type_str="int",
                   validator=lambda v: validate_int(v, 1, 10000),
                   default=200),
+    "trading_intensity_refit_interval":
+        ConfigVar(key="trading_intensity_refit_interval",
+                  prompt="Enter amount of new order book samples between liquidity estimations >>> ",
+                  type_str="int",
+                  validator=lambda v: validate_int(v, 1, 10000),
+                  default=5),
     "order_levels":
         ConfigVar(key="order_levels",
                   prompt="How many orders do you want to place on both sides? >>> ",
@@ -29,7 +29,7 @@ from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler, safe_ensure_future
+from hummingbot.core.utils.async_call_scheduler import CELO_LANE, AsyncCallScheduler, safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -234,7 +234,7 @@ cdef class CeloArbStrategy(StrategyBase):
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
         try:
             if self._async_scheduler is None:
-                self._async_scheduler = AsyncCallScheduler(call_interval=1)
+                self._async_scheduler = AsyncCallScheduler.shared_instance()
             if not self._all_markets_ready:
                 self._all_markets_ready = all([market.ready for market in self._sb_markets])
                 if not self._all_markets_ready:
@@ -260,7 +260,7 @@ cdef class CeloArbStrategy(StrategyBase):
             self.main_process()
         else:
             if self._main_task is None or self._main_task.done():
-                coro = self._async_scheduler.call_async(self.main_process, timeout_seconds=30)
+                coro = self._async_scheduler.call_async(self.main_process, timeout_seconds=30, lane=CELO_LANE)
                 self._main_task = safe_ensure_future(coro)
 
     def main_process(self):
@@ -347,6 +347,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                     # Markets are ready, ok to proceed.
                     if self.OPTION_LOG_STATUS_REPORT:
                         self.logger().info(f"Markets are ready. Trading started.")
+                    self.watch_order_books([market_info
+                                            for market_pair in self._market_pairs.values()
+                                            for market_info in (market_pair.maker, market_pair.taker)])
 
             if should_report_warnings:
                 # Check if all markets are still connected or not. If not, log a warning.
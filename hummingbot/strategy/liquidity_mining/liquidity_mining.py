@@ -1,8 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from statistics import mean
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,6 +14,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.__utils__.trailing_indicators.multi_market_volatility import MultiMarketVolatilityIndicator
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
     calculate_bid_ask_ratios_from_base_asset_ratio
@@ -79,7 +79,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        self._volatility_indicator = MultiMarketVolatilityIndicator(list(market_infos),
+                                                                    sampling_length=volatility_interval,
+                                                                    processing_length=avg_volatility_period)
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
@@ -371,6 +373,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Cancel any orders that have an order age greater than self._max_order_age or if orders are not within tolerance
         """
+        orders_to_cancel = []
         for proposal in proposals:
             to_cancel = False
             cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
@@ -381,17 +384,21 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 to_cancel = True
             if to_cancel:
                 for order in cur_orders:
-                    self.cancel_order(self._market_infos[proposal.market], order.client_order_id)
+                    orders_to_cancel.append((self._market_infos[proposal.market], order.client_order_id))
                     # To place new order on the next tick
                     self._refresh_times[order.trading_pair] = self.current_timestamp + 0.1
+        # The orders of all the markets are cancelled at once, for the exchanges with a batch cancellation endpoint
+        if orders_to_cancel:
+            self.batch_cancel_orders(orders_to_cancel)
 
     def execute_orders_proposal(self, proposals: List[Proposal]):
         """
         Execute a list of proposals if the current timestamp is less than its refresh timestamp.
         Update the refresh timestamp.
         """
+        maker_order_type: OrderType = self._exchange.get_maker_order_type()
+        orders_to_create = []
         for proposal in proposals:
-            maker_order_type: OrderType = self._exchange.get_maker_order_type()
             cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
             if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
                 continue
@@ -402,23 +409,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 self.logger().info(f"({proposal.market}) Creating a bid order {proposal.buy} value: "
                                    f"{proposal.buy.size * proposal.buy.price:.2f} {proposal.quote()} spread: "
                                    f"{spread:.2%}")
-                self.buy_with_specific_market(
-                    self._market_infos[proposal.market],
-                    proposal.buy.size,
-                    order_type=maker_order_type,
-                    price=proposal.buy.price
-                )
+                orders_to_create.append(self._proposal_limit_order(proposal, True))
             if proposal.sell.size > 0:
                 spread = abs(proposal.sell.price - mid_price) / mid_price
                 self.logger().info(f"({proposal.market}) Creating an ask order at {proposal.sell} value: "
                                    f"{proposal.sell.size * proposal.sell.price:.2f} {proposal.quote()} spread: "
                                    f"{spread:.2%}")
-                self.sell_with_specific_market(
-                    self._market_infos[proposal.market],
-                    proposal.sell.size,
-                    order_type=maker_order_type,
-                    price=proposal.sell.price
-                )
+                orders_to_create.append(self._proposal_limit_order(proposal, False))
             if proposal.buy.size > 0 or proposal.sell.size > 0:
                 if not self._volatility[proposal.market].is_nan() and spread > self._spread:
                     adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
@@ -427,6 +424,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
                                            f"market volatility")
 
                 self._refresh_times[proposal.market] = self.current_timestamp + self._order_refresh_time
+        # The orders of all the markets are submitted at once, for the exchanges with a batch order endpoint
+        if orders_to_create:
+            self.batch_create_limit_orders(orders_to_create, order_type=maker_order_type)
+
+    def _proposal_limit_order(self, proposal: Proposal, is_buy: bool) -> Tuple[MarketTradingPairTuple, LimitOrder]:
+        market_info = self._market_infos[proposal.market]
+        price_size = proposal.buy if is_buy else proposal.sell
+        order = LimitOrder("", market_info.trading_pair, is_buy, market_info.base_asset, market_info.quote_asset,
+                           price_size.price, price_size.size)
+        return market_info, order
 
     def is_token_a_quote_token(self):
         """
@@ -528,30 +535,15 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Query asset markets for mid price
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        self._volatility_indicator.add_samples([self._market_infos[market].get_mid_price()
+                                                for market in self._volatility_indicator.markets])
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        self._volatility = {market: s_decimal_nan if np.isnan(vol) else Decimal(str(vol))
+                            for market, vol in self._volatility_indicator.volatility_by_market().items()}
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
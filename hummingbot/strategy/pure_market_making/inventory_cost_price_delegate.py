@@ -1,38 +1,111 @@
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 
+from sqlalchemy.orm import Session
+
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.model.inventory_cost import InventoryCost
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 
 s_decimal_0 = Decimal("0")
 
 
 class InventoryCostPriceDelegate:
-    def __init__(self, sql: SQLConnectionManager, trading_pair: str) -> None:
+    """
+    Provides the inventory cost price of a trading pair.
+
+    The base and quote volumes are loaded from the InventoryCost table when the delegate is created and are kept in
+    memory afterwards, so getting the price never touches the database. The volume changes caused by the fills are
+    persisted by a write behind queue, which groups them in batched transactions.
+    """
+
+    def __init__(self, sql: SQLConnectionManager, trading_pair: str, persist_interval: float = 1.0) -> None:
+        """
+        :param sql: the connection manager for the trades database
+        :param trading_pair: the trading pair the inventory cost is tracked for
+        :param persist_interval: time in seconds used to group the volume changes in the same transaction
+        """
         self.base_asset, self.quote_asset = trading_pair.split("-")
         self.sql_manager = sql
+        self._write_queue: SQLWriteBehindQueue = SQLWriteBehindQueue(sql, batch_interval=persist_interval)
+        self._base_volume: Optional[Decimal] = None
+        self._quote_volume: Optional[Decimal] = None
+        self.reload()
 
     @property
     def ready(self) -> bool:
         return True
 
-    def get_price(self) -> Optional[Decimal]:
+    @property
+    def base_volume(self) -> Optional[Decimal]:
+        return self._base_volume
+
+    @property
+    def quote_volume(self) -> Optional[Decimal]:
+        return self._quote_volume
+
+    @property
+    def pending_writes(self) -> int:
+        """
+        Number of volume changes waiting to be written to the database
+        """
+        return self._write_queue.queue_depth
+
+    def start(self):
+        self._write_queue.start()
+
+    def stop(self):
+        """
+        Writes the pending volume changes and stops the background writer.
+        """
+        self._write_queue.stop()
+
+    def flush(self):
+        """
+        Blocks until all the volume changes received so far have been written to the database.
+        """
+        if self._write_queue.started:
+            self._write_queue.wait_until_empty()
+        else:
+            self._write_queue.flush()
+
+    def reload(self):
+        """
+        Reloads the volumes from the database, after writing the pending volume changes.
+        """
+        self.flush()
         with self.sql_manager.get_new_session() as session:
             with session.begin():
-                record = InventoryCost.get_record(
-                    session, self.base_asset, self.quote_asset
-                )
+                record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+                if record is None:
+                    self._base_volume = None
+                    self._quote_volume = None
+                else:
+                    self._base_volume = Decimal(str(record.base_volume))
+                    self._quote_volume = Decimal(str(record.quote_volume))
 
-                if record is None or record.base_volume is None or record.base_volume is None:
-                    return None
+    def set_volumes(self, base_volume: Decimal, quote_volume: Decimal):
+        """
+        Replaces the base and quote volumes, as the inventory price configuration does. The new volumes are persisted
+        by the write behind queue, after the volume changes already queued.
+        """
+        self._base_volume = base_volume
+        self._quote_volume = quote_volume
+        self._write_queue.put(
+            lambda session: self._add_volume(
+                session, self.base_asset, self.quote_asset, base_volume, quote_volume, overwrite=True)
+        )
 
-                try:
-                    price = record.quote_volume / record.base_volume
-                except InvalidOperation:
-                    return None
-                return Decimal(price)
+    def get_price(self) -> Optional[Decimal]:
+        if self._base_volume is None or self._quote_volume is None:
+            return None
+        try:
+            price = self._quote_volume / self._base_volume
+        except InvalidOperation:
+            return None
+        return Decimal(price)
 
     def process_order_fill_event(self, fill_event: OrderFilledEvent) -> None:
         base_asset, quote_asset = fill_event.trading_pair.split("-")
@@ -58,17 +131,27 @@ class InventoryCostPriceDelegate:
                     # Ok, some other asset used (like BNB), assume that we paid in base asset for simplicity
                     base_volume /= 1 + fill_event.trade_fee.percent
 
-        with self.sql_manager.get_new_session() as session:
-            with session.begin():
-                if fill_event.trade_type == TradeType.SELL:
-                    record = InventoryCost.get_record(session, base_asset, quote_asset)
-                    if not record:
-                        raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
-
-                    # We're keeping initial buy price intact. Profits are not changing inventory price intentionally.
-                    quote_volume = -(Decimal(record.quote_volume / record.base_volume) * base_volume)
-                    base_volume = -base_volume
-
-                InventoryCost.add_volume(
-                    session, base_asset, quote_asset, base_volume, quote_volume
-                )
+        if fill_event.trade_type == TradeType.SELL:
+            if self._base_volume is None or self._quote_volume is None:
+                raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
+
+            # We're keeping initial buy price intact. Profits are not changing inventory price intentionally.
+            quote_volume = -(Decimal(self._quote_volume / self._base_volume) * base_volume)
+            base_volume = -base_volume
+
+        self._base_volume = (self._base_volume or s_decimal_0) + base_volume
+        self._quote_volume = (self._quote_volume or s_decimal_0) + quote_volume
+        self._write_queue.put(
+            lambda session: self._add_volume(session, base_asset, quote_asset, base_volume, quote_volume)
+        )
+
+    @staticmethod
+    def _add_volume(session: Session,
+                    base_asset: str,
+                    quote_asset: str,
+                    base_volume: Decimal,
+                    quote_volume: Decimal,
+                    overwrite: bool = False):
+        InventoryCost.add_volume(session, base_asset, quote_asset, base_volume, quote_volume, overwrite)
+        # Flushing makes the record created by the first fill of a batch visible to the next fills of the batch
+        session.flush()
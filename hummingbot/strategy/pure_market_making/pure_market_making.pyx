@@ -663,6 +663,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_timestamp = timestamp
 
         self._hanging_orders_tracker.register_events(self.active_markets)
+        if self._inventory_cost_price_delegate is not None:
+            self._inventory_cost_price_delegate.start()
 
         if self._hanging_orders_enabled:
             # start tracking any restored limit order
@@ -675,6 +677,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_stop(self, Clock clock):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
+        if self._inventory_cost_price_delegate is not None:
+            # Writes the inventory cost changes still waiting to be persisted
+            self._inventory_cost_price_delegate.stop()
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
@@ -1167,10 +1172,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.batch_cancel_orders([(self._market_info, order.client_order_id)
+                                      for order in self.active_non_hanging_orders
+                                      if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
@@ -1201,8 +1206,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
             double expiration_seconds = NaN
-            str bid_order_id, ask_order_id
-            bint orders_created = False
+            list orders = []
+            list order_ids
+            list bid_order_ids
+            list ask_order_ids
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
@@ -1215,20 +1222,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
+            orders.extend([LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset,
+                                      buy.price, buy.size)
+                           for buy in proposal.buys])
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1238,21 +1234,28 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
-        if orders_created:
-            self.set_timers()
+            orders.extend([LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset,
+                                      sell.price, sell.size)
+                           for sell in proposal.sells])
+        if len(orders) == 0:
+            return
+
+        # All the levels of the proposal are submitted at once, for the connectors with batch order endpoints
+        order_ids = self.batch_create_limit_orders([(self._market_info, order) for order in orders],
+                                                   order_type=self._limit_order_type,
+                                                   expiration_seconds=expiration_seconds)
+        bid_order_ids = order_ids[:len(proposal.buys)]
+        ask_order_ids = order_ids[len(proposal.buys):]
+        for bid_order_id in bid_order_ids[:number_of_pairs]:
+            order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
+            if order:
+                self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                    CreatedPairOfOrders(order, None))
+        for idx, ask_order_id in enumerate(ask_order_ids[:number_of_pairs]):
+            order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
+            if order:
+                self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+        self.set_timers()
 
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
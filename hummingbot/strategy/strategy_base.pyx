@@ -1,8 +1,10 @@
 from decimal import Decimal
+import heapq
 import logging
 import pandas as pd
 from typing import (
-    List)
+    List,
+    Tuple)
 
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import MarketEvent
@@ -14,8 +16,10 @@ from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.data_type.common import OrderType, PositionAction
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.connector.derivative_base import DerivativeBase
+from hummingbot.connector.exchange_base import ExchangeBase
 
 NaN = float("nan")
 s_decimal_nan = Decimal("NaN")
@@ -153,7 +157,9 @@ cdef class StrategyBase(TimeIterator):
     def trades(self) -> List[Trade]:
         """
         Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        The trades are taken from the market order fill stores, which are already sorted by timestamp. The stores
+        only keep the last OrderFillStore.capacity fills of each market, the older trades are only in the trades
+        database.
         """
         def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
             return Trade(order_filled_event.trading_pair,
@@ -164,13 +170,9 @@ cdef class StrategyBase(TimeIterator):
                          market_name,
                          order_filled_event.timestamp,
                          order_filled_event.trade_fee)
-        past_trades = []
-        for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
-
-        return sorted(past_trades, key=lambda x: x.timestamp)
+        markets_trades = [[event_to_trade(ofe, market.display_name) for ofe in market.order_fill_store.fills()]
+                          for market in self.active_markets]
+        return list(heapq.merge(*markets_trades, key=lambda x: x.timestamp))
 
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
         cdef:
@@ -319,6 +321,16 @@ cdef class StrategyBase(TimeIterator):
     def remove_markets(self, markets: List[ConnectorBase]):
         self.c_remove_markets(markets)
 
+    def watch_order_books(self, market_infos: List[MarketTradingPairTuple]):
+        """
+        Makes the clock tick as soon as the order books of the markets change, if it runs with reactive ticks.
+        The order books have to exist, i.e. the markets have to be ready.
+        """
+        if self._clock is None or not self._clock.reactive_ticks_enabled:
+            return
+        for market_info in market_infos:
+            self._clock.watch_order_book(market_info.order_book)
+
     cdef object c_sum_flat_fees(self, str quote_asset, list flat_fees):
 
         """
@@ -530,6 +542,84 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def batch_create_limit_orders(self,
+                                  orders: List[Tuple[MarketTradingPairTuple, LimitOrder]],
+                                  order_type: OrderType = OrderType.LIMIT,
+                                  expiration_seconds: float = NaN,
+                                  position_action: PositionAction = PositionAction.OPEN) -> List[str]:
+        """
+        Submits several limit orders at once and starts tracking them. The orders are grouped by connector and each
+        group is submitted with the connector batch order creation.
+        :param orders: the orders to create (their client order ids are ignored), with their markets
+        :param order_type: the type of all the orders (LIMIT or LIMIT_MAKER)
+        :param expiration_seconds: the orders expiration time, for the connectors supporting it
+        :param position_action: the orders position action, for derivative connectors
+        :returns: the ids of the created orders, in the same order as the orders
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not all(isinstance(order.quantity, Decimal) and isinstance(order.price, Decimal) for _, order in orders):
+            raise TypeError("price and amount must be Decimal objects.")
+
+        cdef:
+            list order_ids = [None] * len(orders)
+            dict order_indexes_by_exchange = {}
+
+        for idx, (market_trading_pair_tuple, order) in enumerate(orders):
+            market = market_trading_pair_tuple.market
+            if market not in self._sb_markets:
+                raise ValueError(f"Market object for batch order is not in the whitelisted markets set.")
+            if isinstance(market, ExchangeBase):
+                order_indexes_by_exchange.setdefault(market, []).append(idx)
+            elif order.is_buy:
+                order_ids[idx] = self.c_buy_with_specific_market(market_trading_pair_tuple, order.quantity,
+                                                                 order_type, order.price, expiration_seconds,
+                                                                 position_action)
+            else:
+                order_ids[idx] = self.c_sell_with_specific_market(market_trading_pair_tuple, order.quantity,
+                                                                  order_type, order.price, expiration_seconds,
+                                                                  position_action)
+
+        for exchange, order_indexes in order_indexes_by_exchange.items():
+            created_orders = exchange.batch_order_create([orders[idx][1] for idx in order_indexes],
+                                                         order_type=order_type,
+                                                         expiration_ts=self._current_timestamp + expiration_seconds,
+                                                         position_action=position_action)
+            for idx, created_order in zip(order_indexes, created_orders):
+                self.c_start_tracking_limit_order(orders[idx][0], created_order.client_order_id, created_order.is_buy,
+                                                  created_order.price, created_order.quantity)
+                order_ids[idx] = created_order.client_order_id
+        return order_ids
+
+    def batch_cancel_orders(self, orders: List[Tuple[MarketTradingPairTuple, str]]):
+        """
+        Cancels several orders at once. The orders are grouped by connector and each group is cancelled with the
+        connector batch order cancellation. The orders with a cancellation already in flight are skipped.
+        :param orders: the ids of the orders to cancel, with their markets
+        """
+        cdef:
+            ConnectorBase market
+            dict orders_to_cancel_by_exchange = {}
+
+        for market_trading_pair_tuple, order_id in orders:
+            if not self._sb_order_tracker.c_check_and_track_cancel(order_id):
+                continue
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_trading_pair_tuple.trading_pair}) Cancelling the limit order {order_id}."
+            )
+            market = market_trading_pair_tuple.market
+            order = self._sb_order_tracker.c_get_limit_order(market_trading_pair_tuple, order_id)
+            if isinstance(market, ExchangeBase) and order is not None:
+                orders_to_cancel_by_exchange.setdefault(market, []).append(order)
+            else:
+                market.c_cancel(market_trading_pair_tuple.trading_pair, order_id)
+
+        for exchange, orders_to_cancel in orders_to_cancel_by_exchange.items():
+            exchange.batch_order_cancel(orders_to_cancel)
+
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
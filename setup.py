@@ -145,7 +145,8 @@ def main():
           ],
           scripts=[
               "bin/hummingbot.py",
-              "bin/hummingbot_quickstart.py"
+              "bin/hummingbot_quickstart.py",
+              "bin/hummingbot_backtest.py"
           ],
           cmdclass={'build_ext': BuildExt},
           )
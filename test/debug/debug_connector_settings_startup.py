@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""
+Measures the time taken to create the connector settings and load the global config map (which holds the config keys
+of all the connectors) in a new process, with the connector manifest and with the connector utils modules imported at
+startup.
+"""
+
+import subprocess
+import sys
+from os.path import join, realpath
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client.connector_manifest import build_connector_manifest, save_connector_manifest
+
+NUM_RUNS = 5
+STARTUP_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from hummingbot.client.settings import AllConnectorSettings
+AllConnectorSettings.create_connector_settings(use_manifest={use_manifest})
+from hummingbot.client.config.global_config_map import global_config_map
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+
+def startup(use_manifest: bool):
+    output: str = subprocess.check_output(
+        [sys.executable, "-c", STARTUP_SCRIPT.format(use_manifest=use_manifest)],
+        cwd=realpath(join(__file__, "../../../")),
+    ).decode()
+    duration, imported_modules = output.split()[-2:]
+    return float(duration), int(imported_modules)
+
+
+def main():
+    save_connector_manifest(build_connector_manifest())
+    rows = []
+    for use_manifest in (False, True):
+        durations, imported_modules = zip(*[startup(use_manifest) for _ in range(NUM_RUNS)])
+        durations = np.array(durations) * 1e3
+        rows.append({
+            "connector settings": "manifest" if use_manifest else "utils modules",
+            "runs": NUM_RUNS,
+            "mean (ms)": round(durations.mean(), 1),
+            "median (ms)": round(np.median(durations), 1),
+            "imported modules": imported_modules[0],
+        })
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
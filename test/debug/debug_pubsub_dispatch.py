@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+"""
+Measures how many events per second PubSub.trigger_event() dispatches with 1, 10 and 100 listeners. The listeners are
+event loggers, so the measure is dominated by the dispatch rather than by the work done by the listeners.
+"""
+
+import time
+from enum import Enum
+
+import pandas as pd
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.pubsub import PubSub
+
+NUM_EVENTS = 200000
+LISTENER_COUNTS = [1, 10, 100]
+
+
+class BenchmarkEventType(Enum):
+    BenchmarkEvent = 1
+
+
+def events_per_second(num_listeners: int, num_events: int) -> float:
+    pubsub = PubSub()
+    listeners = [EventLogger() for _ in range(num_listeners)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEventType.BenchmarkEvent, listener)
+
+    start = time.perf_counter()
+    for i in range(num_events):
+        pubsub.trigger_event(BenchmarkEventType.BenchmarkEvent, i)
+    elapsed = time.perf_counter() - start
+
+    assert all(listener.event_log[-1] == num_events - 1 for listener in listeners)
+    return num_events / elapsed
+
+
+def main():
+    rows = []
+    for num_listeners in LISTENER_COUNTS:
+        rate = events_per_second(num_listeners, NUM_EVENTS // num_listeners)
+        rows.append({
+            "listeners": num_listeners,
+            "events/s": round(rate),
+            "listener calls/s": round(rate * num_listeners),
+        })
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""
+Measures the reaction latency of a clock iterator to order book changes, from the diff application to the end of the
+first tick seeing it, with the regular 1 second ticks and with reactive ticks. The diffs are applied at random times.
+"""
+
+import asyncio
+import random
+import time
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+NUM_CHANGES = 40
+REACTIVE_TICK_INTERVALS = [None, 0.1, 0.01]
+
+
+class ReactionRecorder(PyTimeIterator):
+    def __init__(self, order_book: OrderBook):
+        super().__init__()
+        self._order_book = order_book
+        self._last_best_bid: float = order_book.get_price(False)
+        self.pending_change_time: Optional[float] = None
+        self.latencies: List[float] = []
+
+    def tick(self, timestamp: float):
+        best_bid = self._order_book.get_price(False)
+        if best_bid != self._last_best_bid and self.pending_change_time is not None:
+            self.latencies.append(time.time() - self.pending_change_time)
+            self.pending_change_time = None
+        self._last_best_bid = best_bid
+
+
+async def change_order_book(order_book: OrderBook, recorder: ReactionRecorder):
+    no_entries = np.empty((0, 3), dtype=np.float64)
+    for i in range(NUM_CHANGES):
+        await asyncio.sleep(random.uniform(0.3, 1.5))
+        recorder.pending_change_time = time.time()
+        order_book.apply_numpy_diffs(np.array([[100 + i * 0.01, 1, i + 2]], dtype=np.float64), no_entries)
+    await asyncio.sleep(1.5)
+
+
+def reaction_latencies(reactive_tick_interval: Optional[float]) -> List[float]:
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                    np.array([[101, 1, 1]], dtype=np.float64))
+    recorder = ReactionRecorder(order_book)
+    clock = Clock(ClockMode.REALTIME, reactive_tick_interval=reactive_tick_interval)
+    clock.add_iterator(recorder)
+    clock.watch_order_book(order_book)
+    ev_loop = asyncio.get_event_loop()
+    with clock:
+        clock_task = ev_loop.create_task(clock.run())
+        ev_loop.run_until_complete(change_order_book(order_book, recorder))
+        clock_task.cancel()
+        ev_loop.run_until_complete(asyncio.gather(clock_task, return_exceptions=True))
+    return recorder.latencies
+
+
+def main():
+    rows = []
+    for reactive_tick_interval in REACTIVE_TICK_INTERVALS:
+        latencies = np.array(reaction_latencies(reactive_tick_interval)) * 1e3
+        rows.append({
+            "reactive tick interval": reactive_tick_interval or "-",
+            "changes": len(latencies),
+            "mean (ms)": round(latencies.mean(), 2),
+            "median (ms)": round(np.median(latencies), 2),
+            "max (ms)": round(latencies.max(), 2),
+        })
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import asyncio
 import unittest
 from collections import Awaitable
 from copy import deepcopy
+from decimal import Decimal
 from unittest.mock import patch, MagicMock
 
 from hummingbot.client.command.config_command import color_settings_to_display, global_configs_to_display
@@ -9,6 +10,7 @@ from hummingbot.client.config.config_helpers import read_system_configs_from_yml
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
 
 
 class ConfigCommandTest(unittest.TestCase):
@@ -102,3 +104,29 @@ class ConfigCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[5])
+
+    def test_inventory_price_prompt_updates_the_running_strategy_volumes(self):
+        async def prompt_a_config(config_var, *args, **kwargs):
+            config_var.value = Decimal("100")
+
+        global_config_map["paper_trade_account_balance"].value = {"BTC": Decimal("2"), "USDT": Decimal("1000")}
+        config_map = {
+            "exchange": ConfigVar(key="exchange", prompt=""),
+            "market": ConfigVar(key="market", prompt=""),
+            "inventory_price": ConfigVar(key="inventory_price", prompt=""),
+        }
+        config_map["exchange"].value = "binance_paper_trade"
+        config_map["market"].value = "BTC-USDT"
+        delegate = MagicMock()
+        delegate.base_asset = "BTC"
+        delegate.quote_asset = "USDT"
+        self.app.strategy = MagicMock(spec=PureMarketMakingStrategy)
+        self.app.strategy.inventory_cost_price_delegate = delegate
+        self.app.trade_fill_db = MagicMock()
+
+        with patch.object(self.app, "prompt_a_config", side_effect=prompt_a_config):
+            self.async_run_with_timeout(self.app.inventory_price_prompt(config_map))
+
+        self.assertEqual(Decimal("100"), config_map["inventory_price"].value)
+        delegate.set_volumes.assert_called_once_with(Decimal("2"), Decimal("200"))
+        self.app.trade_fill_db.get_new_session.assert_not_called()
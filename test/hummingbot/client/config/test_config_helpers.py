@@ -1,6 +1,10 @@
 import asyncio
 import unittest
 from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.client.config.config_helpers import fetch_connectors_trading_pairs
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class ConfigHelpersTest(unittest.TestCase):
@@ -17,3 +21,16 @@ class ConfigHelpersTest(unittest.TestCase):
         async def async_sleep(*_, **__):
             await asyncio.sleep(delay)
         return async_sleep
+
+    def test_fetch_connectors_trading_pairs_fetches_unknown_connectors(self):
+        fetcher_mock = MagicMock()
+        fetcher_mock.has_trading_pairs.side_effect = lambda connector_name: connector_name == "kucoin"
+        fetcher_mock.fetch = AsyncMock(return_value=["BTC-USDT"])
+        TradingPairFetcher._sf_shared_instance = fetcher_mock
+        try:
+            self.async_run_with_timeout(
+                fetch_connectors_trading_pairs(["binance", "kucoin", "BTC-USDT", 1, ["binance"]]))
+        finally:
+            TradingPairFetcher._sf_shared_instance = None
+
+        fetcher_mock.fetch.assert_awaited_once_with("binance")
@@ -1,9 +1,11 @@
 
 import unittest
+from unittest.mock import MagicMock
 
 import hummingbot.client.config.config_validators as config_validators
 
 from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class TimestampValidationTests(unittest.TestCase):
@@ -49,3 +51,30 @@ class TimestampValidationTests(unittest.TestCase):
 
         validation_error = config_validators.validate_connector(non_existant_connector)
         self.assertEqual(validation_error, f"Invalid connector, please choose value from {AllConnectorSettings.get_connector_settings().keys()}")
+
+
+class MarketTradingPairValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.fetcher_mock = MagicMock()
+        self.fetcher_mock.ready = True
+        self.fetcher_mock.get_trading_pairs.side_effect = lambda market: {"binance": ["BTC-USDT"]}.get(market, [])
+        self.fetcher_mock.has_trading_pairs.side_effect = lambda market: market == "binance"
+        TradingPairFetcher._sf_shared_instance = self.fetcher_mock
+
+    def tearDown(self) -> None:
+        TradingPairFetcher._sf_shared_instance = None
+        super().tearDown()
+
+    def test_validate_market_trading_pair(self):
+        self.assertIsNone(config_validators.validate_market_trading_pair("binance", "BTC-USDT"))
+        self.assertEqual("ETH-USDT is not an active market on binance.",
+                         config_validators.validate_market_trading_pair("binance", "ETH-USDT"))
+
+    def test_validate_market_trading_pair_not_fetched_yet(self):
+        with self.assertLogs("hummingbot.client.config.config_validators", level="WARNING") as logs:
+            self.assertIsNone(config_validators.validate_market_trading_pair("kucoin", "ETH-USDT"))
+
+        self.assertIn("The trading pairs of kucoin are still being fetched, ETH-USDT has not been validated.",
+                      logs.output[0])
+        self.fetcher_mock.get_trading_pairs.assert_called_with("kucoin")
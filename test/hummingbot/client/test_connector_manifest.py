@@ -0,0 +1,130 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from typing import Any, Awaitable, Dict
+from unittest.mock import patch
+
+from hummingbot.client import settings
+from hummingbot.client.connector_manifest import (
+    build_connector_manifest,
+    config_keys_from_entry,
+    connector_sources_fingerprint,
+    load_connector_manifest,
+    save_connector_manifest,
+)
+from hummingbot.client.settings import AllConnectorSettings
+
+KRAKEN_UTILS = "hummingbot.connector.exchange.kraken.kraken_utils"
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    manifest: Dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.manifest = build_connector_manifest()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "connector_manifest.json")
+        # The settings load the manifest from its default path, it must not be written in the source tree
+        manifest_path_patch = patch("hummingbot.client.connector_manifest.manifest_path",
+                                    return_value=self.manifest_path)
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+
+    def tearDown(self) -> None:
+        settings.required_exchanges.clear()
+        AllConnectorSettings.create_connector_settings()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def kraken_entry(self) -> Dict[str, Any]:
+        return next(connector for connector in self.manifest["connectors"] if connector["name"] == "kraken")
+
+    def test_manifest_settings_match_utils_modules_settings(self):
+        module_settings = dict(AllConnectorSettings.create_connector_settings(use_manifest=False))
+        manifest_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual(module_settings.keys(), manifest_settings.keys())
+        for name, module_setting in module_settings.items():
+            manifest_setting = manifest_settings[name]
+            for field in ("type", "centralised", "example_pair", "use_ethereum_wallet", "trade_fee_schema",
+                          "is_sub_domain", "parent_name", "domain_parameter", "use_eth_gas_lookup"):
+                self.assertEqual(getattr(module_setting, field), getattr(manifest_setting, field), f"{name} {field}")
+            self.assertEqual(module_setting.config_keys.keys(), manifest_setting.config_keys.keys())
+            for key, config_var in module_setting.config_keys.items():
+                manifest_config_var = manifest_setting.config_keys[key]
+                for attribute in ("key", "prompt", "is_secure", "default", "type", "is_connect_key", "printable_key"):
+                    self.assertEqual(getattr(config_var, attribute), getattr(manifest_config_var, attribute))
+
+    def test_config_keys_import_utils_module_when_needed(self):
+        sys.modules.pop(KRAKEN_UTILS, None)
+        kraken_entry = self.kraken_entry()
+        self.assertEqual({"using_exchange": "kraken"}, kraken_entry["config_keys"]["kraken_api_tier"]["required_if"])
+
+        config_keys = config_keys_from_entry(kraken_entry["config_keys"], kraken_entry["module_path"])
+        api_tier = config_keys["kraken_api_tier"]
+
+        self.assertNotIn(KRAKEN_UTILS, sys.modules)
+        self.assertEqual("Starter", api_tier.default)
+        self.assertFalse(api_tier.required)
+        settings.required_exchanges.append("kraken")
+        self.assertTrue(api_tier.required)
+        self.assertNotIn(KRAKEN_UTILS, sys.modules)
+
+        self.assertIsNone(self.async_run_with_timeout(api_tier.validate("Pro")))
+        self.assertIn(KRAKEN_UTILS, sys.modules)
+        self.assertIsNotNone(self.async_run_with_timeout(api_tier.validate("Unknown")))
+
+    def test_load_connector_manifest_saves_manifest(self):
+        self.assertFalse(os.path.exists(self.manifest_path))
+
+        manifest = load_connector_manifest(self.manifest_path)
+
+        self.assertEqual(connector_sources_fingerprint(), manifest["fingerprint"])
+        with open(self.manifest_path) as manifest_file:
+            self.assertEqual(manifest, json.load(manifest_file))
+
+    def test_load_connector_manifest_rebuilds_outdated_manifest(self):
+        outdated_manifest = dict(self.manifest)
+        outdated_manifest["fingerprint"] = dict(self.manifest["fingerprint"], **{KRAKEN_UTILS: 0})
+        outdated_manifest["connectors"] = []
+        save_connector_manifest(outdated_manifest, self.manifest_path)
+
+        manifest = load_connector_manifest(self.manifest_path)
+
+        self.assertEqual(self.manifest["connectors"], manifest["connectors"])
+        self.assertEqual(connector_sources_fingerprint(), manifest["fingerprint"])
+
+        save_connector_manifest(dict(self.manifest, connectors=[]), self.manifest_path)
+        self.assertEqual([], load_connector_manifest(self.manifest_path)["connectors"])
+
+    def test_load_connector_manifest_rebuilds_manifest_when_skipped_module_is_installed(self):
+        skipped_connector_manifest = dict(self.manifest)
+        skipped_connector_manifest["skipped_modules"] = {KRAKEN_UTILS: "hummingbot_non_existent_module"}
+        skipped_connector_manifest["connectors"] = [
+            connector for connector in self.manifest["connectors"] if connector["name"] != "kraken"]
+        save_connector_manifest(skipped_connector_manifest, self.manifest_path)
+
+        # The missing module is still not installed
+        self.assertEqual(skipped_connector_manifest["connectors"],
+                         load_connector_manifest(self.manifest_path)["connectors"])
+
+        skipped_connector_manifest["skipped_modules"] = {KRAKEN_UTILS: "json"}
+        save_connector_manifest(skipped_connector_manifest, self.manifest_path)
+
+        manifest = load_connector_manifest(self.manifest_path)
+
+        self.assertEqual(self.manifest["connectors"], manifest["connectors"])
+        self.assertEqual(self.manifest["skipped_modules"], manifest["skipped_modules"])
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Awaitable, List
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.config_helpers import read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.data_type.market_data_service import MarketDataService
+from hummingbot.core.data_type.market_data_service_order_book_data_source import (
+    MarketDataServiceOrderBookDataSource,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from test.hummingbot.core.data_type.test_market_data_service import MockOrderBookTracker
+
+
+class HummingbotApplicationMarketDataServiceTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.app = HummingbotApplication()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "market_data_service.sock")
+        self.service_trackers: List[MockOrderBookTracker] = []
+        self.service = MarketDataService(self.socket_path, publish_interval=0.01, tracker_factory=self.create_tracker)
+
+    def tearDown(self) -> None:
+        self.service.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_tracker(self, connector_name: str, trading_pairs: List[str]) -> MockOrderBookTracker:
+        tracker = MockOrderBookTracker(trading_pairs)
+        self.service_trackers.append(tracker)
+        return tracker
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def wait_for(self, condition):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    def test_binance_order_books_are_received_from_market_data_service(self):
+        self.async_run_with_timeout(self.service.start())
+        self.service.track("binance", [self.trading_pair])
+        service_order_book: OrderBook = self.service.trackers["binance"].order_books[self.trading_pair]
+        service_order_book.last_trade_price = 10.5
+        connector = BinanceExchange(
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+            trading_required=False)
+        self.app.markets = {"binance": connector}
+        self.app.market_trading_pairs_map = {"binance": [self.trading_pair]}
+
+        self.app._use_market_data_service(self.socket_path)
+
+        order_book_tracker = connector.order_book_tracker
+        self.assertIsInstance(order_book_tracker.data_source, MarketDataServiceOrderBookDataSource)
+        order_book_tracker.start()
+        try:
+            self.async_run_with_timeout(self.wait_for(lambda: order_book_tracker.ready))
+            order_book: OrderBook = order_book_tracker.order_books[self.trading_pair]
+            self.assertEqual(10, order_book.get_price(False))
+            self.assertEqual(11, order_book.get_price(True))
+
+            service_order_book.apply_raw_diff([["10", "0"], ["9.5", "3"]], [["10.5", "1"]], 2)
+            self.async_run_with_timeout(self.wait_for(lambda: order_book.get_price(True) == 10.5))
+            self.assertEqual(9.5, order_book.get_price(False))
+            self.async_run_with_timeout(self.wait_for(lambda: order_book.last_trade_price == 10.5))
+        finally:
+            order_book_tracker.stop()
+
+    def test_trackers_converting_exchange_messages_keep_their_data_source(self):
+        order_book_tracker = MagicMock()
+        order_book_tracker.handles_generic_order_book_messages = False
+        connector = MagicMock()
+        connector.order_book_tracker = order_book_tracker
+        self.app.markets = {"kucoin": connector}
+        self.app.market_trading_pairs_map = {"kucoin": [self.trading_pair]}
+
+        self.app._use_market_data_service(self.socket_path)
+
+        order_book_tracker.set_data_source.assert_not_called()
+
+    @patch("hummingbot.client.hummingbot_application.MarketDataRecorder")
+    def test_market_data_of_trackers_converting_exchange_messages_is_not_recorded(self, recorder_class_mock):
+        order_book_tracker = MagicMock()
+        order_book_tracker.handles_generic_order_book_messages = False
+        order_book_tracker.market_data_recorder = None
+        connector = MagicMock()
+        connector.order_book_tracker = order_book_tracker
+        self.app.markets = {"kucoin": connector}
+
+        self.app._initialize_market_data_recorders()
+
+        order_book_tracker.set_market_data_recorder.assert_not_called()
+        recorder_class_mock.assert_not_called()
+        self.assertEqual([], self.app.market_data_recorders)
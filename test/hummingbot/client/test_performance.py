@@ -5,10 +5,11 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, TradePerformanceTracker, TradesSummary
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
@@ -326,3 +327,164 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         expected_fee_amount += flat_fees[0].amount * Decimal("0.9") * Decimal("2")
         expected_fee_amount += flat_fees[1].amount * Decimal("2")
         self.assertEqual(expected_fee_amount, performance_metric.fee_in_quote)
+
+
+class TradesSummaryUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self, order_id: str, trade_type: str, price, amount, position=PositionAction.NIL.value,
+                   trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0"))])) -> TradeFill:
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=int(time.time()),
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"exchange{order_id}",
+            position=position,
+        )
+
+    def order_filled_event(self, order_id: str, trade_type: TradeType, price: Decimal, amount: Decimal,
+                           position=PositionAction.NIL.value, trade_fee=AddedToCostTradeFee()) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=time.time(),
+            order_id=order_id,
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee,
+            position=position,
+        )
+
+    def test_metrics_from_summary_match_metrics_from_trades(self):
+        trades = [
+            self.trade_fill("someId0", "BUY", 100, 10,
+                            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"),
+                                                          flat_fees=[TokenAmount(base, Decimal("1"))])),
+            self.trade_fill("someId1", "SELL", 120, 15),
+        ]
+        summary = TradesSummary(trading_pair)
+        for trade in trades:
+            summary.add_trade_fill(trade)
+        cur_bals = {base: 100, quote: 10000}
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create_from_summary(summary, cur_bals))
+
+        self.assertEqual(Decimal("799"), metrics.trade_pnl)
+        self.assertFalse(summary.are_derivatives)
+        self.assertEqual(0, len(summary.position_buys) + len(summary.position_sells))
+        self.assertEqual(expected, metrics)
+
+    def test_metrics_from_order_filled_events(self):
+        summary = TradesSummary(trading_pair)
+        summary.add_order_filled_event(self.order_filled_event("someId0", TradeType.BUY, Decimal("100"), Decimal("10")))
+        summary.add_order_filled_event(self.order_filled_event(
+            "someId1", TradeType.SELL, Decimal("120"), Decimal("15"), trade_fee=AddedToCostTradeFee(Decimal("0.1"))))
+
+        metrics = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_summary(summary, {base: 100, quote: 10000}))
+
+        self.assertEqual(2, metrics.num_trades)
+        self.assertEqual(Decimal("100"), metrics.start_price)
+        self.assertEqual(Decimal("799"), metrics.trade_pnl)
+        self.assertEqual(Decimal("180"), metrics.fee_in_quote)
+        self.assertEqual(Decimal("619"), metrics.total_pnl)
+
+    def test_metrics_from_summary_for_derivatives(self):
+        summary = TradesSummary(trading_pair)
+        summary.add_trade_fill(self.trade_fill("order1", "BUY", 10, 100, position="OPEN"))
+        summary.add_trade_fill(self.trade_fill("order2", "SELL", 15, 100, position="CLOSE"))
+        summary.add_trade_fill(self.trade_fill("order3", "SELL", 20, 100, position="OPEN"))
+        summary.add_trade_fill(self.trade_fill("order4", "BUY", 15, 100, position="CLOSE"))
+
+        metrics = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_summary(summary, {base: 100, quote: 10000}))
+
+        self.assertTrue(summary.are_derivatives)
+        self.assertEqual(4, metrics.num_trades)
+        self.assertEqual(Decimal("1000"), metrics.trade_pnl)
+        # Calculating the metrics does not modify the fills of the summary
+        self.assertEqual([Decimal("100"), Decimal("100")], [fill.amount for fill in summary.position_buys])
+
+    def test_summary_does_not_keep_spot_fills(self):
+        summary = TradesSummary(trading_pair)
+        for i in range(100):
+            summary.add_trade_fill(self.trade_fill(f"order{i}", "BUY", 100 + i, 1))
+
+        self.assertEqual(100, summary.num_buys)
+        self.assertFalse(summary.are_derivatives)
+        self.assertEqual([], summary.position_buys)
+
+    def test_summary_merges_derivative_fills_of_an_order(self):
+        trades = [
+            self.trade_fill("order1", "BUY", 10, 40, position="OPEN"),
+            self.trade_fill("order1", "BUY", 12, 60, position="OPEN"),
+            self.trade_fill("order2", "SELL", 15, 50, position="CLOSE"),
+            self.trade_fill("order2", "SELL", 16, 30, position="CLOSE"),
+            self.trade_fill("order2", "SELL", 17, 20, position="CLOSE"),
+        ]
+        summary = TradesSummary(trading_pair)
+        for trade in trades:
+            summary.add_trade_fill(trade)
+        cur_bals = {base: 100, quote: 10000}
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create_from_summary(summary, cur_bals))
+
+        self.assertEqual([(Decimal("11"), Decimal("100"))],
+                         [(fill.price, fill.amount) for fill in summary.position_buys])
+        self.assertEqual([(Decimal("16"), Decimal("100"))],
+                         [(fill.price, fill.amount) for fill in summary.position_sells])
+        self.assertEqual(Decimal("500"), metrics.trade_pnl)
+        self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+
+    def test_tracker_updates_summaries_with_order_filled_events(self):
+        market = MagicMock(display_name="binance")
+        tracker = TradePerformanceTracker([market])
+        tracker.add_trade_fills([self.trade_fill("someId0", "BUY", 100, 10)])
+        tracker.start()
+
+        market.add_listener.assert_called_once_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
+
+        tracker._did_fill_order(MarketEvent.OrderFilled.value,
+                                market,
+                                self.order_filled_event("someId1", TradeType.SELL, Decimal("120"), Decimal("15")))
+        other_market = MagicMock(display_name="kucoin")
+        tracker._did_fill_order(MarketEvent.OrderFilled.value,
+                                other_market,
+                                self.order_filled_event("someId2", TradeType.BUY, Decimal("110"), Decimal("1")))
+
+        self.assertEqual(3, tracker.num_trades)
+        self.assertEqual([("binance", trading_pair), ("kucoin", trading_pair)], list(tracker.summaries.keys()))
+        binance_summary = tracker.summaries[("binance", trading_pair)]
+        self.assertEqual(1, binance_summary.num_sells)
+        self.assertEqual(Decimal("100"), binance_summary.start_price)
+        self.assertEqual(Decimal("120"), binance_summary.last_price)
+
+        tracker.stop()
+
+        market.remove_listener.assert_called_once_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Awaitable, List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_constants as CONSTANTS
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_utils
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -462,3 +463,73 @@ class TestAscendExExchange(unittest.TestCase):
         )
 
         self.assertEqual(result, expected_client_order_id)
+
+    @aioresponses()
+    def test_batch_order_create_places_orders_in_one_request(self, mock_api):
+        self.simulate_trading_rules_initialized()
+        self.exchange._account_group = 0
+        url = f"{ascend_ex_utils.get_rest_url_private(0)}/{CONSTANTS.ORDER_BATCH_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        requests = []
+
+        def place_orders(url, **kwargs):
+            orders = json.loads(kwargs["data"])["orders"]
+            requests.append(orders)
+            info = [{"id": order["id"], "orderId": f"exchangeId{i}", "orderType": "Limit", "symbol": order["symbol"],
+                     "timestamp": 1573619097746} for i, order in enumerate(orders)]
+            response = {"code": 0, "data": {"ac": "CASH", "action": "batch-place-order", "status": "Ack", "info": info}}
+            return CallbackResult(body=json.dumps(response))
+
+        mock_api.post(regex_url, callback=place_orders)
+
+        orders = [
+            LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("9"), Decimal("1")),
+            LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("11"), Decimal("2")),
+        ]
+        created_orders = self.exchange.batch_order_create(orders)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, len(requests))
+        self.assertEqual(["buy", "sell"], [order["side"] for order in requests[0]])
+        self.assertEqual(["9.0000", "11.0000"], [order["orderPrice"] for order in requests[0]])
+        self.assertEqual(2, len(created_orders))
+        for i, created_order in enumerate(created_orders):
+            tracked_order = self.exchange.in_flight_orders[created_order.client_order_id]
+            self.assertEqual(orders[i].is_buy, created_order.is_buy)
+            self.assertEqual(f"exchangeId{i}", tracked_order.exchange_order_id)
+            self.assertEqual(orders[i].quantity, tracked_order.amount)
+
+    @aioresponses()
+    def test_batch_order_cancel_cancels_orders_with_exchange_id_in_one_request(self, mock_api):
+        self.exchange._account_group = 0
+        url = f"{ascend_ex_utils.get_rest_url_private(0)}/{CONSTANTS.ORDER_BATCH_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        requests = []
+
+        def cancel_orders(url, **kwargs):
+            requests.append(json.loads(kwargs["data"])["orders"])
+            return CallbackResult(body=json.dumps({"code": 0, "data": {"status": "Ack", "info": []}}))
+
+        mock_api.delete(regex_url, callback=cancel_orders)
+
+        for i in range(2):
+            self.exchange.start_tracking_order(
+                order_id=f"testOrderId{i}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                exchange_order_id=f"exchangeId{i}",
+            )
+        orders = [LimitOrder(f"testOrderId{i}", self.trading_pair, True, self.base_asset, self.quote_asset,
+                             Decimal("10000"), Decimal("1"))
+                  for i in range(2)]
+
+        with patch.object(self.exchange, "cancel") as cancel_mock:
+            self.exchange.batch_order_cancel(orders)
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        cancel_mock.assert_not_called()
+        self.assertEqual(1, len(requests))
+        self.assertEqual(["exchangeId0", "exchangeId1"], [order["orderId"] for order in requests[0]])
@@ -1078,6 +1078,68 @@ class BinanceExchangeTests(TestCase):
         self.assertEqual(order.order_type, failure_event.order_type)
         self.assertNotIn(order.client_order_id, self.exchange.in_flight_orders)
 
+    @aioresponses()
+    def test_update_order_status_reconciles_open_orders_in_bulk(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._last_poll_timestamp = (self.exchange.current_timestamp -
+                                              self.exchange.UPDATE_ORDER_STATUS_MIN_INTERVAL - 1)
+
+        for i in range(6):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=str(100230 + i),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        orders = [self.exchange.in_flight_orders[f"OID{i}"] for i in range(6)]
+
+        def order_status(order: InFlightOrder, status: str):
+            return {
+                "symbol": self.exchange_trading_pair,
+                "orderId": int(order.exchange_order_id),
+                "clientOrderId": order.client_order_id,
+                "price": "10000.0",
+                "origQty": "1.0",
+                "executedQty": "0.5" if status == "PARTIALLY_FILLED" else "0.0",
+                "status": status,
+                "type": "LIMIT",
+                "side": "BUY",
+                "time": 1499827319559,
+                "updateTime": 1499827319559,
+            }
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        open_orders_regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        open_orders = [order_status(orders[0], "PARTIALLY_FILLED")]
+        open_orders.extend(order_status(order, "NEW") for order in orders[1:5])
+        mock_api.get(open_orders_regex_url, body=json.dumps(open_orders))
+
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        order_regex_url = re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(order_regex_url, body=json.dumps(order_status(orders[5], "CANCELED")))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        order_requests = [value for key, value in mock_api.requests.items()
+                          if key[1].human_repr().startswith(order_url)]
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(orders[5].client_order_id, order_requests[0][0].kwargs["params"]["origClientOrderId"])
+        open_orders_request = next(value for key, value in mock_api.requests.items()
+                                   if key[1].human_repr().startswith(open_orders_url))
+        self.assertEqual(self.exchange_trading_pair, open_orders_request[0].kwargs["params"]["symbol"])
+        self._validate_auth_credentials_for_request(open_orders_request[0])
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, orders[0].current_state)
+        self.assertEqual(5, len(self.exchange.in_flight_orders))
+        cancel_event: OrderCancelledEvent = self.order_cancelled_logger.event_log[0]
+        self.assertEqual(orders[5].client_order_id, cancel_event.order_id)
+        self.assertTrue(self._is_logged(
+            "DEBUG",
+            "Order status of 6 orders updated with 4 request weight (2 saved by the open orders reconciliation)."))
+
     @aioresponses()
     def test_update_trading_rules(self, mock_api):
         url = web_utils.private_rest_url(CONSTANTS.EXCHANGE_INFO_PATH_URL)
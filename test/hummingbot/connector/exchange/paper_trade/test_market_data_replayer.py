@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.market_data_replayer import MarketDataReplayer
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.historical_market_data import (
+    ASK_SIDE,
+    BID_SIDE,
+    DIFF_MESSAGE_TYPE,
+    ORDER_BOOK_RECORD_DTYPE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_RECORD_DTYPE,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class MarketDataReplayerTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = OrderBook()
+        self.trade_logger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.TradeEvent, self.trade_logger)
+        self.replayer = MarketDataReplayer()
+        order_book_records = np.array([
+            (1.0, 1, 10.0, 1.0, BID_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (1.0, 1, 11.0, 1.0, ASK_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (2.0, 2, 10.5, 2.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (2.5, 3, 10.5, 3.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (3.0, 4, 9.0, 1.0, BID_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (3.0, 4, 9.5, 1.0, ASK_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (3.5, 5, 9.2, 1.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (4.0, 6, 9.2, 0.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+        ], dtype=ORDER_BOOK_RECORD_DTYPE)
+        trade_records = np.array([
+            (1.5, 10.5, 0.5, TradeType.BUY.value),
+            (3.5, 9.3, 0.1, TradeType.SELL.value),
+        ], dtype=TRADE_RECORD_DTYPE)
+        self.replayer.add_trading_pair(self.trading_pair, self.order_book, order_book_records, trade_records)
+
+    def test_tick_applies_snapshot_and_diffs_up_to_timestamp(self):
+        self.replayer.tick(1.0)
+
+        self.assertEqual(10.0, self.order_book.get_price(False))
+        self.assertEqual(11.0, self.order_book.get_price(True))
+
+        self.replayer.tick(2.5)
+
+        self.assertEqual(10.5, self.order_book.get_price(False))
+        bids = list(self.order_book.bid_entries())
+        self.assertEqual(3.0, bids[0].amount)
+        self.assertEqual(3, self.order_book.last_diff_uid)
+
+    def test_tick_skips_records_superseded_by_a_later_snapshot(self):
+        self.replayer.tick(3.5)
+
+        self.assertEqual([9.2, 9.0], [entry.price for entry in self.order_book.bid_entries()])
+        self.assertEqual(9.5, self.order_book.get_price(True))
+        self.assertEqual(4, self.order_book.snapshot_uid)
+        self.assertEqual(7, self.replayer.applied_order_book_records)
+
+    def test_tick_emits_trades_from_the_order_book(self):
+        self.replayer.tick(2.0)
+
+        self.assertEqual(1, len(self.trade_logger.event_log))
+        trade = self.trade_logger.event_log[0]
+        self.assertEqual(self.trading_pair, trade.trading_pair)
+        self.assertEqual(TradeType.BUY, trade.type)
+        self.assertEqual(10.5, trade.price)
+
+        self.replayer.tick(4.0)
+
+        self.assertEqual(2, len(self.trade_logger.event_log))
+        self.assertEqual(TradeType.SELL, self.trade_logger.event_log[1].type)
+        self.assertEqual(9.3, self.order_book.last_trade_price)
+        self.assertTrue(self.replayer.is_exhausted)
+        self.assertEqual([9.0], [entry.price for entry in self.order_book.bid_entries()])
+
+    def test_add_trading_pair_rejects_records_with_wrong_format(self):
+        with self.assertRaises(ValueError):
+            self.replayer.add_trading_pair(self.trading_pair, self.order_book, np.zeros((2, 3)))
+
+    def test_tick_reapplies_diffs_recorded_before_a_more_recent_snapshot(self):
+        order_book_records = np.array([
+            (1.0, 1, 10.0, 1.0, BID_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (2.0, 3, 10.2, 1.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (2.0, 4, 10.4, 1.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (3.0, 3, 10.1, 1.0, BID_SIDE, SNAPSHOT_MESSAGE_TYPE),
+        ], dtype=ORDER_BOOK_RECORD_DTYPE)
+        order_book = OrderBook()
+        self.replayer.add_trading_pair(self.trading_pair, order_book, order_book_records)
+
+        self.replayer.tick(2.0)
+        self.replayer.tick(3.0)
+
+        # The diff received before the snapshot but more recent than it is applied on top of it
+        self.assertEqual([10.4, 10.1], [entry.price for entry in order_book.bid_entries()])
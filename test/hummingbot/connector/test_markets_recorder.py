@@ -15,6 +15,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -45,6 +46,9 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -262,3 +266,85 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_write_behind_records_are_written_on_flush(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        self.assertEqual(2, recorder.write_queue_depth)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+
+        self.tracking_states = {"OID1-1642010000000000": {"state": "last"}}
+        recorder.flush()
+
+        self.assertEqual(0, recorder.write_queue_depth)
+        self.assertGreater(recorder.last_flush_latency, 0)
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            market_states = session.query(MarketState).all()
+
+            self.assertEqual(1, len(orders))
+            self.assertEqual(2, len(order_status))
+            self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
+            self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
+            # Both events share a single market state snapshot, captured when the records are flushed
+            self.assertEqual(1, len(market_states))
+            self.assertEqual(self.tracking_states, market_states[0].saved_state)
+
+    def test_write_behind_stop_writes_pending_records(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+        event = SellOrderCreatedEvent(
+            timestamp=int(time.time()),
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.SellOrderCreated.value, self, event)
+
+        recorder.stop()
+
+        self.assertEqual(0, recorder.write_queue_depth)
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(1, len(orders))
+            self.assertEqual(event.order_id, orders[0].id)
@@ -224,3 +224,87 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
             )
+
+    def test_execute_task_registers_weight_once_per_related_limit(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+
+        self.assertEqual(1, self._req_counters[TEST_WEIGHTED_TASK_1_ID])
+        self.assertEqual(1, self.throttler.capacity_used(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(5, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+        self.assertEqual(0, self.throttler.capacity_used(TEST_WEIGHTED_TASK_2_ID))
+
+    def test_execute_task_waits_until_capacity_is_released(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2)])
+        self._req_counters[TEST_POOL_ID] = 0
+
+        start = time.time()
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(self.execute_requests(5, TEST_POOL_ID, throttler), 2.0)
+        )
+        elapsed = time.time() - start
+
+        self.assertEqual(5, self._req_counters[TEST_POOL_ID])
+        # Two full windows have to pass before the fifth request can be executed
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertEqual(0, throttler.waiting_requests_count)
+
+    def test_waiting_requests_are_released_in_arrival_order(self):
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=2, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID, limit=100, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 2)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID, limit=100, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ])
+        execution_order: List[str] = []
+
+        async def request(name: str, limit_id: str):
+            async with throttler.execute_task(limit_id=limit_id):
+                execution_order.append(name)
+
+        async def run_requests():
+            await request("first", TEST_WEIGHTED_TASK_1_ID)
+            # The heavy request waits for the full pool, the light one could fit earlier but must not overtake it
+            await asyncio.gather(request("heavy", TEST_WEIGHTED_TASK_1_ID), request("light", TEST_WEIGHTED_TASK_2_ID))
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2.0))
+
+        self.assertEqual(["first", "heavy", "light"], execution_order)
+
+    def test_waiting_request_does_not_block_unrelated_limits(self):
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=10),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=10),
+        ])
+        self._req_counters[TEST_POOL_ID] = 0
+        self._req_counters[TEST_PATH_URL] = 0
+
+        async def run_requests():
+            await self.execute_requests(1, TEST_POOL_ID, throttler)
+            blocked_task = asyncio.ensure_future(self.execute_requests(1, TEST_POOL_ID, throttler))
+            await asyncio.sleep(0.01)
+            await self.execute_requests(1, TEST_PATH_URL, throttler)
+            blocked_task.cancel()
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1.0))
+
+        self.assertEqual(1, self._req_counters[TEST_POOL_ID])
+        self.assertEqual(1, self._req_counters[TEST_PATH_URL])
+
+    def test_cancelled_waiting_request_is_removed_from_the_queue(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=10)])
+        self._req_counters[TEST_POOL_ID] = 0
+
+        async def run_requests():
+            await self.execute_requests(1, TEST_POOL_ID, throttler)
+            blocked_task = asyncio.ensure_future(self.execute_requests(1, TEST_POOL_ID, throttler))
+            await asyncio.sleep(0.01)
+            self.assertEqual(1, throttler.waiting_requests_count)
+            blocked_task.cancel()
+            await asyncio.sleep(0.01)
+
+        self.ev_loop.run_until_complete(run_requests())
+
+        self.assertEqual(0, throttler.waiting_requests_count)
+        self.assertEqual(1, self._req_counters[TEST_POOL_ID])
+        self.assertEqual(1, throttler.capacity_used(TEST_POOL_ID))
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+
+from hummingbot.core.data_type.historical_market_data import (
+    ASK_SIDE,
+    BID_SIDE,
+    DIFF_MESSAGE_TYPE,
+    ORDER_BOOK_RECORD_DTYPE,
+    SNAPSHOT_MESSAGE_TYPE,
+    TRADE_RECORD_DTYPE,
+    HistoricalMarketDataReader,
+    MarketDataStream,
+    market_data_file_path,
+    utc_dates_between,
+)
+
+
+class HistoricalMarketDataReaderTests(unittest.TestCase):
+    exchange = "binance"
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.reader = HistoricalMarketDataReader(self.temp_dir.name, self.exchange)
+        self.day_start = datetime(2022, 3, 1, tzinfo=timezone.utc).timestamp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def write_records(self, stream: MarketDataStream, date: str, records: np.ndarray):
+        file_path = market_data_file_path(self.temp_dir.name, self.exchange, self.trading_pair, stream, date)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "ab") as records_file:
+            records.tofile(records_file)
+
+    def test_utc_dates_between(self):
+        dates = utc_dates_between(self.day_start + 3600, self.day_start + 2 * 86400 + 10)
+
+        self.assertEqual(["20220301", "20220302", "20220303"], dates)
+
+    def test_load_order_book_records_starts_at_last_snapshot_before_range(self):
+        records = np.array([
+            (self.day_start + 1, 1, 10.0, 1.0, BID_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (self.day_start + 1, 1, 11.0, 1.0, ASK_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (self.day_start + 2, 2, 10.0, 2.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (self.day_start + 5, 3, 9.0, 1.0, BID_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (self.day_start + 5, 3, 12.0, 1.0, ASK_SIDE, SNAPSHOT_MESSAGE_TYPE),
+            (self.day_start + 6, 4, 9.0, 3.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+            (self.day_start + 20, 5, 9.0, 4.0, BID_SIDE, DIFF_MESSAGE_TYPE),
+        ], dtype=ORDER_BOOK_RECORD_DTYPE)
+        self.write_records(MarketDataStream.ORDER_BOOK, "20220301", records)
+
+        loaded = self.reader.load_order_book_records(self.trading_pair, self.day_start + 10, self.day_start + 15)
+
+        self.assertEqual([3, 3, 4], loaded["update_id"].tolist())
+        self.assertEqual(ORDER_BOOK_RECORD_DTYPE, loaded.dtype)
+
+    def test_load_trade_records_spanning_several_days(self):
+        first_day = np.array([(self.day_start + 86000, 10.0, 1.0, 1), (self.day_start + 86300, 10.5, 2.0, 2)],
+                             dtype=TRADE_RECORD_DTYPE)
+        second_day = np.array([(self.day_start + 86500, 11.0, 1.5, 1), (self.day_start + 90000, 11.5, 1.0, 2)],
+                              dtype=TRADE_RECORD_DTYPE)
+        self.write_records(MarketDataStream.TRADES, "20220301", first_day)
+        self.write_records(MarketDataStream.TRADES, "20220302", second_day)
+
+        loaded = self.reader.load_trade_records(self.trading_pair, self.day_start + 86000, self.day_start + 86500)
+
+        self.assertEqual([10.5, 11.0], loaded["price"].tolist())
+
+    def test_load_ignores_partially_written_record(self):
+        records = np.array([(self.day_start + 1, 10.0, 1.0, 1)], dtype=TRADE_RECORD_DTYPE)
+        self.write_records(MarketDataStream.TRADES, "20220301", records)
+        file_path = market_data_file_path(self.temp_dir.name, self.exchange, self.trading_pair,
+                                          MarketDataStream.TRADES, "20220301")
+        with open(file_path, "ab") as records_file:
+            records_file.write(b"\x00\x01\x02")
+
+        loaded = self.reader.load_trade_records(self.trading_pair, self.day_start, self.day_start + 10)
+
+        self.assertEqual(1, len(loaded))
+
+    def test_load_without_files_returns_empty_array(self):
+        loaded = self.reader.load_order_book_records(self.trading_pair, self.day_start, self.day_start + 10)
+
+        self.assertEqual(0, len(loaded))
+        self.assertEqual(ORDER_BOOK_RECORD_DTYPE, loaded.dtype)
@@ -0,0 +1,160 @@
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.historical_market_data import (
+    ASK_SIDE,
+    BID_SIDE,
+    DIFF_MESSAGE_TYPE,
+    SNAPSHOT_MESSAGE_TYPE,
+    HistoricalMarketDataReader,
+)
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class ExchangeFormatOrderBookMessage(OrderBookMessage):
+    """
+    Message whose content keeps the format of the exchange, decoded by its bids and asks properties
+    """
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(float(entry["price"]), float(entry["size"]), self.update_id)
+                for entry in self.content["changes"]["buy"]]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(float(entry["price"]), float(entry["size"]), self.update_id)
+                for entry in self.content["changes"]["sell"]]
+
+
+class MarketDataRecorderTests(unittest.TestCase):
+    exchange = "binance"
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = MarketDataRecorder(self.temp_dir.name, self.exchange)
+        self.reader = HistoricalMarketDataReader(self.temp_dir.name, self.exchange)
+        self.day_start = datetime(2022, 3, 1, tzinfo=timezone.utc).timestamp()
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def diff_message(self, timestamp: float, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamp)
+
+    def trade_message(self, timestamp: float, price: str, amount: str, trade_type: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": trade_type,
+            "trade_id": 1,
+            "price": price,
+            "amount": amount,
+        }, timestamp=timestamp)
+
+    def test_recorded_diffs_and_trades_are_loaded_back(self):
+        self.recorder.record_message(self.diff_message(self.day_start + 1, 2, [["10.0", "1.5"]], [["11.0", "2"]]))
+        self.recorder.record_message(self.trade_message(self.day_start + 2, "10.5", "0.1", 2.0))
+        self.recorder.flush()
+
+        order_book_records = self.reader.load_order_book_records(self.trading_pair, self.day_start,
+                                                                 self.day_start + 10)
+        trade_records = self.reader.load_trade_records(self.trading_pair, self.day_start, self.day_start + 10)
+
+        self.assertEqual([10.0, 11.0], order_book_records["price"].tolist())
+        self.assertEqual([1.5, 2.0], order_book_records["amount"].tolist())
+        self.assertEqual([BID_SIDE, ASK_SIDE], order_book_records["side"].tolist())
+        self.assertEqual([DIFF_MESSAGE_TYPE] * 2, order_book_records["message_type"].tolist())
+        self.assertEqual([(self.day_start + 2, 10.5, 0.1, 2)], trade_records.tolist())
+        self.assertEqual(3, self.recorder.written_records)
+
+    def test_messages_with_exchange_format_are_decoded_by_their_class(self):
+        message = ExchangeFormatOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": 3,
+            "changes": {"buy": [{"price": "10.0", "size": "1.5"}], "sell": [{"price": "11.0", "size": "0"}]},
+        }, timestamp=self.day_start + 1)
+        self.assertFalse(message.has_raw_entries)
+
+        self.recorder.record_message(message)
+        self.recorder.flush()
+
+        records = self.reader.load_order_book_records(self.trading_pair, self.day_start, self.day_start + 10)
+        self.assertEqual([10.0, 11.0], records["price"].tolist())
+        self.assertEqual([1.5, 0.0], records["amount"].tolist())
+        self.assertEqual([BID_SIDE, ASK_SIDE], records["side"].tolist())
+
+    def test_record_order_book_writes_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10.0, 1.0, 5]]), np.array([[11.0, 2.0, 5]]))
+
+        self.recorder.record_order_book(self.trading_pair, order_book, self.day_start + 1)
+        self.recorder.flush()
+
+        records = self.reader.load_order_book_records(self.trading_pair, self.day_start, self.day_start + 10)
+        self.assertEqual([SNAPSHOT_MESSAGE_TYPE] * 2, records["message_type"].tolist())
+        self.assertEqual([5, 5], records["update_id"].tolist())
+
+    def test_new_day_file_starts_with_order_book_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10.0, 1.0, 5]]), np.array([[11.0, 2.0, 5]]))
+        self.recorder.record_order_book(self.trading_pair, order_book, self.day_start + 1)
+        next_day = self.day_start + 86400
+        self.recorder.record_message(self.diff_message(next_day + 1, 6, [["10.0", "3"]], []))
+        self.recorder.flush()
+
+        records = self.reader.load_order_book_records(self.trading_pair, next_day, next_day + 10)
+
+        self.assertEqual([SNAPSHOT_MESSAGE_TYPE, SNAPSHOT_MESSAGE_TYPE, DIFF_MESSAGE_TYPE],
+                         records["message_type"].tolist())
+        self.assertTrue(all(records["timestamp"] >= next_day))
+
+    def test_producer_writes_buffers_when_full(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, self.exchange, max_buffered_records=4)
+
+        for i in range(3):
+            recorder.record_message(self.trade_message(self.day_start + i, "10", "1", 1.0))
+        self.assertEqual(3, recorder.buffered_records)
+
+        recorder.record_message(self.trade_message(self.day_start + 3, "10", "1", 1.0))
+
+        self.assertEqual(0, recorder.buffered_records)
+        self.assertEqual(4, recorder.written_records)
+        self.assertEqual(1, recorder.producer_flushes)
+
+    def test_writer_thread_flushes_in_background(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, self.exchange, flush_interval=0.01)
+        recorder.start()
+        recorder.record_message(self.trade_message(self.day_start, "10", "1", 1.0))
+
+        deadline = time.time() + 1
+        while recorder.written_records == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        recorder.stop()
+
+        self.assertEqual(1, recorder.written_records)
+        self.assertFalse(recorder.started)
+
+    def test_invalid_message_is_logged_and_ignored(self):
+        message = OrderBookMessage(OrderBookMessageType.TRADE, {"trading_pair": self.trading_pair},
+                                   timestamp=self.day_start)
+
+        self.recorder.record_message(message)
+
+        self.assertEqual(0, self.recorder.buffered_records)
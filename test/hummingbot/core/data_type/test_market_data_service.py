@@ -0,0 +1,239 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Awaitable, Dict, List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_service import (
+    MarketDataService,
+    depth_diff,
+    encode_frame,
+    read_frame,
+)
+from hummingbot.core.data_type.market_data_service_order_book_data_source import (
+    MarketDataServiceOrderBookDataSource,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class MockOrderBookTracker:
+    def __init__(self, trading_pairs: List[str]):
+        self.trading_pairs: List[str] = trading_pairs
+        self.order_books: Dict[str, OrderBook] = {}
+        self.started: bool = False
+        self.stopped: bool = False
+
+    def start(self):
+        self.started = True
+        for trading_pair in self.trading_pairs:
+            order_book = OrderBook()
+            order_book.apply_raw_snapshot([["10", "1"], ["9", "2"]], [["11", "1"], ["12", "2"]], 1)
+            self.order_books[trading_pair] = order_book
+
+    def stop(self):
+        self.stopped = True
+
+
+class MockExchangeDataSource:
+    def __init__(self):
+        self.funding_info: Dict[str, float] = {"COINALPHA-HBOT": 0.01}
+        self.last_traded_prices_requests: List[Dict] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None):
+        self.last_traded_prices_requests.append({"trading_pairs": trading_pairs, "domain": domain})
+        return {trading_pair: 5.0 for trading_pair in trading_pairs}
+
+
+class MockPerpetualExchangeDataSource(MockExchangeDataSource):
+    def __init__(self):
+        super().__init__()
+        self.listeners: List[str] = []
+
+    async def get_funding_info(self, trading_pair: str) -> float:
+        return self.funding_info[trading_pair]
+
+    async def listen_for_subscriptions(self):
+        self.listeners.append("subscriptions")
+        await asyncio.Event().wait()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        self.listeners.append("diffs")
+        output.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {"trading_pair": "COINALPHA-HBOT"}))
+        await asyncio.Event().wait()
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        self.listeners.append("trades")
+        await output.put(OrderBookMessage(OrderBookMessageType.TRADE, {"trading_pair": "COINALPHA-HBOT"}))
+        await asyncio.Event().wait()
+
+
+class MarketDataServiceTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "market_data_service.sock")
+        self.trackers: List[MockOrderBookTracker] = []
+        self.service = MarketDataService(self.socket_path, publish_interval=0.01, tracker_factory=self.create_tracker)
+
+    def tearDown(self) -> None:
+        self.service.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_tracker(self, connector_name: str, trading_pairs: List[str]) -> MockOrderBookTracker:
+        tracker = MockOrderBookTracker(trading_pairs)
+        self.trackers.append(tracker)
+        return tracker
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_depth_diff_turns_old_depth_into_new_depth(self):
+        old_order_book = OrderBook()
+        old_order_book.apply_raw_snapshot([["10", "1"], ["9", "2"], ["8", "3"]], [["11", "1"]], 1)
+        new_order_book = OrderBook()
+        new_order_book.apply_raw_snapshot([["10", "1"], ["9", "5"], ["8.5", "1"]], [], 2)
+
+        bids_diff = depth_diff(old_order_book.get_depth_array(False), new_order_book.get_depth_array(False))
+        asks_diff = depth_diff(old_order_book.get_depth_array(True), new_order_book.get_depth_array(True))
+
+        self.assertEqual([[9, 5], [8.5, 1], [8, 0]], bids_diff.tolist())
+        self.assertEqual([[11, 0]], asks_diff.tolist())
+        self.assertEqual((0, 2), depth_diff(new_order_book.get_depth_array(False),
+                                            new_order_book.get_depth_array(False)).shape)
+
+    def test_frame_round_trip(self):
+        bids = np.array([[10, 1, 100, 1000], [9, 2, 300, 2800]], dtype=np.float64)
+        asks = np.array([[11, 1, 100, 1100]], dtype=np.float64)
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame({"type": "snapshot", "update_id": 3}, bids, asks))
+        reader.feed_data(encode_frame({"type": "error", "message": "Unknown connector"}))
+
+        header, decoded_bids, decoded_asks = self.async_run_with_timeout(read_frame(reader))
+        self.assertEqual({"type": "snapshot", "update_id": 3, "bids": 2, "asks": 1}, header)
+        self.assertEqual([[10, 1], [9, 2]], decoded_bids.tolist())
+        self.assertEqual([[11, 1]], decoded_asks.tolist())
+
+        header, decoded_bids, decoded_asks = self.async_run_with_timeout(read_frame(reader))
+        self.assertEqual("error", header["type"])
+        self.assertEqual((0, 2), decoded_bids.shape)
+
+    def test_track_restarts_tracker_with_new_trading_pairs(self):
+        self.service.track("binance", ["COINALPHA-HBOT"])
+        self.service.track("binance", ["COINALPHA-HBOT"])
+        self.assertEqual(1, len(self.trackers))
+
+        self.service.track("binance", ["WETH-DAI"])
+
+        self.assertEqual(2, len(self.trackers))
+        self.assertTrue(self.trackers[0].stopped)
+        self.assertEqual(["COINALPHA-HBOT", "WETH-DAI"], self.trackers[1].trading_pairs)
+        self.assertEqual(self.trackers[1], self.service.trackers["binance"])
+
+    def test_data_source_receives_snapshots_diffs_and_trades(self):
+        self.async_run_with_timeout(self.service.start())
+        data_source = MarketDataServiceOrderBookDataSource(["COINALPHA-HBOT"], "binance", self.socket_path)
+
+        order_book = self.async_run_with_timeout(data_source.get_new_order_book("COINALPHA-HBOT"))
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+        diffs: asyncio.Queue = asyncio.Queue()
+        snapshots: asyncio.Queue = asyncio.Queue()
+        trades: asyncio.Queue = asyncio.Queue()
+        tasks = [
+            self.ev_loop.create_task(data_source.listen_for_order_book_diffs(self.ev_loop, diffs)),
+            self.ev_loop.create_task(data_source.listen_for_order_book_snapshots(self.ev_loop, snapshots)),
+            self.ev_loop.create_task(data_source.listen_for_trades(self.ev_loop, trades)),
+        ]
+        try:
+            snapshot: OrderBookMessage = self.async_run_with_timeout(snapshots.get())
+            self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+            self.assertEqual([[10, 1], [9, 2]], snapshot.content["bids"])
+            order_book.apply_snapshot_message(snapshot)
+
+            tracked_order_book: OrderBook = self.service.trackers["binance"].order_books["COINALPHA-HBOT"]
+            tracked_order_book.apply_raw_diff([["10", "0"], ["9.5", "3"]], [], 2)
+            tracked_order_book.apply_raw_diff([], [["10.5", "1"]], 3)
+            diff: OrderBookMessage = self.async_run_with_timeout(diffs.get())
+            self.assertGreater(diff.update_id, snapshot.update_id)
+            order_book.apply_diff_message(diff)
+            self.assertTrue(diffs.empty())
+            self.assertEqual(9.5, order_book.get_price(False))
+            self.assertEqual(10.5, order_book.get_price(True))
+            self.assertEqual([(row.price, row.amount) for row in tracked_order_book.bid_entries()],
+                             [(row.price, row.amount) for row in order_book.bid_entries()])
+            self.assertEqual([(row.price, row.amount) for row in tracked_order_book.ask_entries()],
+                             [(row.price, row.amount) for row in order_book.ask_entries()])
+
+            tracked_order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHA-HBOT", timestamp=1000.5, type=TradeType.SELL, price=9.5, amount=2))
+            trade: OrderBookMessage = self.async_run_with_timeout(trades.get())
+            self.assertEqual(OrderBookMessageType.TRADE, trade.type)
+            self.assertEqual(9.5, trade.content["price"])
+            self.assertEqual(float(TradeType.SELL.value), trade.content["trade_type"])
+            self.assertEqual(1000.5, trade.timestamp)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def test_unknown_connector_error(self):
+        def failing_tracker_factory(connector_name: str, trading_pairs: List[str]):
+            raise ValueError(f"Unknown connector {connector_name}.")
+
+        self.service = MarketDataService(self.socket_path, tracker_factory=failing_tracker_factory)
+        self.async_run_with_timeout(self.service.start())
+        data_source = MarketDataServiceOrderBookDataSource(["COINALPHA-HBOT"], "unknown", self.socket_path)
+
+        with self.assertRaises(IOError) as context:
+            self.async_run_with_timeout(data_source.get_new_order_book("COINALPHA-HBOT"))
+        self.assertIn("Unknown connector unknown.", str(context.exception))
+
+    def test_last_traded_prices_from_service_and_exchange_data_source(self):
+        self.async_run_with_timeout(self.service.start())
+        exchange_data_source = MockExchangeDataSource()
+        data_source = MarketDataServiceOrderBookDataSource(
+            ["COINALPHA-HBOT", "WETH-DAI"], "binance", self.socket_path, exchange_data_source=exchange_data_source)
+        self.async_run_with_timeout(data_source.get_new_order_book("COINALPHA-HBOT"))
+        self.service.trackers["binance"].order_books["COINALPHA-HBOT"].last_trade_price = 10.5
+
+        prices = self.async_run_with_timeout(
+            data_source.get_last_traded_prices(trading_pairs=["COINALPHA-HBOT", "WETH-DAI"], domain="test"))
+
+        self.assertEqual({"COINALPHA-HBOT": 10.5, "WETH-DAI": 5.0}, prices)
+        self.assertEqual([{"trading_pairs": ["WETH-DAI"], "domain": "test"}],
+                         exchange_data_source.last_traded_prices_requests)
+
+    def test_other_attributes_are_looked_up_in_exchange_data_source(self):
+        data_source = MarketDataServiceOrderBookDataSource(
+            ["COINALPHA-HBOT"], "binance", self.socket_path, exchange_data_source=MockExchangeDataSource())
+        self.assertEqual({"COINALPHA-HBOT": 0.01}, data_source.funding_info)
+
+        data_source = MarketDataServiceOrderBookDataSource(["COINALPHA-HBOT"], "binance", self.socket_path)
+        with self.assertRaises(AttributeError):
+            data_source.funding_info
+
+    def test_exchange_subscriptions_are_only_kept_for_funding_info(self):
+        data_source = MarketDataServiceOrderBookDataSource(
+            ["COINALPHA-HBOT"], "binance", self.socket_path, exchange_data_source=MockExchangeDataSource())
+        # Nothing to listen to, the order book messages are received from the service
+        self.assertIsNone(self.async_run_with_timeout(data_source.listen_for_subscriptions()))
+
+        exchange_data_source = MockPerpetualExchangeDataSource()
+        data_source = MarketDataServiceOrderBookDataSource(
+            ["COINALPHA-HBOT"], "binance_perpetual", self.socket_path, exchange_data_source=exchange_data_source)
+        task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        try:
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+            self.assertFalse(task.done())
+            self.assertEqual(["subscriptions", "diffs", "trades"], exchange_data_source.listeners)
+        finally:
+            task.cancel()
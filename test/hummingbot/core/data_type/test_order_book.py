@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 
 import logging
+import math
 import unittest
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderFilledEvent
 import numpy as np
 
 
@@ -50,6 +56,157 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def depth_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_depth_array_is_cached_until_the_order_book_changes(self):
+        order_book = self.depth_order_book()
+
+        asks = order_book.get_depth_array(True)
+        bids = order_book.get_depth_array(False)
+
+        self.assertEqual([[11, 1, 1, 11], [12, 2, 3, 35], [13, 3, 6, 74]], asks.tolist())
+        self.assertEqual([10, 9, 8], bids[:, 0].tolist())
+        self.assertIs(asks, order_book.get_depth_array(True))
+        self.assertFalse(asks.flags.writeable)
+
+        order_book.apply_numpy_diffs(np.array([[9.5, 4, 2]], dtype=np.float64),
+                                     np.array([[12, 0, 2]], dtype=np.float64))
+
+        self.assertEqual([[11, 1, 1, 11], [13, 3, 4, 50]], order_book.get_depth_array(True).tolist())
+        self.assertEqual([10, 9.5, 9, 8], order_book.get_depth_array(False)[:, 0].tolist())
+
+    def test_depth_queries(self):
+        order_book = self.depth_order_book()
+
+        result = order_book.get_price_for_volume(True, 2.5)
+        self.assertEqual((12, 2.5), (result.result_price, result.result_volume))
+        result = order_book.get_price_for_volume(False, 7)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual(11.5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(False, 20)
+        self.assertEqual((9, 20), (result.result_price, result.result_volume))
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(23, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(True, 10)
+        self.assertEqual(74, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 12.5)
+        self.assertEqual((12, 3), (result.result_price, result.result_volume))
+        result = order_book.get_volume_for_price(False, 10.5)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(False, 9)
+        self.assertEqual((9, 28), (result.result_price, result.result_volume))
+
+    def test_batch_depth_queries_match_single_queries(self):
+        order_book = self.depth_order_book()
+        volumes = np.array([0.5, 1, 2.5, 6, 7])
+        prices = np.array([7.5, 8, 9.5, 10, 11, 12.5, 14])
+        quote_volumes = np.array([5, 20, 60, 100])
+
+        for is_buy in (True, False):
+            np.testing.assert_array_equal(
+                [order_book.get_price_for_volume(is_buy, volume).result_price for volume in volumes],
+                order_book.get_prices_for_volumes(is_buy, volumes))
+            np.testing.assert_allclose(
+                [order_book.get_vwap_for_volume(is_buy, volume).result_price for volume in volumes],
+                order_book.get_vwaps_for_volumes(is_buy, volumes))
+            np.testing.assert_array_equal(
+                [order_book.get_price_for_quote_volume(is_buy, volume).result_price for volume in quote_volumes],
+                order_book.get_prices_for_quote_volumes(is_buy, quote_volumes))
+            np.testing.assert_array_equal(
+                [order_book.get_volume_for_price(is_buy, price).result_volume for price in prices],
+                order_book.get_volumes_for_prices(is_buy, prices))
+            np.testing.assert_array_equal(
+                [order_book.get_quote_volume_for_price(is_buy, price).result_volume for price in prices],
+                order_book.get_quote_volumes_for_prices(is_buy, prices))
+
+    def test_composite_order_book_depth_excludes_traded_amounts(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64))
+        self.assertEqual(11, order_book.get_price_for_volume(True, 1).result_price)
+
+        order_book.record_filled_order(OrderFilledEvent(
+            timestamp=1, order_id="OID1", trading_pair="COINALPHA-HBOT", trade_type=TradeType.BUY,
+            order_type=None, price=11, amount=1, trade_fee=None))
+
+        self.assertEqual([[12, 2, 2, 24]], order_book.get_depth_array(True).tolist())
+        self.assertEqual(12, order_book.get_price_for_volume(True, 1).result_price)
+
+    def test_change_events(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.ChangeEvent, event_logger)
+        no_entries = np.empty((0, 3), dtype=np.float64)
+
+        order_book.apply_numpy_snapshot(self.depth_order_book().snapshot[0].values,
+                                        self.depth_order_book().snapshot[1].values)
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual((10, 11), event_logger.event_log[-1][1:])
+
+        # Changes below the best prices
+        order_book.apply_numpy_diffs(np.array([[9, 5, 2]], dtype=np.float64), no_entries)
+        order_book.apply_numpy_diffs(no_entries, np.array([[12, 5, 2]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+
+        # Amount change at the best price
+        order_book.apply_numpy_diffs(np.array([[10, 5, 3]], dtype=np.float64), no_entries)
+        self.assertEqual(2, len(event_logger.event_log))
+
+        # Best price change
+        order_book.apply_numpy_diffs(no_entries, np.array([[10.5, 1, 4]], dtype=np.float64))
+        self.assertEqual(3, len(event_logger.event_log))
+        self.assertEqual((10, 10.5), event_logger.event_log[-1][1:])
+
+        # Change within the change event depth
+        order_book.change_event_depth = 0.15
+        order_book.apply_numpy_diffs(np.array([[9, 1, 5]], dtype=np.float64), no_entries)
+        self.assertEqual(4, len(event_logger.event_log))
+        order_book.apply_numpy_diffs(np.array([[8, 1, 6]], dtype=np.float64), no_entries)
+        self.assertEqual(4, len(event_logger.event_log))
+
+    def test_apply_diff_messages_matches_applying_each_message(self):
+        def diff_message(update_id, bids, asks):
+            return OrderBookMessage(OrderBookMessageType.DIFF,
+                                    {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids,
+                                     "asks": asks},
+                                    timestamp=update_id)
+
+        messages = [
+            diff_message(2, [["10", "3"], ["9.5", "1"]], [["11", "0"]]),
+            diff_message(3, [["9.5", "0"], ["10.2", "1"]], [["11.5", "2"]]),
+            diff_message(4, [["10", "0"]], [["11.5", "4"], ["11.2", "1"]]),
+        ]
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"], ["9", "2"]], [["11", "1"], ["12", "2"]], 1)
+        merged_order_book = OrderBook()
+        merged_order_book.apply_raw_snapshot([["10", "1"], ["9", "2"]], [["11", "1"], ["12", "2"]], 1)
+
+        for message in messages:
+            order_book.apply_diff_message(message)
+        merged_order_book.apply_diff_messages(messages)
+
+        self.assertEqual([(row.price, row.amount) for row in order_book.bid_entries()],
+                         [(row.price, row.amount) for row in merged_order_book.bid_entries()])
+        self.assertEqual([(row.price, row.amount) for row in order_book.ask_entries()],
+                         [(row.price, row.amount) for row in merged_order_book.ask_entries()])
+        self.assertEqual(10.2, merged_order_book.get_price(False))
+        self.assertEqual(11.2, merged_order_book.get_price(True))
+        self.assertEqual(4, merged_order_book.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
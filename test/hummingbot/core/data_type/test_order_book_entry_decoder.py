@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_entry_decoder import decode_order_book_entries
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class OrderBookEntryDecoderTests(unittest.TestCase):
+
+    def test_decode_strings_and_numbers(self):
+        decoded = decode_order_book_entries([["10.5", "1.25"], [11, 2.5, "ignored"], ["1e-3", " 3"]], 7)
+
+        expected = np.array([[10.5, 1.25, 7], [11, 2.5, 7], [0.001, 3, 7]], dtype="float64")
+        self.assertTrue(np.array_equal(expected, decoded))
+
+    def test_decode_empty_entries(self):
+        self.assertEqual((0, 3), decode_order_book_entries([], 1).shape)
+
+    def test_decode_invalid_entries_raises(self):
+        with self.assertRaises(ValueError):
+            decode_order_book_entries([["10.5x", "1"]], 1)
+        with self.assertRaises(ValueError):
+            decode_order_book_entries([["", "1"]], 1)
+
+    def test_apply_raw_diff_matches_apply_diffs(self):
+        snapshot_bids = [["10", "1"], ["9", "2"]]
+        snapshot_asks = [["11", "1"], ["12", "2"]]
+        diff_bids = [["10", "0"], ["9.5", "3"]]
+        diff_asks = [["11", "4"], ["13", "1"]]
+
+        raw_order_book = OrderBook()
+        raw_order_book.apply_raw_snapshot(snapshot_bids, snapshot_asks, 1)
+        raw_order_book.apply_raw_diff(diff_bids, diff_asks, 2)
+
+        def rows(entries, update_id):
+            return [OrderBookRow(float(price), float(amount), update_id) for price, amount in entries]
+
+        order_book = OrderBook()
+        order_book.apply_snapshot(rows(snapshot_bids, 1), rows(snapshot_asks, 1), 1)
+        order_book.apply_diffs(rows(diff_bids, 2), rows(diff_asks, 2), 2)
+
+        self.assertEqual(list(order_book.bid_entries()), list(raw_order_book.bid_entries()))
+        self.assertEqual(list(order_book.ask_entries()), list(raw_order_book.ask_entries()))
+        self.assertEqual(9.5, raw_order_book.get_price(False))
+        self.assertEqual(11, raw_order_book.get_price(True))
+        self.assertEqual(1, raw_order_book.snapshot_uid)
+        self.assertEqual(2, raw_order_book.last_diff_uid)
+
+    def test_messages_with_raw_entries(self):
+        class RowsOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(entry["price"], entry["amount"], self.update_id)
+                        for entry in self.content["bids"]]
+
+        class RawOrderBookMessage(RowsOrderBookMessage):
+            has_raw_entries = True
+
+        self.assertTrue(OrderBookMessage.has_raw_entries)
+        self.assertFalse(RowsOrderBookMessage.has_raw_entries)
+        self.assertTrue(RawOrderBookMessage.has_raw_entries)
+
+        order_book = OrderBook()
+        order_book.apply_diff_message(RowsOrderBookMessage(
+            OrderBookMessageType.DIFF, {"update_id": 1, "bids": [{"price": 10.0, "amount": 1.0}], "asks": []}))
+        order_book.apply_diff_message(OrderBookMessage(
+            OrderBookMessageType.DIFF, {"update_id": 2, "bids": [["9", "2"]], "asks": [["11", "1"]]}))
+
+        self.assertEqual([OrderBookRow(9.0, 2.0, 2), OrderBookRow(10.0, 1.0, 1)],
+                         sorted(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11.0, 1.0, 2)], list(order_book.ask_entries()))
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_buffer import OrderBookMessageBuffer, OrderBookMessageRouter
+
+
+class OrderBookMessageBufferTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def diff_message(update_id: int, trading_pair: str = "COINALPHA-HBOT") -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF,
+                                {"trading_pair": trading_pair, "update_id": update_id, "bids": [], "asks": []},
+                                timestamp=update_id)
+
+    def test_drain_returns_all_pending_messages(self):
+        buffer = OrderBookMessageBuffer()
+        messages = [self.diff_message(update_id) for update_id in range(1, 4)]
+        for message in messages:
+            buffer.put_nowait(message)
+
+        self.assertEqual(3, buffer.qsize())
+        self.assertEqual(messages, self.async_run_with_timeout(buffer.drain()))
+        self.assertTrue(buffer.empty())
+
+        buffer.record_applied(3)
+
+        stats = buffer.stats
+        self.assertEqual(0, stats["queue_depth"])
+        self.assertEqual(3, stats["max_queue_depth"])
+        self.assertEqual(3, stats["applied_messages"])
+        self.assertEqual(1, stats["applied_batches"])
+        self.assertGreater(stats["max_apply_lag"], 0)
+
+    def test_drain_waits_for_a_message(self):
+        buffer = OrderBookMessageBuffer()
+        drain_task = self.ev_loop.create_task(buffer.drain())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertFalse(drain_task.done())
+
+        message = self.diff_message(1)
+        self.async_run_with_timeout(buffer.put(message))
+
+        self.assertEqual([message], self.async_run_with_timeout(drain_task))
+
+    def test_queue_interface(self):
+        buffer = OrderBookMessageBuffer()
+        with self.assertRaises(asyncio.QueueEmpty):
+            buffer.get_nowait()
+
+        first_message = self.diff_message(1)
+        second_message = self.diff_message(2)
+        buffer.put_nowait(first_message)
+        buffer.put_nowait(second_message)
+
+        self.assertEqual(first_message, buffer.get_nowait())
+        self.assertEqual(second_message, self.async_run_with_timeout(buffer.get()))
+        self.assertTrue(buffer.empty())
+        # Messages taken with get() are not counted as applied
+        buffer.record_applied(2)
+        self.assertEqual(0, buffer.stats["applied_messages"])
+
+    def test_router_routes_messages_to_their_buffers(self):
+        buffers = {"COINALPHA-HBOT": OrderBookMessageBuffer(), "WETH-DAI": OrderBookMessageBuffer()}
+        order_books = {"COINALPHA-HBOT": OrderBook(), "WETH-DAI": OrderBook()}
+        order_books["WETH-DAI"].apply_snapshot([], [], 10)
+        router = OrderBookMessageRouter(buffers, order_books)
+
+        router.put_nowait(self.diff_message(1, "COINALPHA-HBOT"))
+        # Older than the order book snapshot
+        router.put_nowait(self.diff_message(5, "WETH-DAI"))
+        self.async_run_with_timeout(router.put(self.diff_message(11, "WETH-DAI")))
+        # Trading pair without order book
+        router.put_nowait(self.diff_message(1, "ETH-USDT"))
+
+        self.assertEqual(1, buffers["COINALPHA-HBOT"].qsize())
+        self.assertEqual(1, buffers["WETH-DAI"].qsize())
+        self.assertEqual(11, buffers["WETH-DAI"].get_nowait().update_id)
+        self.assertEqual(2, router.messages_accepted)
+        self.assertEqual(2, router.messages_rejected)
+
+    def test_router_keeps_messages_of_order_books_not_registered_yet(self):
+        buffers = {}
+        order_books = {}
+        router = OrderBookMessageRouter(buffers, order_books, ["COINALPHA-HBOT"])
+
+        for update_id in range(1, 4):
+            router.put_nowait(self.diff_message(update_id, "COINALPHA-HBOT"))
+        # Trading pair not tracked
+        router.put_nowait(self.diff_message(1, "ETH-USDT"))
+        self.assertEqual(1, router.messages_rejected)
+
+        order_books["COINALPHA-HBOT"] = OrderBook()
+        order_books["COINALPHA-HBOT"].apply_snapshot([], [], 2)
+        buffers["COINALPHA-HBOT"] = OrderBookMessageBuffer()
+        router.register_order_book("COINALPHA-HBOT")
+        router.put_nowait(self.diff_message(4, "COINALPHA-HBOT"))
+
+        # Same as the messages received after the registration, only the diffs older than the snapshot are rejected
+        self.assertEqual([2, 3, 4], [message.update_id
+                                     for message in self.async_run_with_timeout(buffers["COINALPHA-HBOT"].drain())])
+        self.assertEqual(3, router.messages_accepted)
+        self.assertEqual(2, router.messages_rejected)
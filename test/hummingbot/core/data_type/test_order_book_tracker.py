@@ -0,0 +1,227 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.in_flight_requests: int = 0
+        self.max_in_flight_requests: int = 0
+        self.release_events: Dict[str, asyncio.Event] = {pair: asyncio.Event() for pair in trading_pairs}
+        self.failures_before_success: Dict[str, int] = {}
+        self.snapshot_update_ids: Dict[str, int] = {}
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.in_flight_requests += 1
+        self.max_in_flight_requests = max(self.max_in_flight_requests, self.in_flight_requests)
+        try:
+            await self.release_events[trading_pair].wait()
+            if self.failures_before_success.get(trading_pair, 0) > 0:
+                self.failures_before_success[trading_pair] -= 1
+                raise IOError("Snapshot request failed")
+        finally:
+            self.in_flight_requests -= 1
+        order_book = OrderBook()
+        if trading_pair in self.snapshot_update_ids:
+            order_book.apply_snapshot([], [], self.snapshot_update_ids[trading_pair])
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(5)]
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        self.log_records = []
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_init_order_books_marks_each_pair_ready_as_soon_as_it_lands(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(2, self.data_source.in_flight_requests)
+        self.assertEqual(set(), self.tracker.ready_trading_pairs)
+
+        self.data_source.release_events[self.trading_pairs[1]].set()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertTrue(self.tracker.is_trading_pair_ready(self.trading_pairs[1]))
+        self.assertFalse(self.tracker.is_trading_pair_ready(self.trading_pairs[0]))
+        self.assertIn(self.trading_pairs[1], self.tracker._tracking_tasks)
+        self.assertFalse(self.tracker.ready)
+
+        for event in self.data_source.release_events.values():
+            event.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertEqual(2, self.data_source.max_in_flight_requests)
+        self.assertEqual(set(self.trading_pairs), self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books.keys()))
+        self.assertTrue(self.tracker.ready)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    def test_init_order_books_retries_failed_snapshot_requests(self, _):
+        self.data_source.failures_before_success[self.trading_pairs[0]] = 1
+        for event in self.data_source.release_events.values():
+            event.set()
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertTrue(self.tracker.is_trading_pair_ready(self.trading_pairs[0]))
+        self.assertTrue(any(record.getMessage() == f"Unexpected error fetching the initial order book for "
+                                                   f"{self.trading_pairs[0]}."
+                            for record in self.log_records))
+
+    def test_stop_clears_ready_trading_pairs(self):
+        for event in self.data_source.release_events.values():
+            event.set()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.tracker.stop()
+
+        self.assertEqual(set(), self.tracker.ready_trading_pairs)
+        self.assertFalse(self.tracker.ready)
+
+    def test_initialized_order_books_are_recorded(self):
+        recorder = MagicMock()
+        self.tracker.set_market_data_recorder(recorder)
+        for event in self.data_source.release_events.values():
+            event.set()
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        recorded_pairs = {call.args[0] for call in recorder.record_order_book.call_args_list}
+        self.assertEqual(set(self.trading_pairs), recorded_pairs)
+        self.assertEqual(recorder, self.tracker.market_data_recorder)
+
+    def test_order_book_messages_are_recorded_by_the_buffers(self):
+        class ExchangeOrderBookTracker(OrderBookTracker):
+            async def _track_single_book(self, trading_pair: str):
+                message_queue = self._tracking_message_queues[trading_pair]
+                order_book = self._order_books[trading_pair]
+                while True:
+                    message = await message_queue.get()
+                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+        tracker = ExchangeOrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        recorder = MagicMock()
+        tracker.set_market_data_recorder(recorder)
+        for event in self.data_source.release_events.values():
+            event.set()
+        self.async_run_with_timeout(tracker._init_order_books())
+        trading_pair = self.trading_pairs[0]
+        diff = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": trading_pair, "update_id": 1, "bids": [["10", "1"]], "asks": []},
+            timestamp=1)
+        try:
+            tracker._order_book_message_router.put_nowait(diff)
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+
+            self.assertEqual(10, tracker.order_books[trading_pair].get_price(False))
+            recorder.record_message.assert_called_once_with(diff)
+        finally:
+            tracker.stop()
+
+    def test_diffs_routed_to_order_books_and_applied_in_batches(self):
+        for event in self.data_source.release_events.values():
+            event.set()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        trading_pair = self.trading_pairs[0]
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertTrue(self.tracker._routes_diffs_directly)
+
+        router = self.tracker._order_book_message_router
+        for update_id, price in [(1, "10"), (2, "10.5"), (3, "11")]:
+            router.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": trading_pair, "update_id": update_id, "bids": [[price, "1"]], "asks": []},
+                timestamp=update_id))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(11, order_book.get_price(False))
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[trading_pair]))
+        stats = self.tracker.message_queue_stats[trading_pair]
+        self.assertEqual(3, stats["applied_messages"])
+        self.assertEqual(1, stats["applied_batches"])
+        self.assertEqual(0, stats["queue_depth"])
+
+    def test_diffs_received_while_fetching_snapshot_are_applied_after_it(self):
+        trading_pair = self.trading_pairs[0]
+        self.data_source.snapshot_update_ids[trading_pair] = 2
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertNotIn(trading_pair, self.tracker.order_books)
+
+        router = self.tracker._order_book_message_router
+        for update_id, price in [(1, "9"), (2, "9.5"), (3, "10")]:
+            router.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": trading_pair, "update_id": update_id, "bids": [[price, "1"]], "asks": []},
+                timestamp=update_id))
+        for event in self.data_source.release_events.values():
+            event.set()
+        self.async_run_with_timeout(init_task)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        order_book = self.tracker.order_books[trading_pair]
+        # Only the diffs older than the snapshot are rejected
+        self.assertEqual([10, 9.5], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(2, router.messages_accepted)
+        self.assertEqual(1, router.messages_rejected)
+
+    def test_handles_generic_order_book_messages(self):
+        class ExchangeOrderBookTracker(OrderBookTracker):
+            async def _track_single_book(self, trading_pair: str):
+                pass
+
+        class ExchangeListenerOrderBookTracker(OrderBookTracker):
+            def start(self):
+                super().start()
+
+        self.assertTrue(self.tracker.handles_generic_order_book_messages)
+        exchange_tracker = ExchangeOrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.assertFalse(exchange_tracker.handles_generic_order_book_messages)
+        # Starting more listeners doesn't change how the messages are applied
+        listener_tracker = ExchangeListenerOrderBookTracker(data_source=self.data_source,
+                                                            trading_pairs=self.trading_pairs)
+        self.assertTrue(listener_tracker.handles_generic_order_book_messages)
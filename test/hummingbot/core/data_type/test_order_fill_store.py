@@ -0,0 +1,93 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_fill_store import OrderFillStore
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class OrderFillStoreTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    other_trading_pair = "WETH-HBOT"
+
+    def fill(self, timestamp: float, trading_pair: str = trading_pair, trade_type: TradeType = TradeType.BUY,
+             price: str = "10", amount: str = "1") -> OrderFilledEvent:
+        return OrderFilledEvent(timestamp=timestamp,
+                                order_id=f"OID{timestamp}",
+                                trading_pair=trading_pair,
+                                trade_type=trade_type,
+                                order_type=OrderType.LIMIT,
+                                price=Decimal(price),
+                                amount=Decimal(amount),
+                                trade_fee=AddedToCostTradeFee())
+
+    def test_fills_are_sorted_and_indexed_by_trading_pair(self):
+        store = OrderFillStore()
+        store.add(self.fill(1))
+        store.add(self.fill(3, self.other_trading_pair))
+        store.add(self.fill(2, self.other_trading_pair))
+        store.add(self.fill(4))
+
+        self.assertEqual([1, 2, 3, 4], [fill.timestamp for fill in store.fills()])
+        self.assertEqual([1, 4], [fill.timestamp for fill in store.fills(self.trading_pair)])
+        self.assertEqual([2, 3], [fill.timestamp for fill in store.fills(self.other_trading_pair)])
+        self.assertEqual([2, 3], [fill.timestamp for fill in store.fills(start_timestamp=2, end_timestamp=4)])
+        self.assertEqual([4], [fill.timestamp for fill in store.fills(self.trading_pair, start_timestamp=2)])
+        self.assertEqual([], store.fills("UNKNOWN-PAIR"))
+
+    def test_oldest_fills_evicted_at_capacity(self):
+        store = OrderFillStore(capacity=3)
+        for timestamp in range(1, 11):
+            store.add(self.fill(timestamp, self.trading_pair if timestamp % 2 else self.other_trading_pair))
+
+        self.assertEqual(3, len(store))
+        self.assertEqual(7, store.evicted_fills_count)
+        self.assertEqual([8, 9, 10], [fill.timestamp for fill in store.fills()])
+        self.assertEqual([9], [fill.timestamp for fill in store.fills(self.trading_pair)])
+        self.assertEqual([8, 10], [fill.timestamp for fill in store.fills(self.other_trading_pair)])
+
+    def test_warning_logged_when_fills_start_being_evicted(self):
+        store = OrderFillStore(capacity=2)
+        with self.assertLogs(OrderFillStore.logger(), level="WARNING") as logs:
+            for timestamp in range(1, 6):
+                store.add(self.fill(timestamp))
+
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("More than 2 order fills received", logs.records[0].getMessage())
+
+    def test_evicted_fills_passed_to_spill_handler(self):
+        spilled = []
+        store = OrderFillStore(capacity=2, spill_handler=spilled.extend, spill_batch_size=2)
+        for timestamp in range(1, 6):
+            store.add(self.fill(timestamp))
+
+        self.assertEqual([1, 2], [fill.timestamp for fill in spilled])
+
+        store.flush_spill()
+
+        self.assertEqual([1, 2, 3], [fill.timestamp for fill in spilled])
+
+    def test_balance_changes(self):
+        store = OrderFillStore(capacity=2)
+        store.add(self.fill(1, trade_type=TradeType.BUY, price="10", amount="2"))
+        store.add(self.fill(2, trade_type=TradeType.SELL, price="12", amount="1"))
+        store.add(self.fill(3, trade_type=TradeType.BUY, price="11", amount="1"))
+
+        # The balance changes since the store was created include the evicted fill
+        self.assertEqual({"COINALPHA": Decimal("2"), "HBOT": Decimal("-19")}, store.balance_changes())
+        self.assertEqual({"COINALPHA": Decimal("1"), "HBOT": Decimal("-11")}, store.balance_changes(2))
+
+    def test_event_logger_keeps_fills_in_store(self):
+        store = OrderFillStore(capacity=2)
+        event_logger = EventLogger(order_fill_store=store)
+        for timestamp in range(1, 4):
+            event_logger(self.fill(timestamp))
+
+        self.assertIs(store, event_logger.order_fill_store)
+        self.assertEqual([2, 3], [event.timestamp for event in event_logger.event_log])
+
+        event_logger.clear()
+
+        self.assertEqual(0, len(store))
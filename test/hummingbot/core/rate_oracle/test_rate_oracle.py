@@ -4,13 +4,15 @@ import re
 import unittest
 from decimal import Decimal
 from typing import Dict, Awaitable
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 from bidict import bidict
 
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.core.mock_api.mock_web_socket_server import MockWebSocketServerFactory
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateIndex, find_rate
 from .fixture import Fixture
 
 
@@ -127,6 +129,38 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_rate_index_finds_the_same_rates_as_find_rate(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75"),
+                  "WETH-DAI": Decimal("2000"), "DAI-USDT": Decimal("1.01")}
+        index = RateIndex(prices)
+        pairs = ["HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "GBP-HBOT",
+                 "ETH-USDT", "USDT-ETH", "HBOT-HBOT", "ETH-WETH"]
+
+        for pair in pairs:
+            self.assertEqual(find_rate(prices, pair), index.rate(pair))
+        self.assertEqual({pair: find_rate(prices, pair) for pair in pairs}, index.rates(pairs))
+
+    def test_rate_oracle_indexes_prices_when_they_are_refreshed(self):
+        oracle = RateOracle()
+        oracle._set_prices({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+
+        self.assertEqual(Decimal("2"), oracle.rate("HBOT-AAVE"))
+        self.assertEqual({"HBOT-AAVE": Decimal("2"), "ZBOT-USDT": None},
+                         oracle.rates(["HBOT-AAVE", "ZBOT-USDT"]))
+
+        index = oracle._rate_index
+        oracle._set_prices(oracle._prices)
+        self.assertIs(index, oracle._rate_index)
+
+        oracle._set_prices({"HBOT-USDT": Decimal("90"), "AAVE-USDT": Decimal("45")})
+        self.assertIsNot(index, oracle._rate_index)
+        self.assertEqual(Decimal("2"), oracle.rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("90"), oracle.rate("HBOT-USDT"))
+
+        oracle._prices = {"HBOT-USDT": Decimal("80")}
+        self.assertEqual(Decimal("80"), oracle.rate("HBOT-USDT"))
+        self.assertIsNone(oracle.rate("HBOT-AAVE"))
+
     @aioresponses()
     def test_get_binance_prices(self, mock_api):
         url = RateOracle.binance_price_url
@@ -175,3 +209,106 @@ class RateOracleTest(unittest.TestCase):
 
         prices = self.async_run_with_timeout(RateOracle.get_ascend_ex_prices())
         self._assert_rate_dict(prices)
+
+
+class RateOracleStreamingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        BinanceAPIOrderBookDataSource._trading_pair_symbol_map = {
+            "com": bidict(
+                {"ETHBTC": "ETH-BTC",
+                 "LTCBTC": "LTC-BTC",
+                 "BTCUSDT": "BTC-USDT"}),
+            "us": bidict(
+                {"BTCUSD": "BTC-USD",
+                 "ETHUSD": "ETH-USD"})
+        }
+        cls.ws_server = MockWebSocketServerFactory.start_new_server(RateOracle.binance_ws_url)
+        cls._patcher = patch("aiohttp.client.ClientSession.ws_connect", autospec=True)
+        cls._mock = cls._patcher.start()
+        cls._mock.side_effect = MockWebSocketServerFactory.reroute_ws_connect
+        cls.ev_loop.run_until_complete(asyncio.wait_for(cls.ws_server.wait_til_started(), 1))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.ws_server.stop()
+        cls._patcher.stop()
+        BinanceAPIOrderBookDataSource._trading_pair_symbol_map = {}
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.global_token = RateOracle.global_token
+        RateOracle.global_token = "USDT"
+        self.oracle = RateOracle()
+        self.prices = {"ETH-BTC": Decimal("0.05"), "LTC-BTC": Decimal("0.003"), "BTC-USDT": Decimal("40000"),
+                       "BTC-USD": Decimal("40100")}
+        self.get_prices_mock = AsyncMock(return_value=self.prices)
+        self._get_prices_patcher = patch.object(RateOracle, "get_prices", self.get_prices_mock)
+        self._get_prices_patcher.start()
+        self.stream_task = None
+
+    def tearDown(self) -> None:
+        self.stream_task and self.stream_task.cancel()
+        self._get_prices_patcher.stop()
+        RateOracle.global_token = self.global_token
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def wait_for_rate(self, pair: str, rate: Decimal):
+        while self.oracle.rate(pair) != rate:
+            await asyncio.sleep(0.01)
+
+    def test_streamed_trading_pairs_are_the_routes_between_required_tokens(self):
+        self.oracle._set_prices(dict(self.prices))
+        self.oracle.set_required_tokens(["ETH", "USD"])
+
+        trading_pairs_by_domain = self.async_run_with_timeout(self.oracle._streamed_trading_pairs_by_domain())
+
+        self.assertEqual({"com": ["BTC-USDT", "ETH-BTC"], "us": ["BTC-USD"]}, trading_pairs_by_domain)
+
+    def test_stream_updates_the_prices_of_the_required_tokens(self):
+        url = RateOracle.binance_ws_url
+        subscription = {"method": "SUBSCRIBE", "params": ["btcusdt@bookTicker", "ethbtc@bookTicker"], "id": 1}
+        self.ws_server.add_stock_response(
+            json.dumps(subscription), {"u": 1, "s": "ETHBTC", "b": "0.059", "B": "1", "a": "0.061", "A": "1"})
+        self.oracle.set_required_tokens(["ETH"])
+
+        self.stream_task = asyncio.ensure_future(self.oracle.stream_price_loop())
+        self.async_run_with_timeout(self.wait_for_rate("ETH-BTC", Decimal("0.06")), timeout=5)
+
+        self.assertEqual(Decimal("2400"), self.oracle.rate("ETH-USDT"))
+
+        MockWebSocketServerFactory.send_json_threadsafe(
+            url, {"u": 2, "s": "LTCBTC", "b": "0.004", "B": "1", "a": "0.004", "A": "1"})
+        MockWebSocketServerFactory.send_json_threadsafe(
+            url, {"u": 3, "s": "BTCUSDT", "b": "39000", "B": "1", "a": "39200", "A": "1"})
+        self.async_run_with_timeout(self.wait_for_rate("BTC-USDT", Decimal("39100")))
+
+        self.assertEqual(Decimal("2346"), self.oracle.rate("ETH-USDT"))
+        self.assertEqual(Decimal("0.003"), self.oracle.rate("LTC-BTC"))
+        # The prices are not requested again before the refresh interval, and the prices of the source are not modified
+        self.assertEqual(1, self.get_prices_mock.call_count)
+        self.assertEqual(Decimal("40000"), self.prices["BTC-USDT"])
+
+    @patch.object(RateOracle, "PRICES_REFRESH_INTERVAL", 0.01)
+    def test_prices_not_streamed_are_refreshed_periodically(self):
+        subscription = {"method": "SUBSCRIBE", "params": ["btcusdt@bookTicker", "ethbtc@bookTicker"], "id": 1}
+        self.ws_server.add_stock_response(
+            json.dumps(subscription), {"u": 1, "s": "ETHBTC", "b": "0.059", "B": "1", "a": "0.061", "A": "1"})
+        self.oracle.set_required_tokens(["ETH"])
+
+        self.stream_task = asyncio.ensure_future(self.oracle.stream_price_loop())
+        self.async_run_with_timeout(self.wait_for_rate("ETH-BTC", Decimal("0.06")), timeout=5)
+        self.get_prices_mock.return_value = dict(self.prices, **{"ETH-BTC": Decimal("0.05"),
+                                                                 "LTC-BTC": Decimal("0.004")})
+        self.async_run_with_timeout(self.wait_for_rate("LTC-BTC", Decimal("0.004")))
+
+        # The streamed price is kept
+        self.assertEqual(Decimal("0.06"), self.oracle.rate("ETH-BTC"))
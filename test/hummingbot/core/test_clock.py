@@ -1,5 +1,6 @@
 import unittest
 import asyncio
+import numpy as np
 import pandas as pd
 import time
 
@@ -7,9 +8,21 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecorder(PyTimeIterator):
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +137,64 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_reactive_ticks_disabled_by_default(self):
+        self.assertFalse(self.clock_realtime.reactive_ticks_enabled)
+        self.assertFalse(Clock(ClockMode.BACKTEST, reactive_tick_interval=0.1).reactive_ticks_enabled)
+        self.assertTrue(Clock(ClockMode.REALTIME, reactive_tick_interval=0.1).reactive_ticks_enabled)
+
+    def test_order_book_change_runs_out_of_band_tick(self):
+        clock = Clock(ClockMode.REALTIME, reactive_tick_interval=0.05)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        clock.watch_order_book(order_book)
+        change_times = []
+
+        async def change_order_book():
+            # Changes in the middle of a tick interval, far from the regular ticks
+            await asyncio.sleep(1.3 - time.time() % 1)
+            for price in (10.1, 10.2, 10.3):
+                change_times.append(time.time())
+                order_book.apply_numpy_diffs(np.array([[price, 1, 2]], dtype=np.float64),
+                                             np.empty((0, 3), dtype=np.float64))
+            await asyncio.sleep(0.2)
+            change_times.append(time.time())
+            # A change deep in the book doesn't request a tick
+            order_book.apply_numpy_diffs(np.array([[5, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+
+        with clock:
+            end_time = time.time() + 2
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(end_time), change_order_book()))
+
+        out_of_band_ticks = [tick for tick in recorder.ticks if tick != int(tick)]
+        # The 3 changes are coalesced in one tick, run right after them
+        self.assertEqual(1, len(out_of_band_ticks))
+        self.assertGreater(out_of_band_ticks[0], change_times[2])
+        self.assertLess(out_of_band_ticks[0], change_times[3])
+        self.assertEqual(sorted(recorder.ticks), recorder.ticks)
+        stats = clock.reaction_latency_stats
+        self.assertEqual(1, stats["ticks"])
+        self.assertLess(stats["max"], 0.1)
+        self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.ChangeEvent)))
+
+    def test_out_of_band_ticks_respect_reactive_tick_interval(self):
+        clock = Clock(ClockMode.REALTIME, reactive_tick_interval=0.2)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+
+        async def request_ticks():
+            await asyncio.sleep(1.1 - time.time() % 1)
+            for _ in range(6):
+                clock.request_tick()
+                await asyncio.sleep(0.05)
+
+        with clock:
+            end_time = time.time() + 2
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(end_time), request_ticks()))
+
+        ticks = recorder.ticks
+        self.assertTrue(all(later - earlier >= 0.19 for earlier, later in zip(ticks, ticks[1:])))
+        self.assertGreaterEqual(len([tick for tick in ticks if tick != int(tick)]), 1)
@@ -3,6 +3,7 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +90,61 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_not_called_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.assertEqual(None, listener_zero_weakref())
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual([self.event], self.listener_one.event_log)
+
+    def test_listener_removed_while_triggering_event(self):
+        pubsub = self.pubsub
+        event_tag = self.event_tag_zero
+        listener_one = self.listener_one
+
+        class RemovingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def __call__(self, event_object):
+                self.calls += 1
+                pubsub.remove_listener(event_tag, listener_one)
+
+        removing_listener = RemovingListener()
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        # The listener removed while the event is processed still gets the event, but not the following ones
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, removing_listener.calls)
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, removing_listener.calls)
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_listeners_called_in_order_added(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.assertEqual([self.listener_one, self.listener_zero], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_pubsub_collected_with_live_listeners(self):
+        pubsub_weakref = weakref.ref(self.pubsub)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub = None
+        gc.collect()
+
+        self.assertEqual(None, pubsub_weakref())
+        self.listener_zero = None  # the listener callback must not fail once the pubsub is gone
+        gc.collect()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.async_call_scheduler import DEFAULT_LANE, AsyncCallScheduler, CallTimeHistogram
+
+
+class AsyncCallSchedulerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.scheduler = AsyncCallScheduler(call_interval=0)
+        self.events: List[str] = []
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def record_call(self, name: str, duration: float = 0.0) -> str:
+        self.events.append(f"{name} start")
+        await asyncio.sleep(duration)
+        self.events.append(f"{name} end")
+        return name
+
+    def test_call_async_runs_blocking_function(self):
+        result = self.async_run_with_timeout(self.scheduler.call_async(lambda x: x * 2, 21))
+
+        self.assertEqual(42, result)
+
+    def test_schedule_async_call_raises_call_exception(self):
+        async def failing_call():
+            raise ValueError("Test error")
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.scheduler.schedule_async_call(failing_call(), 1))
+
+    def test_schedule_async_call_times_out(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.scheduler.schedule_async_call(asyncio.sleep(1), 0.01))
+
+    def test_schedule_async_call_in_unknown_lane_fails(self):
+        coroutine = asyncio.sleep(0)
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.scheduler.schedule_async_call(coroutine, 1, lane="unknown"))
+        coroutine.close()
+
+    def test_default_lane_runs_one_call_at_a_time(self):
+        self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.record_call("first", 0.01), 1),
+            self.scheduler.schedule_async_call(self.record_call("second", 0.01), 1),
+        ))
+
+        self.assertEqual(["first start", "first end", "second start", "second end"], self.events)
+
+    def test_slow_lane_does_not_block_other_lanes(self):
+        self.scheduler.add_lane("slow")
+        self.scheduler.add_lane("fast", concurrency=2)
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.record_call("slow", 0.1), 1, lane="slow"),
+            self.scheduler.schedule_async_call(self.record_call("fast 1", 0.01), 1, lane="fast"),
+            self.scheduler.schedule_async_call(self.record_call("fast 2", 0.01), 1, lane="fast"),
+        ))
+
+        self.assertEqual(["slow", "fast 1", "fast 2"], results)
+        self.assertEqual("slow end", self.events[-1])
+        self.assertLess(self.events.index("fast 2 start"), self.events.index("fast 1 end"))
+
+    def test_lanes_with_higher_priority_start_first(self):
+        scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=1)
+        scheduler.add_lane("high", priority=10)
+
+        async def schedule_calls():
+            low_call = scheduler.schedule_async_call(self.record_call("low"), 1)
+            high_call = scheduler.schedule_async_call(self.record_call("high"), 1, lane="high")
+            return await asyncio.gather(low_call, high_call)
+
+        try:
+            self.async_run_with_timeout(schedule_calls())
+        finally:
+            scheduler.stop()
+
+        self.assertEqual(["high start", "high end", "low start", "low end"], self.events)
+
+    def test_call_interval_between_calls_of_a_lane(self):
+        self.scheduler.add_lane("spaced", call_interval=0.05)
+
+        start = time.monotonic()
+        self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.record_call("first"), 1, lane="spaced"),
+            self.scheduler.schedule_async_call(self.record_call("second"), 1, lane="spaced"),
+        ))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_wait_and_run_time_histograms(self):
+        self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.record_call("first", 0.02), 1),
+            self.scheduler.schedule_async_call(self.record_call("second", 0.02), 1),
+        ))
+
+        lane = self.scheduler.lanes[DEFAULT_LANE]
+        self.assertEqual(2, lane.wait_time_histogram.count)
+        self.assertEqual(2, lane.run_time_histogram.count)
+        self.assertGreaterEqual(lane.run_time_histogram.mean, 0.02)
+        # The second call waited for the first one to finish
+        self.assertGreaterEqual(lane.wait_time_histogram.max, 0.02)
+        self.assertEqual(0, self.scheduler.running_calls)
+
+
+class CallTimeHistogramTests(unittest.TestCase):
+    def test_add_and_percentiles(self):
+        histogram = CallTimeHistogram(bucket_bounds=(0.1, 1.0))
+        for seconds in (0.05, 0.05, 0.5, 2.0):
+            histogram.add(seconds)
+
+        self.assertEqual([(0.1, 2), (1.0, 1), (float("inf"), 1)], histogram.buckets)
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(0.65, histogram.mean)
+        self.assertEqual(2.0, histogram.max)
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(1.0, histogram.percentile(75))
+        self.assertEqual(2.0, histogram.percentile(99))
+
+    def test_empty_histogram(self):
+        histogram = CallTimeHistogram()
+
+        self.assertEqual(0, histogram.mean)
+        self.assertEqual(0, histogram.percentile(50))
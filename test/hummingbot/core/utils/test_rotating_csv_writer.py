@@ -0,0 +1,110 @@
+import csv
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.core.utils.rotating_csv_writer import RotatingCsvWriter
+
+
+class RotatingCsvWriterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trades_test.csv")
+        self.header = ("id", "price", "amount")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _read_rows(self, file_path: str) -> List[List[str]]:
+        with open(file_path, newline="") as csv_file:
+            return list(csv.reader(csv_file))
+
+    def _csv_files(self) -> List[str]:
+        return sorted(file_name for file_name in os.listdir(self.temp_dir.name) if file_name.endswith(".csv"))
+
+    def test_rows_are_buffered_until_flush(self):
+        writer = RotatingCsvWriter(self.file_path, self.header, max_buffered_rows=10, flush_interval=60)
+
+        writer.append(("1", 100, 1))
+        writer.append(("2", 101, 2))
+
+        self.assertEqual(2, writer.buffered_rows)
+        self.assertFalse(os.path.exists(self.file_path))
+
+        writer.flush()
+
+        self.assertEqual(0, writer.buffered_rows)
+        self.assertEqual([list(self.header), ["1", "100", "1"], ["2", "101", "2"]], self._read_rows(self.file_path))
+        writer.close()
+
+    def test_buffer_is_written_when_full(self):
+        writer = RotatingCsvWriter(self.file_path, self.header, max_buffered_rows=2, flush_interval=60)
+
+        writer.append(("1", 100, 1))
+        writer.append(("2", 101, 2))
+
+        self.assertEqual(0, writer.buffered_rows)
+        self.assertEqual(3, len(self._read_rows(self.file_path)))
+        writer.close()
+
+    def test_existing_file_with_same_header_is_appended(self):
+        with open(self.file_path, "w", newline="") as csv_file:
+            csv.writer(csv_file).writerows([self.header, ("0", 99, 1)])
+
+        with patch.object(RotatingCsvWriter,
+                          "_file_matches_header",
+                          autospec=True,
+                          side_effect=RotatingCsvWriter._file_matches_header) as header_check:
+            writer = RotatingCsvWriter(self.file_path, self.header, max_buffered_rows=1)
+            writer.append(("1", 100, 1))
+            writer.append(("2", 100, 1))
+            writer.close()
+
+        # The header is only checked when the file is opened
+        self.assertEqual(1, header_check.call_count)
+        self.assertEqual(4, len(self._read_rows(self.file_path)))
+        self.assertEqual(["trades_test.csv"], self._csv_files())
+
+    def test_existing_file_with_different_header_is_moved(self):
+        with open(self.file_path, "w", newline="") as csv_file:
+            csv.writer(csv_file).writerows([("id", "price"), ("0", 99)])
+
+        writer = RotatingCsvWriter(self.file_path, self.header, max_buffered_rows=1)
+        writer.append(("1", 100, 1))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertTrue(files[1].startswith("trades_test_old_"))
+        self.assertEqual([list(self.header), ["1", "100", "1"]], self._read_rows(self.file_path))
+
+    def test_file_is_rotated_by_size(self):
+        writer = RotatingCsvWriter(self.file_path, self.header, max_buffered_rows=1, max_file_size=30)
+
+        writer.append(("1", 100, 1))
+        writer.append(("2", 101, 2))
+        writer.append(("3", 102, 3))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertEqual([list(self.header), ["3", "102", "3"]], self._read_rows(self.file_path))
+
+    def test_file_is_rotated_daily(self):
+        writer = RotatingCsvWriter(self.file_path, self.header, max_buffered_rows=1, rotate_daily=True)
+
+        with patch.object(RotatingCsvWriter, "_current_date", return_value="20220101"):
+            writer.append(("1", 100, 1))
+        with patch.object(RotatingCsvWriter, "_current_date", return_value="20220102"):
+            writer.append(("2", 101, 2))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertTrue(files[1].startswith("trades_test_20220101_"))
+        self.assertEqual([list(self.header), ["2", "101", "2"]], self._read_rows(self.file_path))
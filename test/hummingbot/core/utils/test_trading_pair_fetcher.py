@@ -1,4 +1,8 @@
 import asyncio
+import json
+import os
+import tempfile
+import time
 import unittest
 
 from mock import patch, MagicMock
@@ -54,6 +58,8 @@ class TestTradingPairFetcher(unittest.TestCase):
             return "MOCK-HBOT"
 
     class MockConnectorDataSourceModule(MagicMock):
+        TRADING_PAIRS_CATALOG_TTL = 60 * 60
+
         @property
         def MockconnectorAPIOrderBookDataSource(self):
             return TestTradingPairFetcher.MockConnectorDataSource()
@@ -67,18 +73,75 @@ class TestTradingPairFetcher(unittest.TestCase):
         instance = TradingPairFetcher.get_instance()
         self.assertIs(instance, TradingPairFetcher.get_instance())
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.catalog_path = os.path.join(self.temp_dir.name, "trading_pair_catalog.json")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
     @patch("hummingbot.core.utils.trading_pair_fetcher.importlib.import_module")
     @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
     def test_fetched_connector_trading_pairs(self, _, mock_connector_settings, mock_import_module, ):
         mock_connector_settings.return_value = {
-            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector"),
+            "mockConnector": self.MockConnectorSetting(name="mockConnector"),
             "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mockConnector")
         }
         mock_import_module.return_value = self.MockConnectorDataSourceModule()
 
-        trading_pair_fetcher = TradingPairFetcher()
+        trading_pair_fetcher = TradingPairFetcher(self.catalog_path)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        # The connectors are only contacted when their trading pairs are requested
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+        mock_import_module.assert_not_called()
+
+        self.assertEqual([], trading_pair_fetcher.get_trading_pairs("mock_paper_trade"))
+        self.async_run_with_timeout(trading_pair_fetcher.refresh("mock_paper_trade"))
+
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual(trading_pairs, {"mockConnector": "MOCK-HBOT", "mock_paper_trade": "MOCK-HBOT"})
+        self.assertEqual("MOCK-HBOT", trading_pair_fetcher.get_trading_pairs("mockConnector"))
+        self.assertEqual(1, mock_import_module.call_count)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.importlib.import_module")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    def test_trading_pairs_catalog_persisted(self, mock_connector_settings, mock_import_module):
+        mock_connector_settings.return_value = {"mockConnector": self.MockConnectorSetting(name="mockConnector")}
+        mock_import_module.return_value = self.MockConnectorDataSourceModule()
+
+        trading_pair_fetcher = TradingPairFetcher(self.catalog_path)
+        self.assertEqual("MOCK-HBOT", self.async_run_with_timeout(trading_pair_fetcher.fetch("mockConnector")))
+
+        with open(self.catalog_path) as catalog_file:
+            catalog = json.load(catalog_file)
+        self.assertEqual("MOCK-HBOT", catalog["mockConnector"]["trading_pairs"])
+        self.assertGreater(catalog["mockConnector"]["expiration_timestamp"],
+                           time.time() + 60 * 60 - 10)
+
+        mock_import_module.reset_mock()
+        trading_pair_fetcher = TradingPairFetcher(self.catalog_path)
+        self.assertEqual("MOCK-HBOT", trading_pair_fetcher.get_trading_pairs("mockConnector"))
+        self.assertFalse(trading_pair_fetcher.is_expired("mockConnector"))
+        mock_import_module.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.importlib.import_module")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    def test_expired_trading_pairs_used_while_fetched_again(self, mock_connector_settings, mock_import_module):
+        mock_connector_settings.return_value = {"mockConnector": self.MockConnectorSetting(name="mockConnector")}
+        mock_import_module.return_value = self.MockConnectorDataSourceModule()
+        with open(self.catalog_path, "w") as catalog_file:
+            json.dump({"mockConnector": {"trading_pairs": ["OLD-HBOT"], "expiration_timestamp": time.time() - 1}},
+                      catalog_file)
+
+        trading_pair_fetcher = TradingPairFetcher(self.catalog_path)
+        self.assertTrue(trading_pair_fetcher.is_expired("mockConnector"))
+        self.assertEqual(["OLD-HBOT"], trading_pair_fetcher.get_trading_pairs("mockConnector"))
+
+        self.async_run_with_timeout(trading_pair_fetcher.refresh("mockConnector"))
+
+        self.assertEqual("MOCK-HBOT", trading_pair_fetcher.get_trading_pairs("mockConnector"))
+        self.assertFalse(trading_pair_fetcher.is_expired("mockConnector"))
@@ -0,0 +1,108 @@
+import io
+import logging
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.logger.log_queue import LogQueue, QueueLogHandler
+
+
+class LogQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.stream = io.StringIO()
+        self.stream_handler = logging.StreamHandler(self.stream)
+        self.stream_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+        self.logger = logging.getLogger(f"{__name__}.{self._testMethodName}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def tearDown(self) -> None:
+        for handler in self.logger.handlers:
+            handler.close()
+        self.logger.handlers = []
+        super().tearDown()
+
+    def test_records_written_by_writer_thread(self):
+        log_queue = LogQueue(flush_interval=0.01)
+        self.logger.addHandler(QueueLogHandler(log_queue, [self.stream_handler]))
+        log_queue.start()
+
+        self.logger.info("Message %s", 1)
+        self.logger.error("Message 2")
+
+        deadline = time.time() + 1
+        while log_queue.written_records < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        log_queue.stop()
+
+        self.assertEqual("INFO - Message 1\nERROR - Message 2\n", self.stream.getvalue())
+        self.assertFalse(log_queue.started)
+
+    def test_records_below_handler_level_not_written(self):
+        log_queue = LogQueue()
+        self.stream_handler.setLevel(logging.WARNING)
+        queue_handler = QueueLogHandler(log_queue, [self.stream_handler])
+        self.logger.addHandler(queue_handler)
+
+        self.logger.info("Info message")
+        self.logger.warning("Warning message")
+
+        self.assertEqual(logging.WARNING, queue_handler.level)
+        self.assertEqual("WARNING - Warning message\n", self.stream.getvalue())
+
+    def test_records_dropped_when_queue_is_full(self):
+        log_queue = LogQueue(max_size=2)
+        self.logger.addHandler(QueueLogHandler(log_queue, [self.stream_handler]))
+        # The writer thread is not running, but the records are queued as if it was busy
+        log_queue._writer_thread = MagicMock()
+
+        for i in range(5):
+            self.logger.info(f"Message {i}")
+        self.logger.error("Error message")
+
+        self.assertEqual(2, log_queue.queue_size)
+        self.assertEqual(4, log_queue.dropped_records)
+        self.assertEqual({"INFO": 3, "ERROR": 1}, log_queue.dropped_records_by_level)
+
+        log_queue._writer_thread = None
+        log_queue.flush()
+
+        self.assertEqual("INFO - Message 0\n"
+                         "INFO - Message 1\n"
+                         "WARNING - The log queue was full, 4 log records have been dropped.\n",
+                         self.stream.getvalue())
+
+    def test_message_arguments_merged_when_enqueued(self):
+        log_queue = LogQueue()
+        log_queue._writer_thread = MagicMock()
+        self.logger.addHandler(QueueLogHandler(log_queue, [self.stream_handler]))
+        values = [1]
+
+        self.logger.info("Values %s", values)
+        values.append(2)
+        log_queue._writer_thread = None
+        log_queue.flush()
+
+        self.assertEqual("INFO - Values [1]\n", self.stream.getvalue())
+
+
+class CallerLookupTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        HummingbotLogger.set_caller_lookup_enabled(True)
+        super().tearDown()
+
+    def test_caller_lookup_skipped_when_disabled(self):
+        logger = HummingbotLogger("test")
+
+        self.assertNotEqual(0, logger.findCaller()[1])
+
+        HummingbotLogger.set_caller_lookup_enabled(False)
+
+        self.assertEqual(("(unknown file)", 0, "(unknown function)", None), logger.findCaller())
+        self.assertIsNotNone(logger.findCaller(stack_info=True)[3])
+
+    def test_format_uses_caller(self):
+        self.assertTrue(HummingbotLogger.format_uses_caller("%(asctime)s - %(funcName)s - %(message)s"))
+        self.assertFalse(HummingbotLogger.format_uses_caller("%(asctime)s - %(name)s - %(message)s"))
@@ -0,0 +1,103 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.SQLConnectionManager.get_db_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        # A file database is required because the writer thread uses its own connection
+        self.db_dir = tempfile.TemporaryDirectory()
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(self.db_dir.name, 'test.sqlite')}")
+        self.manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_name="test_DB")
+        self.queue = SQLWriteBehindQueue(self.manager, batch_interval=0.01)
+
+    def tearDown(self) -> None:
+        self.queue.stop()
+        self.manager.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def _add_market_state(market: str, timestamp: int):
+        def operation(session):
+            session.add(MarketState(config_file_path="test_config",
+                                    market=market,
+                                    timestamp=timestamp,
+                                    saved_state={}))
+        return operation
+
+    def _market_states(self):
+        with self.manager.get_new_session() as session:
+            return [(state.market, state.timestamp)
+                    for state in session.query(MarketState).order_by(MarketState.timestamp).all()]
+
+    def test_operations_are_written_in_order_by_writer_thread(self):
+        self.queue.start()
+
+        for i in range(10):
+            self.queue.put(self._add_market_state(f"market_{i}", i))
+
+        self.assertTrue(self.queue.wait_until_empty(timeout=5))
+        self.assertEqual([(f"market_{i}", i) for i in range(10)], self._market_states())
+        self.assertEqual(10, self.queue.flushed_operations)
+        self.assertEqual(0, self.queue.queue_depth)
+        self.assertGreater(self.queue.average_flush_latency, 0)
+
+    def test_keyed_operations_are_merged(self):
+        for i in range(5):
+            self.queue.put_keyed("state", self._add_market_state("merged", i))
+        self.queue.put(self._add_market_state("regular", 10))
+
+        self.assertEqual(2, self.queue.queue_depth)
+        self.queue.flush()
+
+        self.assertEqual([("merged", 4), ("regular", 10)], self._market_states())
+        self.assertEqual(1, self.queue.flush_count)
+
+    def test_failing_operation_does_not_discard_the_batch(self):
+        def failing_operation(session):
+            raise ValueError("Invalid record")
+
+        self.queue.put(self._add_market_state("market_1", 1))
+        self.queue.put(failing_operation)
+        self.queue.put(self._add_market_state("market_2", 2))
+
+        self.queue.flush()
+
+        self.assertEqual([("market_1", 1), ("market_2", 2)], self._market_states())
+        self.assertEqual(2, self.queue.flushed_operations)
+        self.assertEqual(1, self.queue.failed_operations)
+
+    def test_stop_writes_pending_operations(self):
+        self.queue.start()
+        self.queue.put(self._add_market_state("market_1", 1))
+
+        self.queue.stop()
+
+        self.assertFalse(self.queue.started)
+        self.assertEqual([("market_1", 1)], self._market_states())
+
+    def test_commit_callbacks_are_called_once_after_commit(self):
+        def failing_operation(session):
+            raise ValueError("Invalid record")
+
+        committed = []
+        self.queue.put(self._add_market_state("market_1", 1), lambda: committed.append("market_1"))
+        self.queue.put(failing_operation, lambda: committed.append("failing"))
+        self.queue.put(self._add_market_state("market_2", 2), lambda: committed.append("market_2"))
+
+        self.queue.flush()
+
+        # The batch failed and was retried operation by operation, the discarded operation has no callback call
+        self.assertEqual(["market_1", "market_2"], committed)
+        self.assertEqual([("market_1", 1), ("market_2", 2)], self._market_states())
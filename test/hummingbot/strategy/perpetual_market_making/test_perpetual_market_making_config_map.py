@@ -110,7 +110,7 @@ class TestPMMConfigMap(unittest.TestCase):
     def test_validate_derivative_trading_pair(self):
         fetcher_mock = MagicMock()
         type(fetcher_mock).ready = mock.PropertyMock(return_value=True)
-        type(fetcher_mock).trading_pairs = mock.PropertyMock(return_value={"test_market": ["BTC-USDT"]})
+        fetcher_mock.get_trading_pairs.side_effect = lambda market: {"test_market": ["BTC-USDT"]}.get(market, [])
         TradingPairFetcher._sf_shared_instance = fetcher_mock
 
         perpetual_mm_config_map.get("derivative").value = "test_market"
@@ -176,7 +176,7 @@ class TestPMMConfigMap(unittest.TestCase):
     def test_validate_price_source_market(self):
         fetcher_mock = MagicMock()
         type(fetcher_mock).ready = mock.PropertyMock(return_value=True)
-        type(fetcher_mock).trading_pairs = mock.PropertyMock(return_value={"test_market": ["BTC-USDT"]})
+        fetcher_mock.get_trading_pairs.side_effect = lambda market: {"test_market": ["BTC-USDT"]}.get(market, [])
         TradingPairFetcher._sf_shared_instance = fetcher_mock
 
         perpetual_mm_config_map.get("price_source_derivative").value = "test_market"
@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -45,12 +46,14 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         # first event creates DB record
         self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
         with self.trade_fill_sql.get_new_session() as session:
             count = session.query(InventoryCost).count()
             self.assertEqual(count, 1)
 
             # second event causes update to existing record
             self.delegate.process_order_fill_event(event)
+            self.delegate.flush()
             record = InventoryCost.get_record(
                 session, self.base_asset, self.quote_asset
             )
@@ -74,6 +77,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
                 )
                 session.add(record)
 
+        self.delegate.reload()
         amount_sell = Decimal("0.5")
         price_sell = Decimal("10000")
         event = OrderFilledEvent(
@@ -88,6 +92,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
 
         self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
         with self.trade_fill_sql.get_new_session() as session:
             record = InventoryCost.get_record(
                 session, self.base_asset, self.quote_asset
@@ -130,6 +135,9 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
                 )
                 session.add(record)
 
+        # Records added after the delegate was created are only visible after reloading
+        self.assertIsNone(self.delegate.get_price())
+        self.delegate.reload()
         delegate_price = self.delegate.get_price()
         self.assertEqual(delegate_price, price)
 
@@ -146,4 +154,79 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
                     quote_volume=amount,
                 )
                 session.add(record)
-                self.assertIsNone(self.delegate.get_price())
+        self.delegate.reload()
+        self.assertIsNone(self.delegate.get_price())
+
+    def test_get_price_uses_volumes_in_memory(self):
+        event = OrderFilledEvent(
+            timestamp=1,
+            order_id="order1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("9000"),
+            amount=Decimal("2"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0"), flat_fees=[]),
+        )
+        self.delegate.process_order_fill_event(event)
+
+        with patch.object(self.trade_fill_sql, "get_new_session", side_effect=AssertionError):
+            self.assertEqual(Decimal("9000"), self.delegate.get_price())
+        self.assertEqual(1, self.delegate.pending_writes)
+
+    def test_fills_persisted_in_one_batch_when_stopped(self):
+        buy_event = OrderFilledEvent(
+            timestamp=1,
+            order_id="order1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("3"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0"), flat_fees=[]),
+        )
+        sell_event = OrderFilledEvent(
+            timestamp=2,
+            order_id="order2",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("120"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0"), flat_fees=[]),
+        )
+        self.delegate.process_order_fill_event(buy_event)
+        self.delegate.process_order_fill_event(buy_event)
+        self.delegate.process_order_fill_event(sell_event)
+        self.assertEqual(3, self.delegate.pending_writes)
+
+        self.delegate.stop()
+
+        self.assertEqual(0, self.delegate.pending_writes)
+        with self.trade_fill_sql.get_new_session() as session:
+            record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+            self.assertEqual(Decimal("5"), record.base_volume)
+            self.assertEqual(Decimal("500"), record.quote_volume)
+
+        new_delegate = InventoryCostPriceDelegate(self.trade_fill_sql, self.trading_pair)
+        self.assertEqual(Decimal("100"), new_delegate.get_price())
+
+    def test_set_volumes_replaces_the_volumes_after_the_queued_fills(self):
+        event = OrderFilledEvent(
+            timestamp=1,
+            order_id="order1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("9000"),
+            amount=Decimal("2"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0"), flat_fees=[]),
+        )
+        self.delegate.process_order_fill_event(event)
+
+        self.delegate.set_volumes(Decimal("3"), Decimal("300"))
+
+        self.assertEqual(Decimal("100"), self.delegate.get_price())
+        self.delegate.reload()
+        self.assertEqual(Decimal("3"), self.delegate.base_volume)
+        self.assertEqual(Decimal("300"), self.delegate.quote_volume)
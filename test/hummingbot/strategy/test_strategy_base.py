@@ -286,6 +286,36 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.strategy.cancel_order(self.market_info, limit_order_id)
         self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
 
+    def test_batch_create_limit_orders(self):
+        base, quote = self.trading_pair.split("-")
+        orders = [
+            LimitOrder("", self.trading_pair, True, base, quote, Decimal("99"), Decimal("10")),
+            LimitOrder("", self.trading_pair, False, base, quote, Decimal("101"), Decimal("20")),
+        ]
+
+        order_ids = self.strategy.batch_create_limit_orders([(self.market_info, order) for order in orders])
+
+        self.assertEqual(2, len(order_ids))
+        for order, order_id in zip(orders, order_ids):
+            tracked_order: LimitOrder = self.strategy.order_tracker.get_limit_order(self.market_info, order_id)
+            self.assertEqual(order.is_buy, tracked_order.is_buy)
+            self.assertEqual(order.price, tracked_order.price)
+            self.assertEqual(order.quantity, tracked_order.quantity)
+
+    def test_batch_cancel_orders(self):
+        base, quote = self.trading_pair.split("-")
+        orders = [
+            LimitOrder("", self.trading_pair, True, base, quote, Decimal("99"), Decimal("10")),
+            LimitOrder("", self.trading_pair, False, base, quote, Decimal("101"), Decimal("20")),
+        ]
+        order_ids = self.strategy.batch_create_limit_orders([(self.market_info, order) for order in orders])
+
+        self.strategy.batch_cancel_orders([(self.market_info, order_id) for order_id in order_ids])
+
+        self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
+        for order_id in order_ids:
+            self.assertIsNone(self.strategy.order_tracker.get_limit_order(self.market_info, order_id))
+
     def test_start_tracking_limit_order(self):
         self.assertEqual(0, len(self.strategy.order_tracker.tracked_limit_orders))
 
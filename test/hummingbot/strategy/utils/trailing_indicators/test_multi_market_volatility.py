@@ -0,0 +1,48 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.multi_market_volatility import MultiMarketVolatilityIndicator
+
+
+class MultiMarketVolatilityTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.indicator = MultiMarketVolatilityIndicator(["ETH-USDT", "BTC-USDT"], sampling_length=2,
+                                                        processing_length=2)
+
+    def test_no_volatility_without_samples(self):
+        self.assertTrue(np.isnan(self.indicator.volatility).all())
+
+    def test_volatility_of_partial_interval(self):
+        self.indicator.add_samples([Decimal("100"), Decimal("10")])
+
+        self.assertEqual({"ETH-USDT": 0.0, "BTC-USDT": 0.0}, self.indicator.volatility_by_market())
+
+    def test_volatility_averages_last_intervals(self):
+        for eth_price, btc_price in [(100, 10), (110, 10), (100, 10), (105, 12), (90, 10)]:
+            self.indicator.add_samples([eth_price, btc_price])
+
+        # The last 4 samples (2 intervals) are kept: (110, 100) and (105, 90) for ETH, (10, 10) and (12, 10) for BTC
+        np.testing.assert_array_equal([110, 100, 105, 90], self.indicator.mid_prices("ETH-USDT"))
+        self.assertAlmostEqual((0.1 + 15 / 90) / 2, self.indicator.volatility[0])
+        self.assertAlmostEqual((0 + 0.2) / 2, self.indicator.volatility[1])
+
+    def test_samples_without_mid_price_ignored(self):
+        self.indicator.add_samples_by_market({"ETH-USDT": 100, "BTC-USDT": Decimal("NaN")})
+        self.indicator.add_samples_by_market({"ETH-USDT": Decimal("NaN"), "BTC-USDT": Decimal("NaN")})
+
+        self.assertEqual(0.0, self.indicator.volatility[0])
+        self.assertTrue(np.isnan(self.indicator.volatility[1]))
+
+    def test_matches_average_true_range_per_market(self):
+        indicator = MultiMarketVolatilityIndicator([str(i) for i in range(50)], sampling_length=30,
+                                                   processing_length=5)
+        np.random.seed(3141592653)
+        samples = 100 + np.random.normal(0, 1, (200, 50)).cumsum(axis=0)
+        for sample in samples:
+            indicator.add_samples(sample)
+
+        last_intervals = samples[-150:].T.reshape(50, 5, 30)
+        expected = ((last_intervals.max(axis=2) - last_intervals.min(axis=2)) / last_intervals.min(axis=2)).mean(axis=1)
+        np.testing.assert_allclose(expected, indicator.volatility)
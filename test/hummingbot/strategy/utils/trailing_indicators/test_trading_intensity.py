@@ -83,3 +83,39 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(self.indicator.current_value[0], 1.0006118838992204, 4)
         self.assertAlmostEqual(self.indicator.current_value[1], 0.00016076949224819458, 4)
+
+    def test_add_sample_arrays_matches_data_frame_samples(self):
+        N_SAMPLES = 300
+
+        data_frame_indicator = TradingIntensityIndicator(self.BUFFER_LENGTH)
+        arrays_indicator = TradingIntensityIndicator(self.BUFFER_LENGTH)
+
+        bids_df, asks_df = TradingIntensityTest.make_order_books(100, Decimal("10"), Decimal("1"), Decimal("0.05"),
+                                                                 Decimal("0.1"), Decimal("0.01"), N_SAMPLES)
+
+        for bid_df, ask_df in zip(bids_df, asks_df):
+            data_frame_indicator.add_sample((bid_df, ask_df))
+            arrays_indicator.add_sample_arrays(bid_df[["price", "amount"]].to_numpy(),
+                                               ask_df[["price", "amount"]].to_numpy())
+
+        self.assertTrue(arrays_indicator.is_sampling_buffer_full)
+        self.assertEqual(data_frame_indicator.current_value, arrays_indicator.current_value)
+
+    def test_intensity_is_refitted_on_refit_interval(self):
+        N_SAMPLES = self.BUFFER_LENGTH + 10
+
+        bids_df, asks_df = TradingIntensityTest.make_order_books(100, Decimal("10"), Decimal("1"), Decimal("0.05"),
+                                                                 Decimal("0.1"), Decimal("0.01"), N_SAMPLES)
+
+        indicator = TradingIntensityIndicator(self.BUFFER_LENGTH, refit_interval=N_SAMPLES * 2)
+        for bid_df, ask_df in zip(bids_df, asks_df):
+            indicator.add_sample((bid_df, ask_df))
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual((0, 0), indicator.current_value)
+
+        indicator = TradingIntensityIndicator(self.BUFFER_LENGTH, refit_interval=self.BUFFER_LENGTH)
+        for bid_df, ask_df in zip(bids_df, asks_df):
+            indicator.add_sample((bid_df, ask_df))
+
+        self.assertNotEqual((0, 0), indicator.current_value)